@@ -0,0 +1,78 @@
+"""
+EventBus の配信コストのベンチマーク
+
+登録数を増やしながら、1件の購読者しかいないイベントの emit_event にかかる時間を計測する
+- attach: 全オブザーバーが全イベントを受信して内部で絞り込む（従来の方式）
+- subscribe: イベント名で登録し、索引で配信先だけを呼び出す
+
+使い方:
+    python benchmarks/event_bus.py --observers 1 10 100 1000 --events 20000
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.observer import EventBus, Observer  # noqa: E402
+
+
+class FilteringObserver(Observer):
+    """担当するイベント以外は無視するオブザーバー"""
+
+    def __init__(self, event_type: str):
+        self.event_type = event_type
+        self.handled = 0
+
+    async def update(self, event_type: str, data: Dict[str, Any]) -> None:
+        if event_type == self.event_type:
+            self.handled += 1
+
+
+async def _emit_cost(bus: EventBus, events: int, repeat: int) -> float:
+    """1回あたりの emit_event の所要時間（マイクロ秒、中央値）"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(events):
+            await bus.emit_event("event_0", {"value": 1})
+        timings.append((time.perf_counter() - start) / events * 1_000_000)
+    return statistics.median(timings)
+
+
+async def measure(observer_counts, events: int, repeat: int) -> None:
+    print(f"{'observers':>10}{'attach us':>12}{'subscribe us':>14}{'speedup':>10}")
+    for count in observer_counts:
+        broadcast = EventBus(max_history_size=100)
+        for i in range(count):
+            broadcast.attach(FilteringObserver(f"event_{i}"))
+
+        indexed = EventBus(max_history_size=100)
+        for i in range(count):
+            observer = FilteringObserver(f"event_{i}")
+            indexed.subscribe(observer.event_type, observer)
+
+        attach_cost = await _emit_cost(broadcast, events, repeat)
+        subscribe_cost = await _emit_cost(indexed, events, repeat)
+        print(f"{count:>10}{attach_cost:>12.2f}{subscribe_cost:>14.2f}{attach_cost / subscribe_cost:>9.1f}x")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="EventBus dispatch benchmark")
+    parser.add_argument("--observers", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # 計測対象は配信コストのみ（ログ出力は除外）
+    logging.disable(logging.CRITICAL)
+    await measure(args.observers, args.events, args.repeat)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+"""
+イベントログ出力のマイクロベンチマーク
+
+EventBus + LoggingObserver の emit_event スループットを、従来の実装（毎回f-stringで整形）と比較する
+- before: emit時にDEBUG行を必ず整形し、LoggingObserver が全イベントを整形して出力
+- after: レベル判定後に遅延フォーマットし、バースト時はイベントタイプごとに間引き
+
+使い方:
+    python benchmarks/event_logging.py --events 50000
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.observer import EventBus, LoggingObserver, Observer  # noqa: E402
+
+
+PAYLOAD = {
+    "guild_id": 123456789012345678,
+    "user_id": 987654321098765432,
+    "track": {"title": "Some Song (Official Video)", "artist": "Some Artist", "duration": 215},
+    "queue": [f"track-{i}" for i in range(20)],
+}
+
+
+class LegacyEventBus(EventBus):
+    """変更前の emit_event（DEBUG無効でもペイロードを文字列化）"""
+
+    async def emit_event(self, event_type: str, data: Dict[str, Any]) -> None:
+        self._total_events_count += 1
+        event_data = {
+            "type": event_type,
+            "data": data,
+            "timestamp": datetime.now(),
+            "id": self._total_events_count
+        }
+        self._event_history.append(event_data)
+        await self.notify(event_type, event_data)
+
+        if self._total_events_count % 100 == 0:
+            self.logger.info(f"Event {event_type} emitted. Total events: {self._total_events_count}, "
+                             f"History size: {len(self._event_history)}/{self._max_history_size}")
+        else:
+            self.logger.debug(f"Event {event_type} emitted with data: {data}")
+
+
+class LegacyLoggingObserver(Observer):
+    """変更前の LoggingObserver（全イベントを整形して出力）"""
+
+    def __init__(self):
+        self.logger = logging.getLogger("EventLogger")
+
+    async def update(self, event_type: str, data: Dict[str, Any]) -> None:
+        timestamp = data.get("timestamp", datetime.now())
+        event_data = data.get("data", {})
+        self.logger.info(f"[{timestamp}] Event: {event_type} | Data: {event_data}")
+
+
+async def _throughput(bus: EventBus, events: int, repeat: int) -> float:
+    """1秒あたりの emit_event 件数（中央値）"""
+    rates = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(events):
+            await bus.emit_event("track_added", PAYLOAD)
+        rates.append(events / (time.perf_counter() - start))
+    return statistics.median(rates)
+
+
+async def measure(events: int, repeat: int) -> None:
+    print(f"{'root level':<12}{'before ev/s':>14}{'after ev/s':>14}{'speedup':>10}")
+    for level in ("INFO", "WARNING"):
+        logging.getLogger().setLevel(level)
+
+        before = LegacyEventBus(max_history_size=100)
+        before.attach(LegacyLoggingObserver())
+        after = EventBus(max_history_size=100)
+        after.attach(LoggingObserver())
+
+        before_rate = await _throughput(before, events, repeat)
+        after_rate = await _throughput(after, events, repeat)
+        print(f"{level:<12}{before_rate:>14,.0f}{after_rate:>14,.0f}{after_rate / before_rate:>9.1f}x")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Event logging micro-benchmark")
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # 実際の出力先と同様にフォーマット・書き込みまで行う（出力は破棄）
+    handler = logging.StreamHandler(open(os.devnull, "w", encoding="utf-8"))
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+    logging.getLogger().addHandler(handler)
+
+    await measure(args.events, args.repeat)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
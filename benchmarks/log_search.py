@@ -0,0 +1,131 @@
+"""
+ログ全文検索のベンチマーク
+
+合成ログを大量に投入し、DatabaseManager.search_logs のレイテンシを計測する
+
+使い方:
+    python benchmarks/log_search.py --rows 2000000 --guilds 50
+"""
+import argparse
+import asyncio
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.manager import DatabaseManager  # noqa: E402
+from database.models import LogType  # noqa: E402
+
+
+WORDS = [
+    "hello", "world", "discord", "ticket", "music", "queue", "spotify", "youtube",
+    "moderator", "announcement", "welcome", "rules", "giveaway", "event", "support",
+    "こんにちは", "ありがとう", "よろしく", "お知らせ", "イベント", "募集", "質問", "参加",
+]
+ACTIONS = {
+    LogType.MESSAGE_DELETE: "Message Deleted",
+    LogType.MESSAGE_EDIT: "Message Edited",
+    LogType.MEMBER_JOIN: "Member Joined",
+    LogType.CHANNEL_UPDATE: "Channel Updated",
+}
+QUERIES = ["discord", "お知らせ", "giveaway event", "Before: hello", "rare-token-xyz", "ok"]
+
+
+def _details(rng: random.Random, log_type: LogType) -> str:
+    text = " ".join(rng.choices(WORDS, k=rng.randint(3, 12)))
+    if log_type == LogType.MESSAGE_EDIT:
+        return f"Before: {text} | After: {' '.join(rng.choices(WORDS, k=4))}"
+    if rng.random() < 0.0001:
+        text += " rare-token-xyz"
+    return text
+
+
+def populate(path: Path, rows: int, guilds: int, seed: int) -> float:
+    """合成ログを投入（トリガー経由でFTS索引も更新される）"""
+    rng = random.Random(seed)
+    types = list(ACTIONS)
+    started = datetime.now() - timedelta(days=30)
+    start = time.perf_counter()
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = OFF")
+    batch = []
+    for i in range(rows):
+        log_type = rng.choice(types)
+        batch.append((
+            rng.randint(1, guilds), log_type.name, rng.randint(1, 10_000), None,
+            rng.randint(1, 500), ACTIONS[log_type], _details(rng, log_type),
+            (started + timedelta(seconds=i)).isoformat(" ")
+        ))
+        if len(batch) >= 50_000:
+            conn.executemany(
+                "INSERT INTO log (guild_id, log_type, user_id, moderator_id, channel_id, action, details, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch
+            )
+            conn.commit()
+            batch.clear()
+    if batch:
+        conn.executemany(
+            "INSERT INTO log (guild_id, log_type, user_id, moderator_id, channel_id, action, details, timestamp) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch
+        )
+        conn.commit()
+    conn.close()
+    return time.perf_counter() - start
+
+
+async def measure(db: DatabaseManager, guilds: int, repeat: int) -> None:
+    print(f"{'query':<20}{'page':>6}{'hits':>6}{'p50 ms':>10}{'p95 ms':>10}")
+    for query in QUERIES:
+        for page in (1, 2):
+            timings = []
+            hits = 0
+            for i in range(repeat):
+                guild_id = i % guilds + 1
+                cursor = None
+                if page == 2:
+                    _, cursor = await db.search_logs(guild_id, query)
+                    if cursor is None:
+                        continue
+                start = time.perf_counter()
+                logs, _ = await db.search_logs(guild_id, query, cursor=cursor)
+                timings.append((time.perf_counter() - start) * 1000)
+                hits += len(logs)
+            if not timings:
+                continue
+            p95 = statistics.quantiles(timings, n=20)[-1] if len(timings) > 1 else timings[0]
+            print(f"{query:<20}{page:>6}{hits // len(timings):>6}{statistics.median(timings):>10.2f}{p95:>10.2f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Log search benchmark")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--guilds", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database", type=Path, default=None, help="既存の計測用DBを再利用")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.database or Path(tmp) / "bench.db"
+        fresh = not path.exists()
+
+        db = DatabaseManager(str(path))
+        await db.initialize()
+        if fresh:
+            elapsed = populate(path, args.rows, args.guilds, args.seed)
+            print(f"Inserted {args.rows:,} rows in {elapsed:.1f}s ({args.rows / elapsed:,.0f} rows/s, FTS triggers included)")
+
+        await measure(db, args.guilds, args.repeat)
+        await db.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,185 @@
+"""
+起動時間のベンチマーク
+
+1. モジュールごとの読み込み時間: 新しいプロセスで `python -X importtime -c "import <module>"` を実行し、
+   そのモジュールの累積読み込み時間と、内訳の重い依存を表示
+2. 起動完了までの時間: 新しいプロセスで bot.main() と同じ手順（設定読み込み → DIワイヤリング →
+   LunaBot初期化 → リソース初期化 → setup_hook）を実行し、各段階の経過時間を表示
+   （Discordへの接続は行わないため、スラッシュコマンドの同期は失敗として記録される）
+
+機能の有効/無効による差を見るため、全機能有効と音楽・翻訳無効の2通りで計測する
+
+使い方:
+    python benchmarks/startup.py --config config.toml.example --repeat 3
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = [
+    "core.container",
+    "bot",
+    "common",
+    "music.youtube_extractor",
+    "music.spotify_extractor",
+    "translation",
+    "cogs.ping",
+    "cogs.avatar",
+    "cogs.music",
+    "cogs.translation",
+]
+
+# 計測用の子プロセス（bot.main() の起動手順を Discord 接続なしで再現）
+READY_SCRIPT = """
+import time
+start = time.perf_counter()
+import asyncio, json, logging, sys
+sys.path.insert(0, {root!r})
+import bot as luna
+from core import container
+imported = time.perf_counter()
+
+async def run():
+    config = container.config()
+    config.config.setdefault("features", {{}}).update({features!r})
+    container.wire(modules=[luna.__name__, *luna.enabled_cog_modules(config)])
+    bot = luna.LunaBot(
+        config=config,
+        database=container.database_manager_raw(),
+        event_bus=container.wired_event_bus(),
+        cog_factory=container.cog_factory()
+    )
+    logging.disable(logging.CRITICAL)
+    constructed = time.perf_counter()
+    await container.init_resources()
+    await bot._async_setup_hook()
+    await bot.setup_hook()
+    ready = time.perf_counter()
+    heavy = sorted(name for name in ("yt_dlp", "spotipy", "deepl", "PIL.Image") if name in sys.modules)
+    print("READY " + json.dumps({{
+        "import": imported - start,
+        "init": constructed - imported,
+        "setup": ready - constructed,
+        "total": ready - start,
+        "cogs": len(bot.cogs),
+        "heavy_modules": heavy
+    }}))
+    await container.shutdown_resources()
+    await bot.close()
+
+asyncio.run(run())
+"""
+
+SCENARIOS = {
+    "all features": {"music": True, "translation": True},
+    "music/translation off": {"music": False, "translation": False},
+}
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """-X importtime の出力を (モジュール, 深さ, 累積µs) のリストに変換"""
+    rows = []
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)", line)
+        if match:
+            rows.append((match.group(3), len(match.group(2)), int(match.group(1))))
+    return rows
+
+
+def _subtree(rows: List[Tuple[str, int, int]], module: str) -> Tuple[int, List[Tuple[str, int, int]]]:
+    """対象モジュールの累積時間と、その読み込み中に読み込まれた依存（インタープリター起動分を除く）"""
+    for index in range(len(rows) - 1, -1, -1):
+        name, depth, total = rows[index]
+        if name == module and depth == 0:
+            start = index
+            while start > 0 and rows[start - 1][1] > 0:
+                start -= 1
+            return total, rows[start:index]
+    raise ValueError(f"{module} not found in importtime output")
+
+
+def measure_import(module: str, repeat: int) -> Tuple[float, List[Tuple[str, int]]]:
+    """モジュールの累積読み込み時間（ms、中央値）と、内訳の上位の依存"""
+    timings = []
+    dependencies: List[Tuple[str, int, int]] = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=ROOT, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"import {module} failed:\n{result.stderr[-500:]}")
+        cumulative, dependencies = _subtree(_parse_importtime(result.stderr), module)
+        timings.append(cumulative / 1000)
+
+    # トップレベルパッケージ単位で累積の大きいものを表示
+    packages: Dict[str, int] = {}
+    for name, _, total in dependencies:
+        top = name.split(".")[0]
+        if top != module.split(".")[0]:
+            packages[top] = max(packages.get(top, 0), total)
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:4]
+    return statistics.median(timings), heaviest
+
+
+def measure_ready(config_path: Path, features: Dict[str, bool], repeat: int) -> Dict[str, float]:
+    """起動完了までの各段階の時間（秒、中央値）"""
+    samples = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as workdir:
+            shutil.copy(config_path, Path(workdir) / "config.toml")
+            script = READY_SCRIPT.format(root=str(ROOT), features=features)
+            started = time.perf_counter()
+            result = subprocess.run([sys.executable, "-c", script], cwd=workdir, capture_output=True, text=True,
+                                    env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"})
+            wall = time.perf_counter() - started
+            line = next((line for line in result.stdout.splitlines() if line.startswith("READY ")), None)
+            if line is None:
+                raise RuntimeError(f"Startup failed:\n{result.stderr[-1000:]}")
+            sample = json.loads(line[len("READY "):])
+            sample["process"] = wall
+            samples.append(sample)
+
+    summary = {key: statistics.median(sample[key] for sample in samples)
+               for key in ("import", "init", "setup", "total", "process")}
+    summary["cogs"] = samples[-1]["cogs"]
+    summary["heavy_modules"] = samples[-1]["heavy_modules"]
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Startup time benchmark")
+    parser.add_argument("--config", type=Path, default=ROOT / "config.toml.example")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    args = parser.parse_args()
+
+    print(f"{'module':<26}{'import ms':>11}  heaviest dependencies (cumulative ms)")
+    for module in args.modules:
+        cumulative, heaviest = measure_import(module, args.repeat)
+        deps = ", ".join(f"{name} {total / 1000:.0f}" for name, total in heaviest)
+        print(f"{module:<26}{cumulative:>11.1f}  {deps}")
+
+    print()
+    print(f"{'scenario':<24}{'import':>9}{'init':>9}{'setup':>9}{'ready':>9}{'process':>9}{'cogs':>6}  heavy modules loaded")
+    for name, features in SCENARIOS.items():
+        result = measure_ready(args.config.resolve(), features, args.repeat)
+        heavy = ", ".join(result["heavy_modules"]) or "-"
+        print(f"{name:<24}{result['import']:>8.2f}s{result['init']:>8.2f}s{result['setup']:>8.2f}s"
+              f"{result['total']:>8.2f}s{result['process']:>8.2f}s{result['cogs']:>6}  {heavy}")
+
+
+if __name__ == "__main__":
+    main()
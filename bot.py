@@ -2,14 +2,37 @@ import discord
 from discord.ext import commands
 import logging
 import asyncio
-from pathlib import Path
-import sys
-from typing import Union
+from typing import Optional, Union
 
 from core import container, inject_dependencies, ConfigDep, DatabaseDep, EventBusDep, CogFactoryDep
+from core.metrics import MetricsServer
+from core.instrumentation import HandlerProfiler
+from core.loop_monitor import LoopMonitor
+from core.log_handlers import setup_queue_logging, stop_queue_logging
 from dependency_injector.wiring import inject, Provide
 
 
+COG_MODULES: list[str] = [
+    "cogs.ping",
+    "cogs.tickets",
+    "cogs.logging",
+    "cogs.avatar",
+    "cogs.music",
+    "cogs.translation"
+]
+
+
+def enabled_cog_modules(settings) -> list[str]:
+    """機能設定で無効化されたCogを除くモジュール一覧（無効な機能の重い依存は読み込まない）"""
+    features = {
+        "cogs.tickets": settings.features_tickets,
+        "cogs.logging": settings.features_logger,
+        "cogs.music": settings.features_music,
+        "cogs.translation": settings.features_translation
+    }
+    return [module for module in COG_MODULES if features.get(module, True)]
+
+
 class LunaBot(commands.Bot):
     @inject
     def __init__(
@@ -38,6 +61,11 @@ class LunaBot(commands.Bot):
         )
 
         self.logger = logging.getLogger(__name__)
+        self.metrics_server: Optional[MetricsServer] = None
+        self.profiler: Optional[HandlerProfiler] = (
+            container.handler_profiler() if self.settings.metrics_handler_timing else None
+        )
+        self.loop_monitor: Optional[LoopMonitor] = None
 
     def _create_activity(self) -> Union[discord.Activity, discord.Game, discord.Streaming]:
         """設定に基づいてDiscordアクティビティを作成"""
@@ -75,28 +103,49 @@ class LunaBot(commands.Bot):
         try:
             log_file = self.settings.logging_file
             log_level = self.settings.logging_level
+            max_size = self.settings.logging_max_size
+            backup_count = self.settings.logging_backup_count
+            compress = self.settings.logging_compress
+            module_levels = self.settings.logging_module_levels
         except AttributeError:
             # フォールバック設定
             log_file = "luna.log"
             log_level = "INFO"
+            max_size = 10485760
+            backup_count = 5
+            compress = False
+            module_levels = {}
             print("Warning: Using fallback logging configuration")
 
-        log_file_path = Path(log_file)
-        log_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        logging.basicConfig(
-            level=getattr(logging, log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file_path, encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ]
+        # ファイル・標準出力への書き込みはリスナースレッドで行い、イベントループをブロックしない
+        self.log_listener = setup_queue_logging(
+            log_file,
+            level=log_level,
+            max_bytes=max_size,
+            backup_count=backup_count,
+            compress=compress,
+            module_levels=module_levels
         )
 
     async def setup_hook(self) -> None:
         self.logger.info("Setting up Luna Bot...")
+
+        # Cog読み込み中のブロッキングも検出できるよう最初に開始
+        if self.settings.metrics_loop_monitor:
+            self.loop_monitor = container.loop_monitor()
+            self.loop_monitor.start()
+
         await self._load_cogs()
 
+        # メトリクスのHTTPエンドポイント（ループバックのみ）
+        if self.settings.metrics_enabled:
+            try:
+                self.metrics_server = MetricsServer(container.metrics_observer(), port=self.settings.metrics_port)
+                await self.metrics_server.start()
+            except Exception as e:
+                self.logger.error(f"Failed to start metrics endpoint: {e}")
+                self.metrics_server = None
+
         # スラッシュコマンドをDiscordに同期
         try:
             self.logger.info("Syncing slash commands...")
@@ -108,38 +157,24 @@ class LunaBot(commands.Bot):
         self.logger.info("Luna Bot setup completed")
 
     async def _load_cogs(self) -> None:
-        cog_files: list[str] = [
-            "cogs.ping",
-            "cogs.tickets",
-            "cogs.logging",
-            "cogs.avatar",
-            "cogs.music",
-            "cogs.translation"
-        ]
-
-        for cog_file in cog_files:
-            try:
-                if cog_file.endswith("tickets") and not self.settings.features_tickets:
-                    self.logger.info(f"Skipping {cog_file} (feature disabled)")
-                    continue
-
-                if cog_file.endswith("logging") and not self.settings.features_logger:
-                    self.logger.info(f"Skipping {cog_file} (feature disabled)")
-                    continue
-
-                if cog_file.endswith("music") and not getattr(self.settings, 'features_music', True):
-                    self.logger.info(f"Skipping {cog_file} (feature disabled)")
-                    continue
-
-                if cog_file.endswith("translation") and not self.settings.features_translation:
-                    self.logger.info(f"Skipping {cog_file} (feature disabled)")
-                    continue
+        enabled = enabled_cog_modules(self.settings)
+        for cog_file in COG_MODULES:
+            if cog_file not in enabled:
+                self.logger.info(f"Skipping {cog_file} (feature disabled)")
+                continue
 
+            try:
                 await self.load_extension(cog_file)
                 self.logger.info(f"Loaded cog: {cog_file}")
             except Exception as e:
                 self.logger.error(f"Failed to load cog {cog_file}: {e}")
 
+    async def add_cog(self, cog: commands.Cog, /, **kwargs) -> None:
+        # 登録前にコマンド・リスナーを計測用ラッパーに差し替える
+        if self.profiler:
+            self.profiler.instrument_cog(cog)
+        await super().add_cog(cog, **kwargs)
+
     async def on_ready(self) -> None:
         self.logger.info(f"{self.user} has connected to Discord!")
         self.logger.info(f"Bot is in {len(self.guilds)} guilds")
@@ -196,17 +231,25 @@ class LunaBot(commands.Bot):
     async def close(self) -> None:
         self.logger.info("Shutting down Luna Bot...")
         await self.event_bus.emit_event("bot_shutdown", {})
+        await self.event_bus.shutdown()
+        if self.metrics_server:
+            await self.metrics_server.stop()
+        if self.loop_monitor:
+            await self.loop_monitor.stop()
         await super().close()
+        # キューに残ったログを書き出す（atexit はループ終了後かつ強制終了時には実行されない）
+        stop_queue_logging(self.log_listener)
 
 
 async def main():
-    # DIコンテナをワイヤリング
-    container.wire(modules=[__name__, "cogs.ping", "cogs.tickets", "cogs.logging", "cogs.avatar", "cogs.music", "cogs.translation"])
-
     bot = None
     try:
         # 設定を直接取得してボット初期化
         config = container.config()
+
+        # DIコンテナをワイヤリング（ワイヤリングはモジュールを読み込むため、有効なCogのみ）
+        container.wire(modules=[__name__, *enabled_cog_modules(config)])
+
         database_manager = container.database_manager_raw()
         event_bus = container.wired_event_bus()
         cog_factory = container.cog_factory()
@@ -1,38 +1,253 @@
 import discord
+from discord import app_commands
 from discord.ext import commands
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
+import asyncio
+import io
 import logging
+from collections import Counter, OrderedDict
 from datetime import datetime
 
 from database.models import LogType
-from common import EmbedBuilder, LogUtils, UIEmojis, UIColors, UserFormatter
+from common import EmbedBuilder, LogUtils, UserFormatter, ButtonStyles, UIColors
+from logger import (LogEmbedRenderer, LogOutbox, LogRecord, LogRouter, WebhookDelivery, LOG_TITLES,
+                    MessageContentStore, StoredMessage, change_entry, describe_log, encode_payload,
+                    permission_changes)
+
+
+class LogSearchView(discord.ui.View):
+    """ログ検索結果のページ送りUI - 末尾IDをカーソルにして次ページを取得"""
+
+    RESULTS_PER_PAGE = 10
+
+    def __init__(self, bot, user_id: int, guild_id: int, query: Optional[str], filters: dict):
+        super().__init__(timeout=180)
+        self.bot = bot
+        self.user_id = user_id
+        self.guild_id = guild_id
+        self.query = query
+        self.filters = filters
+        # 各ページの開始カーソル（先頭ページはNone）
+        self.cursors: List[Optional[int]] = [None]
+        self.next_cursor: Optional[int] = None
+
+    @property
+    def page(self) -> int:
+        return len(self.cursors)
+
+    async def build_page(self) -> discord.Embed:
+        """現在のカーソル位置の検索結果Embedを作成"""
+        logs, self.next_cursor = await self.bot.database.search_logs(
+            self.guild_id, self.query, cursor=self.cursors[-1],
+            limit=self.RESULTS_PER_PAGE, **self.filters
+        )
+        self.previous_page.disabled = self.page <= 1
+        self.next_page.disabled = self.next_cursor is None
+
+        embed = EmbedBuilder.create_base_embed(
+            title=f"🔍 ログ検索: {self.query[:100]}" if self.query else "🔍 ログ検索",
+            color=UIColors.INFO
+        )
+        if not logs:
+            embed.description = "該当するログが見つかりませんでした"
+
+        for log in logs:
+            title = LOG_TITLES.get(log.log_type, log.action)
+            details = (describe_log(log.log_type, log.payload, log.details) or "-").replace("`", "'")
+            if len(details) > 200:
+                details = details[:197] + "..."
+
+            lines = [UserFormatter.format_timestamp(log.timestamp, "f")]
+            if log.user_id:
+                lines.append(f"ユーザー: <@{log.user_id}>")
+            if log.moderator_id:
+                lines.append(f"実行者: <@{log.moderator_id}>")
+            if log.channel_id:
+                lines.append(f"チャンネル: <#{log.channel_id}>")
+            lines.append(f"```{details}```")
+
+            embed.add_field(
+                name=f"{LogUtils.get_log_emoji(log.log_type)} {title} (#{log.id})",
+                value="\n".join(lines),
+                inline=False
+            )
+
+        embed.set_footer(text=f"ページ {self.page}")
+        return embed
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("❌ このページ送りはコマンド実行者のみ操作できます", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(emoji="◀️", style=ButtonStyles.SECONDARY)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+        await self._show_page(interaction)
+
+    @discord.ui.button(emoji="▶️", style=ButtonStyles.SECONDARY)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if self.next_cursor is not None:
+            self.cursors.append(self.next_cursor)
+        await self._show_page(interaction)
+
+    async def _show_page(self, interaction: discord.Interaction):
+        try:
+            embed = await self.build_page()
+            await interaction.response.edit_message(embed=embed, view=self)
+        except Exception as e:
+            self.bot.logger.error(f"Log search page error: {e}")
+            await interaction.response.send_message("❌ ログの検索に失敗しました", ephemeral=True)
 
 
 class LoggingCog(commands.Cog):
+    # 一括削除で処理済みのメッセージIDを保持する件数（個別削除イベントの重複抑制用）
+    BULK_DELETED_MEMORY = 5000
+
     def __init__(self, bot):
         self.bot = bot
         self.logger = logging.getLogger(__name__)
-        self.log_channels = {}
+        self.routes = LogRouter(bot.database)
+        self.outbox = LogOutbox(
+            sender=self._deliver_embeds,
+            renderer=LogEmbedRenderer.render,
+            flush_interval=bot.settings.logger_batch_window,
+            max_pending=bot.settings.logger_batch_max_pending,
+            max_concurrency=bot.settings.logger_fanout_concurrency
+        )
+        self.webhooks: Optional[WebhookDelivery] = None
+        if bot.settings.logger_delivery == "webhook":
+            self.webhooks = WebhookDelivery(bot.database, pool_size=bot.settings.logger_fanout_concurrency)
+        self.archive_task: Optional[asyncio.Task] = None
+        self.messages = MessageContentStore(
+            max_per_guild=bot.settings.logger_message_store_size,
+            database=bot.database if bot.settings.logger_message_store_spill else None,
+            retention_days=bot.settings.logger_message_store_retention_days
+        )
+        self._bulk_deleted: "OrderedDict[int, None]" = OrderedDict()
+
+    async def cog_load(self):
+        """古いログの定期アーカイブを開始（設定で有効な場合のみ）"""
+        if self.bot.settings.logger_archive_after_days > 0:
+            self.archive_task = asyncio.create_task(self._archive_loop())
+
+    async def cog_unload(self):
+        """Cog終了時に送信待ちのログを送り切る"""
+        if self.archive_task:
+            self.archive_task.cancel()
+        await self.messages.shutdown()
+        await self.outbox.shutdown()
+        if self.webhooks:
+            await self.webhooks.close()
+
+    async def _archive_loop(self) -> None:
+        """一定間隔で古いログをアーカイブへ移動"""
+        settings = self.bot.settings
+        try:
+            while True:
+                try:
+                    await self.bot.database.archive_old_logs(
+                        settings.logger_archive_after_days,
+                        chunk_size=settings.logger_archive_chunk_size
+                    )
+                except Exception as e:
+                    self.logger.error(f"Log archiving failed: {e}")
+                await asyncio.sleep(settings.logger_archive_interval)
+        except asyncio.CancelledError:
+            self.logger.debug("Log archive task cancelled")
 
     # 共通関数を使用するため、これらのメソッドは削除
 
-    async def send_log(self, guild_id: int, embed: discord.Embed) -> None:
-        if guild_id not in self.log_channels:
-            settings = await self.bot.database.get_guild_settings(guild_id)
-            if settings and settings.log_channel_id:
-                self.log_channels[guild_id] = settings.log_channel_id
+    async def dispatch_log(self, record: LogRecord) -> None:
+        """
+        ログレコードを記録し、送信先があれば送信バッファに追加
 
-        if guild_id in self.log_channels:
-            channel_id = self.log_channels[guild_id]
-            channel = self.bot.get_channel(channel_id)
-            if channel:
-                try:
-                    await channel.send(embed=embed)
-                except discord.Forbidden:
-                    self.logger.warning(f"No permission to send logs to channel {channel_id}")
-                except discord.NotFound:
-                    self.logger.warning(f"Log channel {channel_id} not found, removing from cache")
-                    del self.log_channels[guild_id]
+        Embedへの変換は送信直前に行うため、送信先のないギルドでは描画処理を行わない
+        """
+        await self.bot.database.create_log(**record.to_log_kwargs())
+
+        channel_id = await self.routes.resolve(record.guild_id)
+        if channel_id:
+            self.outbox.enqueue(channel_id, record)
+
+    async def _deliver_embeds(self, channel_id: int, embeds: list,
+                              attachments: Optional[List[Tuple[str, bytes]]] = None) -> None:
+        """まとめたEmbedを1メッセージで送信（429時はRetry-After後に1回だけ再送）"""
+        channel = self.bot.get_channel(channel_id)
+        if not channel:
+            return
+
+        # discord.Fileは送信ごとに消費されるため、試行ごとに作り直す
+        def build_files() -> List[discord.File]:
+            return [discord.File(io.BytesIO(data), filename=filename) for filename, data in attachments or []]
+
+        # Webhookモード: 専用セッションで送信（失敗時はチャンネル送信にフォールバック）
+        if self.webhooks and isinstance(channel, discord.TextChannel):
+            avatar = self.bot.user.display_avatar.url if self.bot.user else None
+            if await self.webhooks.send(channel, embeds, username=self.bot.user.name if self.bot.user else None,
+                                        avatar_url=avatar, files=build_files()):
+                return
+
+        for attempt in range(2):
+            try:
+                await channel.send(embeds=embeds, files=build_files())
+                return
+            except discord.Forbidden:
+                self.logger.warning(f"No permission to send logs to channel {channel_id}")
+                raise
+            except discord.NotFound:
+                self.logger.warning(f"Log channel {channel_id} not found, removing from cache")
+                self.routes.drop_channel(channel_id)
+                raise
+            except discord.HTTPException as e:
+                if e.status != 429 or attempt:
+                    raise
+                retry_after = float(e.response.headers.get("Retry-After", 1)) if e.response else 1.0
+                await asyncio.sleep(retry_after)
+
+    async def broadcast_lifecycle_log(self, build_embed: Callable[[], discord.Embed], log_type: LogType,
+                                      action: str, data: Optional[dict] = None) -> None:
+        """
+        BOT全体のイベントを全ギルドに記録・通知
+
+        - DBへは全ギルド分を1回のINSERTで一括記録
+        - 送信はログチャンネル設定済みのギルドのみ（同時送信数は送信バッファ側で制限）
+        - Embedは送信先が見つかった時点で1回だけ作成し、全ギルドで共有
+        """
+        guild_ids = [guild.id for guild in self.bot.guilds]
+        if not guild_ids:
+            return
+
+        payload = encode_payload(log_type, data or {})
+        try:
+            await self.bot.database.create_logs_bulk([
+                {"guild_id": guild_id, "log_type": log_type, "action": action, "payload": payload}
+                for guild_id in guild_ids
+            ])
+        except Exception as e:
+            self.logger.error(f"Failed to bulk insert {action} logs: {e}")
+
+        if not self.routes.preloaded:
+            try:
+                await self.routes.preload(guild_ids)
+            except Exception as e:
+                self.logger.error(f"Failed to preload log routes: {e}")
+
+        embed: Optional[discord.Embed] = None
+        targets = 0
+        for guild_id in guild_ids:
+            channel_id = await self.routes.resolve(guild_id)
+            if channel_id:
+                if embed is None:
+                    embed = build_embed()
+                self.outbox.enqueue(channel_id, embed)
+                targets += 1
+
+        if not targets:
+            return
+        self.logger.info(f"{action} log queued for {targets}/{len(guild_ids)} guilds")
 
     @commands.hybrid_command(name="logger", description="このチャンネルをログ出力チャンネルに設定します")
     @commands.has_permissions(manage_guild=True)
@@ -48,12 +263,22 @@ class LoggingCog(commands.Cog):
             await ctx.send("❌ チャンネルが見つかりません")
             return
 
+        # 設定を上書きする前に旧ルートを取得（キャッシュがない場合はDBから読む）
+        old_channel_id = await self.routes.resolve(guild_id)
+
+        # チャンネル変更時は旧チャンネルのWebhookを削除（同じチャンネルなら保存済みのものを使い続ける）
+        if self.webhooks and old_channel_id != channel.id:
+            await self.webhooks.release(guild_id, old_channel_id)
+
         await self.bot.database.create_or_update_guild_settings(
             guild_id=guild_id,
             log_channel_id=channel.id
         )
+        if self.webhooks:
+            # 作成失敗の記憶を消し、権限付与後の再実行で再試行できるようにする
+            self.webhooks.forget_channel(channel.id)
 
-        self.log_channels[guild_id] = channel.id
+        self.routes.set_route(guild_id, channel.id)
 
         # チャンネル名を安全に取得
         channel_display = getattr(channel, 'mention', None)
@@ -86,211 +311,342 @@ class LoggingCog(commands.Cog):
             "setup_by": ctx.author.id
         })
 
-    @commands.Cog.listener()
-    async def on_message_delete(self, message: discord.Message):
-        if not message.guild or (self.bot.settings.logger_ignore_bots and message.author.bot):
+    @commands.hybrid_group(name="logs", description="記録されたログを操作します")
+    @commands.has_permissions(manage_guild=True)
+    async def logs(self, ctx: commands.Context):
+        if ctx.invoked_subcommand is None:
+            await ctx.send("❌ サブコマンドを指定してください（例: `/logs search`）")
+
+    @logs.command(name="search", description="記録されたログをキーワードで検索します")
+    @commands.has_permissions(manage_guild=True)
+    @app_commands.describe(
+        query="検索キーワード（空白区切りでAND検索）",
+        log_type="ログの種類で絞り込み",
+        user="対象ユーザーで絞り込み",
+        moderator="実行者で絞り込み",
+        channel="対象チャンネルで絞り込み"
+    )
+    @app_commands.choices(log_type=[
+        app_commands.Choice(name=title, value=log_type.value) for log_type, title in LOG_TITLES.items()
+    ])
+    async def search_logs(self, ctx: commands.Context, query: Optional[str] = None,
+                          log_type: Optional[str] = None,
+                          user: Optional[discord.User] = None,
+                          moderator: Optional[discord.User] = None,
+                          channel: Optional[discord.abc.GuildChannel] = None):
+        if not ctx.guild:
+            await ctx.send("❌ このコマンドはサーバー内でのみ使用可能です")
             return
 
-        if not self.bot.settings.logger_log_deletes:
+        try:
+            filters = {
+                "log_type": LogType(log_type) if log_type else None,
+                "user_id": user.id if user else None,
+                "moderator_id": moderator.id if moderator else None,
+                "channel_id": channel.id if channel else None
+            }
+        except ValueError:
+            await ctx.send(f"❌ 不明なログの種類です: {log_type}", ephemeral=True)
             return
 
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.MESSAGE_DELETE)} メッセージ削除",
-            color=LogUtils.get_log_color(LogType.MESSAGE_DELETE)
-        )
-        embed.add_field(name="🏠 チャンネル", value=UserFormatter.format_channel_info(message.channel), inline=True)
-        embed.add_field(name=f"{UIEmojis.USER} 送信者", value=UserFormatter.format_user_mention_and_tag(message.author), inline=True)
-        embed.add_field(name="🕐 削除時刻", value=UserFormatter.format_timestamp(datetime.now(), "T"), inline=True)
+        if not query and not any(filters.values()):
+            await ctx.send("❌ キーワードまたは絞り込み条件を指定してください", ephemeral=True)
+            return
 
-        if message.content:
-            embed.add_field(
-                name="📝 削除された内容",
-                value=UserFormatter.format_code_block(UserFormatter.truncate_text(message.content, 1000)),
-                inline=False
-            )
+        await ctx.defer(ephemeral=True)
+        try:
+            view = LogSearchView(self.bot, ctx.author.id, ctx.guild.id, query, filters)
+            embed = await view.build_page()
+            await ctx.send(embed=embed, view=view, ephemeral=True)
+        except Exception as e:
+            self.logger.error(f"Log search failed in guild {ctx.guild.id}: {e}")
+            await ctx.send(embed=EmbedBuilder.create_error_embed("検索エラー", "ログの検索に失敗しました"), ephemeral=True)
 
-        if message.attachments:
-            attachment_names = [att.filename for att in message.attachments]
-            embed.add_field(
-                name="📎 添付ファイル",
-                value="\n".join([f"• {name}" for name in attachment_names[:10]]),
-                inline=False
-            )
+    # ===== メッセージ関連イベント =====
+
+    def _should_store_messages(self) -> bool:
+        settings = self.bot.settings
+        return settings.logger_log_deletes or settings.logger_log_edits
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        """削除・編集ログ用にメッセージ内容を記録"""
+        if not message.guild or not self._should_store_messages():
+            return
+        if self.bot.settings.logger_ignore_bots and message.author.bot:
+            return
 
-        embed.set_footer(text=f"メッセージID: {message.id}")
+        self.messages.add(message)
 
-        await self.send_log(message.guild.id, embed)
+    async def _dispatch_message_delete(self, stored: StoredMessage) -> None:
+        if self.bot.settings.logger_ignore_bots and stored.author_bot:
+            return
 
-        await self.bot.database.create_log(
-            guild_id=message.guild.id,
+        await self.dispatch_log(LogRecord(
+            guild_id=stored.guild_id,
             log_type=LogType.MESSAGE_DELETE,
             action="Message Deleted",
-            user_id=message.author.id,
-            channel_id=message.channel.id,
-            details=f"Content: {message.content[:500] if message.content else 'No content'}"
-        )
+            user_id=stored.author_id,
+            channel_id=stored.channel_id,
+            data={
+                "author_tag": stored.author_tag,
+                "content": stored.content,
+                "attachments": list(stored.attachments),
+                "message_id": stored.message_id
+            }
+        ))
 
     @commands.Cog.listener()
-    async def on_message_edit(self, before: discord.Message, after: discord.Message):
-        if not before.guild or (self.bot.settings.logger_ignore_bots and before.author.bot):
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        """
+        メッセージ削除イベント
+
+        discord.pyのキャッシュにない古いメッセージも、内容ストアに記録があればログに残す
+        """
+        if not payload.guild_id or not self.bot.settings.logger_log_deletes:
+            return
+        if payload.message_id in self._bulk_deleted:
+            # 一括削除の要約ログで記録済み
             return
 
-        if not self.bot.settings.logger_log_edits:
+        # discord.pyのキャッシュにあれば内容ストアは参照しない（退避先へのクエリを避ける）
+        if payload.cached_message:
+            self.messages.discard(payload.guild_id, payload.message_id)
+            stored = StoredMessage.from_message(payload.cached_message)
+        else:
+            stored = await self.messages.pop(payload.guild_id, payload.message_id)
+        if not stored:
+            # 内容も送信者も不明なメッセージは記録しない
             return
 
-        if before.content == after.content:
+        await self._dispatch_message_delete(stored)
+
+    def _remember_bulk_deleted(self, message_ids) -> None:
+        for message_id in message_ids:
+            self._bulk_deleted[message_id] = None
+        while len(self._bulk_deleted) > self.BULK_DELETED_MEMORY:
+            self._bulk_deleted.popitem(last=False)
+
+    @staticmethod
+    def _build_transcript(messages: List[StoredMessage]) -> bytes:
+        """一括削除されたメッセージの一覧（テキストファイル）"""
+        lines = []
+        for message in messages:
+            created = datetime.fromtimestamp(message.created_at).strftime("%Y-%m-%d %H:%M:%S")
+            line = f"[{created}] {message.author_tag} ({message.author_id}): {message.content}"
+            if message.attachments:
+                line += f" [添付: {', '.join(message.attachments)}]"
+            lines.append(line)
+        return "\n".join(lines).encode("utf-8")
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        """
+        一括削除イベント
+
+        - 要約ログ1件のみ送信（件数・期間・送信者、任意で内容の一覧ファイルを添付）
+        - 内容が分かるメッセージは個別の削除ログとして1回の一括INSERTで記録（送信はしない）
+        - 対象IDは個別の削除イベントで重複して記録しない
+        """
+        if not payload.guild_id or not self.bot.settings.logger_log_deletes:
             return
 
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.MESSAGE_EDIT)} メッセージ編集",
-            color=LogUtils.get_log_color(LogType.MESSAGE_EDIT)
-        )
-        embed.add_field(name="🏠 チャンネル", value=UserFormatter.format_channel_info(before.channel), inline=True)
-        embed.add_field(name=f"{UIEmojis.USER} 編集者", value=UserFormatter.format_user_mention_and_tag(before.author), inline=True)
-        embed.add_field(name="🕐 編集時刻", value=UserFormatter.format_timestamp(datetime.now(), "T"), inline=True)
+        message_ids = sorted(payload.message_ids)
+        self._remember_bulk_deleted(message_ids)
 
-        if before.content:
-            embed.add_field(
-                name="📝 編集前",
-                value=UserFormatter.format_code_block(UserFormatter.truncate_text(before.content, 500)),
-                inline=False
-            )
+        found = {message.id: StoredMessage.from_message(message) for message in payload.cached_messages}
+        for message_id in found:
+            self.messages.discard(payload.guild_id, message_id)
+        uncached = [message_id for message_id in message_ids if message_id not in found]
+        if uncached:
+            found.update(await self.messages.pop_many(payload.guild_id, uncached))
 
-        if after.content:
-            embed.add_field(
-                name="📝 編集後",
-                value=UserFormatter.format_code_block(UserFormatter.truncate_text(after.content, 500)),
-                inline=False
+        known = [found[message_id] for message_id in sorted(found)]
+        if self.bot.settings.logger_ignore_bots:
+            known = [message for message in known if not message.author_bot]
+
+        try:
+            await self.bot.database.create_logs_bulk([
+                LogRecord(
+                    guild_id=message.guild_id,
+                    log_type=LogType.MESSAGE_DELETE,
+                    action="Message Deleted",
+                    user_id=message.author_id,
+                    channel_id=message.channel_id,
+                    data={
+                        "author_tag": message.author_tag,
+                        "content": message.content,
+                        "attachments": list(message.attachments),
+                        "message_id": message.message_id
+                    }
+                ).to_log_kwargs()
+                for message in known
+            ])
+        except Exception as e:
+            self.logger.error(f"Failed to bulk insert {len(known)} deleted messages: {e}")
+
+        authors: Counter = Counter(message.author_tag for message in known)
+        created_times = [int(discord.utils.snowflake_time(message_id).timestamp()) for message_id in message_ids]
+        channel_id = await self.routes.resolve(payload.guild_id)
+        attach_transcript = bool(known) and channel_id is not None and self.bot.settings.logger_bulk_transcript
+
+        record = LogRecord(
+            guild_id=payload.guild_id,
+            log_type=LogType.MESSAGE_BULK_DELETE,
+            action="Messages Bulk Deleted",
+            channel_id=payload.channel_id,
+            data={
+                "count": len(message_ids),
+                "known": len(known),
+                "first_at": min(created_times),
+                "last_at": max(created_times),
+                "authors": [[tag, count] for tag, count in authors.most_common(5)],
+                "transcript": attach_transcript
+            }
+        )
+
+        if not attach_transcript:
+            await self.dispatch_log(record)
+            return
+
+        # 一覧ファイル付きの要約は送信バッファを通さず単独で送信
+        await self.bot.database.create_log(**record.to_log_kwargs())
+        try:
+            await self._deliver_embeds(
+                channel_id,
+                [LogEmbedRenderer.render(record)],
+                attachments=[(f"deleted-messages-{payload.channel_id}.txt", self._build_transcript(known))]
             )
+        except Exception as e:
+            self.logger.warning(f"Failed to deliver bulk delete log to channel {channel_id}: {e}")
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        """
+        メッセージ編集イベント
 
-        embed.add_field(name="🔗 メッセージリンク", value=f"[メッセージに移動]({after.jump_url})", inline=False)
-        embed.set_footer(text=f"メッセージID: {before.id}")
+        編集前の内容はdiscord.pyのキャッシュ、なければ内容ストアから取得
+        """
+        if not payload.guild_id or not self.bot.settings.logger_log_edits:
+            return
+
+        after = payload.message
+        if self.bot.settings.logger_ignore_bots and after.author.bot:
+            return
 
-        await self.send_log(before.guild.id, embed)
+        if payload.cached_message:
+            before_content = payload.cached_message.content
+        else:
+            stored = await self.messages.get(payload.guild_id, payload.message_id)
+            before_content = stored.content if stored else None
 
-        await self.bot.database.create_log(
-            guild_id=before.guild.id,
+        # 次回の編集・削除に備えて最新の内容を記録
+        self.messages.add(after)
+
+        # 編集前が不明、または本文以外（埋め込み展開など）の更新は記録しない
+        if before_content is None or before_content == after.content:
+            return
+
+        await self.dispatch_log(LogRecord(
+            guild_id=payload.guild_id,
             log_type=LogType.MESSAGE_EDIT,
             action="Message Edited",
-            user_id=before.author.id,
-            channel_id=before.channel.id,
-            details=f"Before: {before.content[:250] if before.content else 'No content'} | After: {after.content[:250] if after.content else 'No content'}"
-        )
+            user_id=after.author.id,
+            channel_id=payload.channel_id,
+            data={
+                "author_tag": str(after.author),
+                "before": before_content,
+                "after": after.content,
+                "jump_url": after.jump_url,
+                "message_id": after.id
+            }
+        ))
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.messages.forget_guild(guild.id)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         if not self.bot.settings.logger_log_joins:
             return
 
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.MEMBER_JOIN)} メンバー参加",
-            color=LogUtils.get_log_color(LogType.MEMBER_JOIN)
-        )
-        embed.add_field(name=f"{UIEmojis.USER} ユーザー", value=UserFormatter.format_user_mention_and_tag(member), inline=True)
-        embed.add_field(name="🆔 ユーザーID", value=UserFormatter.format_id(member.id), inline=True)
-        embed.add_field(name="📅 アカウント作成日", value=UserFormatter.format_timestamp(member.created_at, "F"), inline=True)
-        embed.add_field(name="🕐 参加時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        if member.avatar:
-            embed.set_thumbnail(url=member.avatar.url)
-
-        account_age = datetime.now() - member.created_at
-        if account_age.days < 7:
-            embed.add_field(name="⚠️ 注意", value="新しいアカウントです", inline=False)
-            embed.color = UIColors.WARNING
-
-        embed.set_footer(text=f"総メンバー数: {member.guild.member_count}")
-
-        await self.send_log(member.guild.id, embed)
-
-        await self.bot.database.create_log(
+        await self.dispatch_log(LogRecord(
             guild_id=member.guild.id,
             log_type=LogType.MEMBER_JOIN,
             action="Member Joined",
             user_id=member.id,
-            details=f"Account created: {member.created_at.isoformat()}"
-        )
+            data={
+                "user_tag": str(member),
+                "created_at": int(member.created_at.timestamp()),
+                "avatar_url": member.avatar.url if member.avatar else None,
+                "member_count": member.guild.member_count
+            }
+        ))
 
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.MEMBER_LEAVE)} メンバー退出",
-            color=LogUtils.get_log_color(LogType.MEMBER_LEAVE)
-        )
-        embed.add_field(name=f"{UIEmojis.USER} ユーザー", value=UserFormatter.format_user_mention_and_tag(member), inline=True)
-        embed.add_field(name="🆔 ユーザーID", value=UserFormatter.format_id(member.id), inline=True)
-        embed.add_field(name="📅 参加日", value=UserFormatter.format_timestamp(member.joined_at, "F") if member.joined_at else "不明", inline=True)
-        embed.add_field(name="🕐 退出時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        if member.roles[1:]:
-            role_list = UserFormatter.format_role_list(member.roles[1:], 10)
-            embed.add_field(name="🏷️ 所持ロール", value=role_list, inline=False)
-
-        if member.avatar:
-            embed.set_thumbnail(url=member.avatar.url)
-
-        embed.set_footer(text=f"総メンバー数: {member.guild.member_count}")
-
-        await self.send_log(member.guild.id, embed)
-
-        await self.bot.database.create_log(
+        roles = member.roles[1:]
+        await self.dispatch_log(LogRecord(
             guild_id=member.guild.id,
             log_type=LogType.MEMBER_LEAVE,
             action="Member Left",
             user_id=member.id,
-            details=f"Joined at: {member.joined_at.isoformat() if member.joined_at else 'Unknown'}"
-        )
+            data={
+                "user_tag": str(member),
+                "joined_at": int(member.joined_at.timestamp()) if member.joined_at else None,
+                "role_ids": [role.id for role in roles[:10]],
+                "role_count": len(roles),
+                "avatar_url": member.avatar.url if member.avatar else None,
+                "member_count": member.guild.member_count
+            }
+        ))
 
     @commands.Cog.listener()
     async def on_member_ban(self, guild: discord.Guild, user: discord.User):
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.MEMBER_BAN)} メンバーBAN",
-            color=LogUtils.get_log_color(LogType.MEMBER_BAN)
-        )
-        embed.add_field(name=f"{UIEmojis.USER} 対象", value=UserFormatter.format_user_mention_and_tag(user), inline=True)
-        embed.add_field(name="🆔 ユーザーID", value=UserFormatter.format_id(user.id), inline=True)
-        embed.add_field(name="🕐 BAN時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        try:
-            ban_info = await guild.fetch_ban(user)
-            if ban_info.reason:
-                embed.add_field(name="📝 理由", value=ban_info.reason, inline=False)
-        except discord.NotFound:
-            pass
-
-        if user.avatar:
-            embed.set_thumbnail(url=user.avatar.url)
-
-        await self.send_log(guild.id, embed)
-
-        await self.bot.database.create_log(
+        record = LogRecord(
             guild_id=guild.id,
             log_type=LogType.MEMBER_BAN,
             action="Member Banned",
-            user_id=user.id
-        )
+            user_id=user.id,
+            data={
+                "user_tag": str(user),
+                "avatar_url": user.avatar.url if user.avatar else None
+            }
+        )
+
+        # 実行者は監査ログから取得（moderator_idで絞り込めるよう保存）
+        if guild.me.guild_permissions.view_audit_log:
+            try:
+                async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.ban):
+                    if entry.target and entry.target.id == user.id:
+                        record.moderator_id = entry.user.id if entry.user else None
+                        record.data["reason"] = entry.reason
+                        break
+            except discord.HTTPException as e:
+                self.logger.debug(f"Failed to read ban audit log in guild {guild.id}: {e}")
+        # 監査ログが読めない場合、BAN理由の取得はREST呼び出しのため送信先がある場合のみ
+        elif await self.routes.has_destination(guild.id):
+            try:
+                ban_info = await guild.fetch_ban(user)
+                record.data["reason"] = ban_info.reason
+            except discord.NotFound:
+                pass
+
+        await self.dispatch_log(record)
 
     @commands.Cog.listener()
     async def on_member_unban(self, guild: discord.Guild, user: discord.User):
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.MEMBER_UNBAN)} メンバーBAN解除",
-            color=LogUtils.get_log_color(LogType.MEMBER_UNBAN)
-        )
-        embed.add_field(name=f"{UIEmojis.USER} 対象", value=UserFormatter.format_user_mention_and_tag(user), inline=True)
-        embed.add_field(name="🆔 ユーザーID", value=UserFormatter.format_id(user.id), inline=True)
-        embed.add_field(name="🕐 BAN解除時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        if user.avatar:
-            embed.set_thumbnail(url=user.avatar.url)
-
-        await self.send_log(guild.id, embed)
-
-        await self.bot.database.create_log(
+        await self.dispatch_log(LogRecord(
             guild_id=guild.id,
             log_type=LogType.MEMBER_UNBAN,
             action="Member Unbanned",
-            user_id=user.id
-        )
+            user_id=user.id,
+            data={
+                "user_tag": str(user),
+                "avatar_url": user.avatar.url if user.avatar else None
+            }
+        ))
 
     # ===== チャンネル関連イベント =====
 
@@ -311,32 +667,18 @@ class LoggingCog(commands.Cog):
         }
         channel_type = channel_type_map.get(type(channel), "不明なチャンネル")
 
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.CHANNEL_CREATE)} チャンネル作成",
-            color=LogUtils.get_log_color(LogType.CHANNEL_CREATE)
-        )
-        embed.add_field(name="📝 チャンネル名", value=UserFormatter.format_channel_name(channel), inline=True)
-        embed.add_field(name="🆔 チャンネルID", value=UserFormatter.format_id(channel.id), inline=True)
-        embed.add_field(name="📋 タイプ", value=channel_type, inline=True)
-        embed.add_field(name="🕐 作成時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        # カテゴリ情報
-        if hasattr(channel, 'category') and channel.category:
-            embed.add_field(name="📁 カテゴリ", value=channel.category.name, inline=True)
-
-        # ポジション情報
-        if hasattr(channel, 'position'):
-            embed.add_field(name="📍 ポジション", value=str(channel.position), inline=True)
-
-        await self.send_log(channel.guild.id, embed)
-
-        await self.bot.database.create_log(
+        await self.dispatch_log(LogRecord(
             guild_id=channel.guild.id,
             log_type=LogType.CHANNEL_CREATE,
             action="Channel Created",
             channel_id=channel.id,
-            details=f"Name: {getattr(channel, 'name', 'Unknown')}, Type: {channel_type}, Position: {getattr(channel, 'position', 'N/A')}"
-        )
+            data={
+                "name": getattr(channel, 'name', channel.id),
+                "channel_type": channel_type,
+                "category": channel.category.name if getattr(channel, 'category', None) else None,
+                "position": getattr(channel, 'position', None)
+            }
+        ))
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, channel):
@@ -355,32 +697,18 @@ class LoggingCog(commands.Cog):
         }
         channel_type = channel_type_map.get(type(channel), "不明なチャンネル")
 
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.CHANNEL_DELETE)} チャンネル削除",
-            color=LogUtils.get_log_color(LogType.CHANNEL_DELETE)
-        )
-        embed.add_field(name="📝 チャンネル名", value=UserFormatter.format_channel_name(channel), inline=True)
-        embed.add_field(name="🆔 チャンネルID", value=UserFormatter.format_id(channel.id), inline=True)
-        embed.add_field(name="📋 タイプ", value=channel_type, inline=True)
-        embed.add_field(name="🕐 削除時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        # カテゴリ情報
-        if hasattr(channel, 'category') and channel.category:
-            embed.add_field(name="📁 カテゴリ", value=channel.category.name, inline=True)
-
-        # ポジション情報
-        if hasattr(channel, 'position'):
-            embed.add_field(name="📍 ポジション", value=str(channel.position), inline=True)
-
-        await self.send_log(channel.guild.id, embed)
-
-        await self.bot.database.create_log(
+        await self.dispatch_log(LogRecord(
             guild_id=channel.guild.id,
             log_type=LogType.CHANNEL_DELETE,
             action="Channel Deleted",
             channel_id=channel.id,
-            details=f"Name: {getattr(channel, 'name', 'Unknown')}, Type: {channel_type}, Position: {getattr(channel, 'position', 'N/A')}"
-        )
+            data={
+                "name": getattr(channel, 'name', channel.id),
+                "channel_type": channel_type,
+                "category": channel.category.name if getattr(channel, 'category', None) else None,
+                "position": getattr(channel, 'position', None)
+            }
+        ))
 
     @commands.Cog.listener()
     async def on_guild_channel_update(self, before, after):
@@ -388,40 +716,27 @@ class LoggingCog(commands.Cog):
         if not hasattr(before, 'guild') or not before.guild:
             return
 
+        # 変更内容は [項目, 変更前, 変更後] で記録（表示用の整形は送信時に行う）
         changes = []
 
         # 名前変更チェック
         if before.name != after.name:
-            changes.append(f"名前: `{before.name}` → `{after.name}`")
-
-        # トピック変更チェック（テキストチャンネル）
-        if hasattr(before, 'topic') and hasattr(after, 'topic'):
-            if before.topic != after.topic:
-                before_topic = before.topic or "なし"
-                after_topic = after.topic or "なし"
-                changes.append(f"トピック: `{UserFormatter.truncate_text(before_topic, 50)}` → `{UserFormatter.truncate_text(after_topic, 50)}`")
+            changes.append(change_entry("name", before.name, after.name))
 
-        # ポジション変更チェック
-        if hasattr(before, 'position') and hasattr(after, 'position'):
-            if before.position != after.position:
-                changes.append(f"ポジション: `{before.position}` → `{after.position}`")
+        # 比較する属性（チャンネルの種類によって存在しないものは除く）
+        for field in ("topic", "position", "nsfw", "slowmode_delay"):
+            if hasattr(before, field) and hasattr(after, field):
+                if getattr(before, field) != getattr(after, field):
+                    changes.append(change_entry(field, getattr(before, field), getattr(after, field)))
 
         # カテゴリ変更チェック
         if hasattr(before, 'category') and hasattr(after, 'category'):
             if before.category != after.category:
-                before_category = before.category.name if before.category else "なし"
-                after_category = after.category.name if after.category else "なし"
-                changes.append(f"カテゴリ: `{before_category}` → `{after_category}`")
-
-        # nsfw設定変更チェック（テキストチャンネル）
-        if hasattr(before, 'nsfw') and hasattr(after, 'nsfw'):
-            if before.nsfw != after.nsfw:
-                changes.append(f"NSFW: `{before.nsfw}` → `{after.nsfw}`")
-
-        # slowmode変更チェック（テキストチャンネル）
-        if hasattr(before, 'slowmode_delay') and hasattr(after, 'slowmode_delay'):
-            if before.slowmode_delay != after.slowmode_delay:
-                changes.append(f"低速モード: `{before.slowmode_delay}秒` → `{after.slowmode_delay}秒`")
+                changes.append(change_entry(
+                    "category",
+                    before.category.name if before.category else None,
+                    after.category.name if after.category else None
+                ))
 
         # 変更がない場合は終了
         if not changes:
@@ -438,144 +753,114 @@ class LoggingCog(commands.Cog):
         }
         channel_type = channel_type_map.get(type(after), "不明なチャンネル")
 
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.CHANNEL_UPDATE)} チャンネル更新",
-            color=LogUtils.get_log_color(LogType.CHANNEL_UPDATE)
-        )
-        embed.add_field(name="📝 チャンネル", value=f"{after.mention} (`{after.name}`)", inline=True)
-        embed.add_field(name="🆔 チャンネルID", value=UserFormatter.format_id(after.id), inline=True)
-        embed.add_field(name="📋 タイプ", value=channel_type, inline=True)
-        embed.add_field(name="🕐 更新時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        # 変更内容を表示
-        embed.add_field(
-            name="📝 変更内容",
-            value="\n".join([f"• {change}" for change in changes[:10]]),  # 最大10項目
-            inline=False
-        )
-
-        await self.send_log(after.guild.id, embed)
-
-        await self.bot.database.create_log(
+        await self.dispatch_log(LogRecord(
             guild_id=after.guild.id,
             log_type=LogType.CHANNEL_UPDATE,
             action="Channel Updated",
             channel_id=after.id,
-            details=f"Changes: {', '.join(changes[:5])}"  # データベースには最大5項目
-        )
+            data={
+                "name": after.name,
+                "channel_type": channel_type,
+                "changes": changes
+            }
+        ))
 
     # ===== WebSocket関連イベント =====
 
     @commands.Cog.listener()
     async def on_connect(self):
         """WebSocket接続イベント"""
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.WEBSOCKET_CONNECT)} WebSocket接続",
-            color=LogUtils.get_log_color(LogType.WEBSOCKET_CONNECT)
-        )
-        embed.add_field(name="🔗 ステータス", value="Discordに接続しました", inline=True)
-        embed.add_field(name="🕐 接続時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-        embed.add_field(name="🤖 BOT情報", value=UserFormatter.format_user_mention_and_tag(self.bot.user), inline=True)
-
-        # 全てのサーバーにログ送信
-        for guild in self.bot.guilds:
-            await self.send_log(guild.id, embed)
-            await self.bot.database.create_log(
-                guild_id=guild.id,
-                log_type=LogType.WEBSOCKET_CONNECT,
-                action="WebSocket Connected",
-                details=f"Bot: {self.bot.user.name}#{self.bot.user.discriminator}"
+        def build_embed() -> discord.Embed:
+            embed = EmbedBuilder.create_base_embed(
+                title=f"{LogUtils.get_log_emoji(LogType.WEBSOCKET_CONNECT)} WebSocket接続",
+                color=LogUtils.get_log_color(LogType.WEBSOCKET_CONNECT)
             )
+            embed.add_field(name="🔗 ステータス", value="Discordに接続しました", inline=True)
+            embed.add_field(name="🕐 接続時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
+            embed.add_field(name="🤖 BOT情報", value=UserFormatter.format_user_mention_and_tag(self.bot.user), inline=True)
+            return embed
+
+        # 全てのサーバーにログ送信（一括記録＋並行送信）
+        await self.broadcast_lifecycle_log(
+            build_embed,
+            log_type=LogType.WEBSOCKET_CONNECT,
+            action="WebSocket Connected"
+        )
 
     @commands.Cog.listener()
     async def on_disconnect(self):
         """WebSocket切断イベント"""
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.WEBSOCKET_DISCONNECT)} WebSocket切断",
-            color=LogUtils.get_log_color(LogType.WEBSOCKET_DISCONNECT)
-        )
-        embed.add_field(name="🔌 ステータス", value="Discordから切断されました", inline=True)
-        embed.add_field(name="🕐 切断時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-        embed.add_field(name="🤖 BOT情報", value=UserFormatter.format_user_mention_and_tag(self.bot.user), inline=True)
-
-        # 全てのサーバーにログ送信
-        for guild in self.bot.guilds:
-            await self.send_log(guild.id, embed)
-            await self.bot.database.create_log(
-                guild_id=guild.id,
-                log_type=LogType.WEBSOCKET_DISCONNECT,
-                action="WebSocket Disconnected",
-                details=f"Bot: {self.bot.user.name}#{self.bot.user.discriminator}"
+        def build_embed() -> discord.Embed:
+            embed = EmbedBuilder.create_base_embed(
+                title=f"{LogUtils.get_log_emoji(LogType.WEBSOCKET_DISCONNECT)} WebSocket切断",
+                color=LogUtils.get_log_color(LogType.WEBSOCKET_DISCONNECT)
             )
+            embed.add_field(name="🔌 ステータス", value="Discordから切断されました", inline=True)
+            embed.add_field(name="🕐 切断時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
+            embed.add_field(name="🤖 BOT情報", value=UserFormatter.format_user_mention_and_tag(self.bot.user), inline=True)
+            return embed
+
+        # 全てのサーバーにログ送信（一括記録＋並行送信）
+        await self.broadcast_lifecycle_log(
+            build_embed,
+            log_type=LogType.WEBSOCKET_DISCONNECT,
+            action="WebSocket Disconnected"
+        )
 
     @commands.Cog.listener()
     async def on_resumed(self):
         """WebSocket再接続イベント"""
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.WEBSOCKET_RECONNECT)} WebSocket再接続",
-            color=LogUtils.get_log_color(LogType.WEBSOCKET_RECONNECT)
-        )
-        embed.add_field(name="🔄 ステータス", value="Discordに再接続しました", inline=True)
-        embed.add_field(name="🕐 再接続時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-        embed.add_field(name="🤖 BOT情報", value=UserFormatter.format_user_mention_and_tag(self.bot.user), inline=True)
-
-        # 全てのサーバーにログ送信
-        for guild in self.bot.guilds:
-            await self.send_log(guild.id, embed)
-            await self.bot.database.create_log(
-                guild_id=guild.id,
-                log_type=LogType.WEBSOCKET_RECONNECT,
-                action="WebSocket Reconnected",
-                details=f"Bot: {self.bot.user.name}#{self.bot.user.discriminator}"
+        def build_embed() -> discord.Embed:
+            embed = EmbedBuilder.create_base_embed(
+                title=f"{LogUtils.get_log_emoji(LogType.WEBSOCKET_RECONNECT)} WebSocket再接続",
+                color=LogUtils.get_log_color(LogType.WEBSOCKET_RECONNECT)
             )
+            embed.add_field(name="🔄 ステータス", value="Discordに再接続しました", inline=True)
+            embed.add_field(name="🕐 再接続時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
+            embed.add_field(name="🤖 BOT情報", value=UserFormatter.format_user_mention_and_tag(self.bot.user), inline=True)
+            return embed
+
+        # 全てのサーバーにログ送信（一括記録＋並行送信）
+        await self.broadcast_lifecycle_log(
+            build_embed,
+            log_type=LogType.WEBSOCKET_RECONNECT,
+            action="WebSocket Reconnected"
+        )
 
     # ===== ロール関連イベント =====
 
     @commands.Cog.listener()
     async def on_guild_role_create(self, role):
         """ロール作成イベント"""
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.ROLE_CREATE)} ロール作成",
-            color=LogUtils.get_log_color(LogType.ROLE_CREATE)
-        )
-        embed.add_field(name="🏷️ ロール名", value=role.mention, inline=True)
-        embed.add_field(name="🆔 ロールID", value=UserFormatter.format_id(role.id), inline=True)
-        embed.add_field(name="🎨 色", value=UserFormatter.format_code_inline(str(role.color)), inline=True)
-        embed.add_field(name="📍 ポジション", value=str(role.position), inline=True)
-        embed.add_field(name="🔒 権限", value="管理者" if role.permissions.administrator else "一般", inline=True)
-        embed.add_field(name="🕐 作成時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        await self.send_log(role.guild.id, embed)
-
-        await self.bot.database.create_log(
+        await self.dispatch_log(LogRecord(
             guild_id=role.guild.id,
             log_type=LogType.ROLE_CREATE,
             action="Role Created",
-            details=f"Name: {role.name}, Color: {role.color}, Position: {role.position}, Admin: {role.permissions.administrator}"
-        )
+            data={
+                "role_id": role.id,
+                "name": role.name,
+                "color": str(role.color),
+                "position": role.position,
+                "administrator": role.permissions.administrator
+            }
+        ))
 
     @commands.Cog.listener()
     async def on_guild_role_delete(self, role):
         """ロール削除イベント"""
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.ROLE_DELETE)} ロール削除",
-            color=LogUtils.get_log_color(LogType.ROLE_DELETE)
-        )
-        embed.add_field(name="🏷️ ロール名", value=UserFormatter.format_code_inline(role.name), inline=True)
-        embed.add_field(name="🆔 ロールID", value=UserFormatter.format_id(role.id), inline=True)
-        embed.add_field(name="🎨 色", value=UserFormatter.format_code_inline(str(role.color)), inline=True)
-        embed.add_field(name="📍 ポジション", value=str(role.position), inline=True)
-        embed.add_field(name="👥 メンバー数", value=f"{len(role.members)}人", inline=True)
-        embed.add_field(name="🕐 削除時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        await self.send_log(role.guild.id, embed)
-
-        await self.bot.database.create_log(
+        member_count = len(role.members)
+        await self.dispatch_log(LogRecord(
             guild_id=role.guild.id,
             log_type=LogType.ROLE_DELETE,
             action="Role Deleted",
-            details=f"Name: {role.name}, Color: {role.color}, Members: {len(role.members)}"
-        )
+            data={
+                "role_id": role.id,
+                "name": role.name,
+                "color": str(role.color),
+                "position": role.position,
+                "member_count": member_count
+            }
+        ))
 
     @commands.Cog.listener()
     async def on_guild_role_update(self, before, after):
@@ -584,67 +869,35 @@ class LoggingCog(commands.Cog):
 
         # 名前変更チェック
         if before.name != after.name:
-            changes.append(f"名前: `{before.name}` → `{after.name}`")
+            changes.append(change_entry("name", before.name, after.name))
 
         # 色変更チェック
         if before.color != after.color:
-            changes.append(f"色: `{before.color}` → `{after.color}`")
+            changes.append(change_entry("color", str(before.color), str(after.color)))
 
-        # ポジション変更チェック
-        if before.position != after.position:
-            changes.append(f"ポジション: `{before.position}` → `{after.position}`")
+        # ポジション・メンション可能・別表示の変更チェック
+        for field in ("position", "mentionable", "hoist"):
+            if getattr(before, field) != getattr(after, field):
+                changes.append(change_entry(field, getattr(before, field), getattr(after, field)))
 
-        # 権限変更チェック
+        # 権限変更チェック（変更された権限ごとに記録）
         if before.permissions != after.permissions:
-            # 主要な権限の変更をチェック
-            permission_changes = []
-            if before.permissions.administrator != after.permissions.administrator:
-                permission_changes.append(f"管理者: {before.permissions.administrator} → {after.permissions.administrator}")
-            if before.permissions.manage_guild != after.permissions.manage_guild:
-                permission_changes.append(f"サーバー管理: {before.permissions.manage_guild} → {after.permissions.manage_guild}")
-            if before.permissions.manage_roles != after.permissions.manage_roles:
-                permission_changes.append(f"ロール管理: {before.permissions.manage_roles} → {after.permissions.manage_roles}")
-            if before.permissions.manage_channels != after.permissions.manage_channels:
-                permission_changes.append(f"チャンネル管理: {before.permissions.manage_channels} → {after.permissions.manage_channels}")
-
-            if permission_changes:
-                changes.append(f"権限: {', '.join(permission_changes[:3])}")
-
-        # メンション可能設定チェック
-        if before.mentionable != after.mentionable:
-            changes.append(f"メンション可能: `{before.mentionable}` → `{after.mentionable}`")
-
-        # ホイスト設定チェック
-        if before.hoist != after.hoist:
-            changes.append(f"別表示: `{before.hoist}` → `{after.hoist}`")
+            changes.extend(permission_changes(before.permissions, after.permissions))
 
         # 変更がない場合は終了
         if not changes:
             return
 
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.ROLE_UPDATE)} ロール更新",
-            color=LogUtils.get_log_color(LogType.ROLE_UPDATE)
-        )
-        embed.add_field(name="🏷️ ロール", value=after.mention, inline=True)
-        embed.add_field(name="🆔 ロールID", value=UserFormatter.format_id(after.id), inline=True)
-        embed.add_field(name="🕐 更新時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        # 変更内容を表示
-        embed.add_field(
-            name="📝 変更内容",
-            value="\n".join([f"• {change}" for change in changes[:8]]),  # 最大8項目
-            inline=False
-        )
-
-        await self.send_log(after.guild.id, embed)
-
-        await self.bot.database.create_log(
+        await self.dispatch_log(LogRecord(
             guild_id=after.guild.id,
             log_type=LogType.ROLE_UPDATE,
             action="Role Updated",
-            details=f"Role: {after.name}, Changes: {', '.join(changes[:5])}"
-        )
+            data={
+                "role_id": after.id,
+                "name": after.name,
+                "changes": changes
+            }
+        ))
 
     # ===== サーバー関連イベント =====
 
@@ -653,63 +906,40 @@ class LoggingCog(commands.Cog):
         """サーバー更新イベント"""
         changes = []
 
-        # 名前変更チェック
-        if before.name != after.name:
-            changes.append(f"名前: `{before.name}` → `{after.name}`")
-
-        # アイコン変更チェック
-        if before.icon != after.icon:
-            changes.append("アイコンが変更されました")
-
-        # バナー変更チェック
-        if before.banner != after.banner:
-            changes.append("バナーが変更されました")
-
-        # 説明変更チェック
-        if before.description != after.description:
-            before_desc = before.description or "なし"
-            after_desc = after.description or "なし"
-            changes.append(f"説明: `{UserFormatter.truncate_text(before_desc, 30)}` → `{UserFormatter.truncate_text(after_desc, 30)}`")
-
-        # 認証レベル変更チェック
-        if before.verification_level != after.verification_level:
-            changes.append(f"認証レベル: `{before.verification_level.name}` → `{after.verification_level.name}`")
-
-        # MFA要求変更チェック
-        if before.mfa_level != after.mfa_level:
-            changes.append(f"MFA要求: `{before.mfa_level.name}` → `{after.mfa_level.name}`")
+        # 名前・説明変更チェック
+        for field in ("name", "description"):
+            if getattr(before, field) != getattr(after, field):
+                changes.append(change_entry(field, getattr(before, field), getattr(after, field)))
+
+        # アイコン・バナー変更チェック（画像のハッシュを記録）
+        for field in ("icon", "banner"):
+            before_asset, after_asset = getattr(before, field), getattr(after, field)
+            if before_asset != after_asset:
+                changes.append(change_entry(
+                    field,
+                    before_asset.key if before_asset else None,
+                    after_asset.key if after_asset else None
+                ))
+
+        # 認証レベル・MFA要求変更チェック
+        for field in ("verification_level", "mfa_level"):
+            if getattr(before, field) != getattr(after, field):
+                changes.append(change_entry(field, getattr(before, field).name, getattr(after, field).name))
 
         # 変更がない場合は終了
         if not changes:
             return
 
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.GUILD_UPDATE)} サーバー更新",
-            color=LogUtils.get_log_color(LogType.GUILD_UPDATE)
-        )
-        embed.add_field(name="🏛️ サーバー", value=UserFormatter.format_code_inline(after.name), inline=True)
-        embed.add_field(name="🆔 サーバーID", value=UserFormatter.format_id(after.id), inline=True)
-        embed.add_field(name="🕐 更新時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-
-        # 変更内容を表示
-        embed.add_field(
-            name="📝 変更内容",
-            value="\n".join([f"• {change}" for change in changes[:8]]),
-            inline=False
-        )
-
-        # 新しいアイコンがある場合はサムネイル設定
-        if after.icon:
-            embed.set_thumbnail(url=after.icon.url)
-
-        await self.send_log(after.id, embed)
-
-        await self.bot.database.create_log(
+        await self.dispatch_log(LogRecord(
             guild_id=after.id,
             log_type=LogType.GUILD_UPDATE,
             action="Guild Updated",
-            details=f"Changes: {', '.join(changes[:5])}"
-        )
+            data={
+                "guild_name": after.name,
+                "changes": changes,
+                "icon_url": after.icon.url if after.icon else None
+            }
+        ))
 
     @commands.Cog.listener()
     async def on_guild_emojis_update(self, guild, before, after):
@@ -720,69 +950,56 @@ class LoggingCog(commands.Cog):
         if not added_emojis and not removed_emojis:
             return
 
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.GUILD_EMOJIS_UPDATE)} 絵文字更新",
-            color=LogUtils.get_log_color(LogType.GUILD_EMOJIS_UPDATE)
-        )
-        embed.add_field(name="🏛️ サーバー", value=UserFormatter.format_code_inline(guild.name), inline=True)
-        embed.add_field(name="🕐 更新時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-        embed.add_field(name="📊 絵文字数", value=f"{len(after)}個", inline=True)
-
-        if added_emojis:
-            emoji_list = [f"{emoji} (`{emoji.name}`)" for emoji in added_emojis[:5]]
-            if len(added_emojis) > 5:
-                emoji_list.append(f"... 他{len(added_emojis) - 5}個")
-            embed.add_field(
-                name="➕ 追加された絵文字",
-                value="\n".join(emoji_list),
-                inline=False
-            )
-
-        if removed_emojis:
-            emoji_list = [UserFormatter.format_code_inline(emoji.name) for emoji in removed_emojis[:5]]
-            if len(removed_emojis) > 5:
-                emoji_list.append(f"... 他{len(removed_emojis) - 5}個")
-            embed.add_field(
-                name="➖ 削除された絵文字",
-                value="\n".join(emoji_list),
-                inline=False
-            )
-
-        await self.send_log(guild.id, embed)
-
-        await self.bot.database.create_log(
+        await self.dispatch_log(LogRecord(
             guild_id=guild.id,
             log_type=LogType.GUILD_EMOJIS_UPDATE,
             action="Guild Emojis Updated",
-            details=f"Added: {len(added_emojis)}, Removed: {len(removed_emojis)}"
-        )
+            data={
+                "guild_name": guild.name,
+                "emoji_count": len(after),
+                "added": [[str(emoji), emoji.name] for emoji in added_emojis[:5]],
+                "added_count": len(added_emojis),
+                "removed": [emoji.name for emoji in removed_emojis[:5]],
+                "removed_count": len(removed_emojis)
+            }
+        ))
 
     @commands.Cog.listener()
     async def on_ready(self):
         """BOT起動完了イベント"""
-        embed = EmbedBuilder.create_base_embed(
-            title=f"{LogUtils.get_log_emoji(LogType.BOT_READY)} BOT起動完了",
-            color=LogUtils.get_log_color(LogType.BOT_READY)
-        )
-        embed.add_field(name="🚀 ステータス", value="BOTが正常に起動しました", inline=True)
-        embed.add_field(name="🕐 起動時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
-        embed.add_field(name="🤖 BOT情報", value=UserFormatter.format_user_mention_and_tag(self.bot.user), inline=True)
-        embed.add_field(name="🌐 サーバー数", value=f"{len(self.bot.guilds)}サーバー", inline=True)
-        embed.add_field(name="👥 総ユーザー数", value=f"{len(self.bot.users)}ユーザー", inline=True)
+        # ログ送信先を全ギルド分まとめて読み込み（以降のイベントはDB参照なし）
+        try:
+            await self.routes.preload(guild.id for guild in self.bot.guilds)
+        except Exception as e:
+            self.logger.error(f"Failed to preload log routes: {e}")
 
         # レイテンシ情報
         latency_ms = round(self.bot.latency * 1000)
-        embed.add_field(name="📡 レイテンシ", value=f"{latency_ms}ms", inline=True)
-
-        # 全てのサーバーにログ送信
-        for guild in self.bot.guilds:
-            await self.send_log(guild.id, embed)
-            await self.bot.database.create_log(
-                guild_id=guild.id,
-                log_type=LogType.BOT_READY,
-                action="Bot Ready",
-                details=f"Guilds: {len(self.bot.guilds)}, Users: {len(self.bot.users)}, Latency: {latency_ms}ms"
+
+        def build_embed() -> discord.Embed:
+            embed = EmbedBuilder.create_base_embed(
+                title=f"{LogUtils.get_log_emoji(LogType.BOT_READY)} BOT起動完了",
+                color=LogUtils.get_log_color(LogType.BOT_READY)
             )
+            embed.add_field(name="🚀 ステータス", value="BOTが正常に起動しました", inline=True)
+            embed.add_field(name="🕐 起動時刻", value=UserFormatter.format_timestamp(datetime.now(), "F"), inline=True)
+            embed.add_field(name="🤖 BOT情報", value=UserFormatter.format_user_mention_and_tag(self.bot.user), inline=True)
+            embed.add_field(name="🌐 サーバー数", value=f"{len(self.bot.guilds)}サーバー", inline=True)
+            embed.add_field(name="👥 総ユーザー数", value=f"{len(self.bot.users)}ユーザー", inline=True)
+            embed.add_field(name="📡 レイテンシ", value=f"{latency_ms}ms", inline=True)
+            return embed
+
+        # 全てのサーバーにログ送信（一括記録＋並行送信）
+        await self.broadcast_lifecycle_log(
+            build_embed,
+            log_type=LogType.BOT_READY,
+            action="Bot Ready",
+            data={
+                "guilds": len(self.bot.guilds),
+                "users": len(self.bot.users),
+                "latency_ms": latency_ms
+            }
+        )
 
 
 async def setup(bot):
@@ -80,15 +80,12 @@ class QuickAddModal(discord.ui.Modal):
         """プレイヤーUIを新しくチャンネルの下に表示"""
         try:
             # 現在の状態取得
-            track_data = await self.bot.music_service.get_current_track(self.guild_id)
-            session_data = await self.bot.music_service.get_session_info(self.guild_id)
-            queue_data = await self.bot.music_service.get_queue(self.guild_id)
-
-            if not track_data:
+            snapshot = await self.bot.music_service.get_player_snapshot(self.guild_id)
+            if not snapshot or not snapshot.has_track:
                 return
 
             # 新しいプレイヤーEmbed作成
-            embed = EmbedBuilder.create_music_player_embed(track_data, session_data, queue_data)
+            embed = MusicPlayerView.build_player_embed(snapshot)
             view = MusicPlayerView(self.bot, self.guild_id)
 
             # チャンネルに新しいメッセージとして送信
@@ -115,6 +112,7 @@ class MusicPlayerView(discord.ui.View):
         self.guild_id = guild_id
         self.message = None  # Embedメッセージの参照
         self.update_task = None  # 自動更新タスク
+        self._rendered_key = None  # 最後に描画したスナップショットのキー
 
         # このインスタンスをアクティブリストに追加
         MusicPlayerView._active_instances.add(self)
@@ -236,7 +234,7 @@ class MusicPlayerView(discord.ui.View):
 
         try:
             if action == "clear":
-                cleared_count = await self.bot.database.clear_queue(self.guild_id)
+                cleared_count = await self.bot.music_service.clear_queue(self.guild_id)
                 embed = EmbedBuilder.create_success_embed("キュークリア", f"{cleared_count}曲をキューから削除しました")
                 await interaction.followup.send(embed=embed, ephemeral=True)
 
@@ -251,24 +249,32 @@ class MusicPlayerView(discord.ui.View):
         """プレイヤーEmbed更新"""
         try:
             # 最新状態取得
-            track_data = await self.bot.music_service.get_current_track(self.guild_id)
-            session_data = await self.bot.music_service.get_session_info(self.guild_id)
-            queue_data = await self.bot.music_service.get_queue(self.guild_id)
-
-            if not track_data:
+            snapshot = await self.bot.music_service.get_player_snapshot(self.guild_id)
+            if not snapshot or not snapshot.has_track:
                 return
 
             # Embed再構築
-            embed = EmbedBuilder.create_music_player_embed(track_data, session_data, queue_data)
+            embed = self.build_player_embed(snapshot)
 
             # ボタンの状態更新
-            self._update_button_states(session_data)
+            self._update_button_states(snapshot.session_data())
 
             await interaction.edit_original_response(embed=embed, view=self)
+            self._rendered_key = snapshot.render_key
 
         except Exception as e:
             self.bot.logger.error(f"Embed update error: {e}")
 
+    @staticmethod
+    def build_player_embed(snapshot) -> discord.Embed:
+        """スナップショットからプレイヤーEmbedを作成"""
+        return EmbedBuilder.create_music_player_embed(
+            snapshot.track_data(),
+            snapshot.session_data(),
+            snapshot.queue_data(),
+            queue_total=snapshot.queue_length
+        )
+
     def _update_button_states(self, session_data: dict):
         """ボタンの見た目を動的更新"""
         try:
@@ -349,8 +355,8 @@ class MusicPlayerView(discord.ui.View):
 
                 # プレイヤーが存在するかチェック
                 player = self.bot.music_service.get_player(self.guild_id)
-                if not player or not player.is_playing():
-                    # 再生停止時は更新停止
+                if not player or not player.is_active():
+                    # 再生終了時は更新停止（スキップ中の読み込み・一時停止では継続）
                     break
 
                 # Embed更新
@@ -372,21 +378,28 @@ class MusicPlayerView(discord.ui.View):
                 return
 
             # 最新状態取得
-            track_data = await self.bot.music_service.get_current_track(self.guild_id)
-            session_data = await self.bot.music_service.get_session_info(self.guild_id)
-            queue_data = await self.bot.music_service.get_queue(self.guild_id)
+            snapshot = await self.bot.music_service.get_player_snapshot(self.guild_id)
+            if not snapshot or not snapshot.has_track:
+                return
 
-            if not track_data:
+            # 状態・再生位置が前回描画時と同じなら編集を省略
+            if snapshot.render_key == self._rendered_key:
                 return
 
             # Embed再構築
-            embed = EmbedBuilder.create_music_player_embed(track_data, session_data, queue_data)
+            embed = self.build_player_embed(snapshot)
 
             # ボタンの状態更新
-            self._update_button_states(session_data)
+            self._update_button_states(snapshot.session_data())
 
-            # メッセージ更新
-            await self.message.edit(embed=embed, view=self)
+            # メッセージ更新（編集APIのレイテンシを記録）
+            metrics = self.bot.music_service.metrics
+            if metrics is not None:
+                with metrics.histogram("ui_edit_seconds", "Discord message edit latency", ("view",)).labels("player").time():
+                    await self.message.edit(embed=embed, view=self)
+            else:
+                await self.message.edit(embed=embed, view=self)
+            self._rendered_key = snapshot.render_key
 
         except discord.NotFound:
             # メッセージが削除された場合、更新停止
@@ -401,15 +414,12 @@ class MusicPlayerView(discord.ui.View):
         """スキップ後にプレイヤーUIを更新（プログレスバー継続）"""
         try:
             # 現在の状態取得
-            track_data = await self.bot.music_service.get_current_track(self.guild_id)
-            session_data = await self.bot.music_service.get_session_info(self.guild_id)
-            queue_data = await self.bot.music_service.get_queue(self.guild_id)
-
-            if not track_data:
+            snapshot = await self.bot.music_service.get_player_snapshot(self.guild_id)
+            if not snapshot or not snapshot.has_track:
                 return
 
             # 新しいプレイヤーEmbed作成
-            embed = EmbedBuilder.create_music_player_embed(track_data, session_data, queue_data)
+            embed = MusicPlayerView.build_player_embed(snapshot)
             view = MusicPlayerView(self.bot, self.guild_id)
 
             # チャンネルに新しいメッセージとして送信
@@ -424,6 +434,68 @@ class MusicPlayerView(discord.ui.View):
             self.bot.logger.error(f"Player UI refresh after skip error: {e}")
 
 
+class QueuePageView(discord.ui.View):
+    """キューのページ送りUI - 表示ページのみDBから取得"""
+
+    ITEMS_PER_PAGE = 10
+
+    def __init__(self, bot, guild_id: int, user_id: int, total: int, page: int = 1):
+        super().__init__(timeout=180)
+        self.bot = bot
+        self.guild_id = guild_id
+        self.user_id = user_id
+        self.total = total
+        self.page = page
+        self._update_buttons()
+
+    @property
+    def total_pages(self) -> int:
+        return max(1, (self.total + self.ITEMS_PER_PAGE - 1) // self.ITEMS_PER_PAGE)
+
+    @classmethod
+    async def build_page(cls, bot, guild_id: int, page: int):
+        """指定ページのEmbedとキュー総数を取得"""
+        items, total = await bot.music_service.get_queue_page(guild_id, page, cls.ITEMS_PER_PAGE)
+        embed = EmbedBuilder.create_queue_embed(
+            items, page=page, total_count=total, items_per_page=cls.ITEMS_PER_PAGE
+        )
+        return embed, total
+
+    def _update_buttons(self):
+        self.previous_page.disabled = self.page <= 1
+        self.next_page.disabled = self.page >= self.total_pages
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("❌ このページ送りはコマンド実行者のみ操作できます", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(emoji="◀️", style=ButtonStyles.SECONDARY)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show_page(interaction, self.page - 1)
+
+    @discord.ui.button(emoji="▶️", style=ButtonStyles.SECONDARY)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show_page(interaction, self.page + 1)
+
+    async def _show_page(self, interaction: discord.Interaction, page: int):
+        try:
+            page = min(max(page, 1), self.total_pages)
+            embed, self.total = await self.build_page(self.bot, self.guild_id, page)
+            # キューが縮んだ場合は最終ページに合わせる
+            if page > self.total_pages:
+                page = self.total_pages
+                embed, self.total = await self.build_page(self.bot, self.guild_id, page)
+
+            self.page = page
+            self._update_buttons()
+            await interaction.response.edit_message(embed=embed, view=self)
+        except Exception as e:
+            self.bot.logger.error(f"Queue page error: {e}")
+            await interaction.response.send_message("❌ キューの表示に失敗しました", ephemeral=True)
+
+
 class MusicCog(commands.Cog):
     """音楽システムCog - Lunaパターン準拠"""
 
@@ -455,12 +527,21 @@ class MusicCog(commands.Cog):
                 self.spotify_extractor = None
                 self.logger.info("Spotify integration disabled (credentials not configured)")
 
+            # ローカル音声キャッシュ（オプトイン）
+            if self.config.music_cache_enabled:
+                self.audio_cache = container.audio_cache()
+                self.logger.info("Audio disk cache enabled via DI")
+            else:
+                self.audio_cache = None
+
             # MusicServiceを手動で作成（DIの循環依存を回避）
             self.music_service = MusicService(
                 database_manager=self.database,
                 event_bus=self.event_bus,
                 youtube_extractor=self.youtube_extractor,
-                spotify_extractor=self.spotify_extractor
+                spotify_extractor=self.spotify_extractor,
+                audio_cache=self.audio_cache,
+                metrics=container.metrics_observer()
             )
 
         except Exception as e:
@@ -599,16 +680,46 @@ class MusicCog(commands.Cog):
             embed = EmbedBuilder.create_error_embed("ループ設定エラー", "ループモードの変更に失敗しました")
             await interaction.followup.send(embed=embed)
 
+    @app_commands.command(name="queue", description="再生待ちのキューを表示します")
+    @app_commands.describe(page="表示するページ番号")
+    async def queue(self, interaction: discord.Interaction, page: Optional[int] = 1):
+        """キュー表示コマンド（ページ単位で取得）"""
+        await interaction.response.defer()
+
+        try:
+            page = max(page or 1, 1)
+            embed, total = await QueuePageView.build_page(self.bot, interaction.guild.id, page)
+
+            if total == 0:
+                await interaction.followup.send(embed=embed)
+                return
+
+            view = QueuePageView(self.bot, interaction.guild.id, interaction.user.id, total, page)
+            if page > view.total_pages:
+                view.page = view.total_pages
+                view._update_buttons()
+                embed, view.total = await QueuePageView.build_page(self.bot, interaction.guild.id, view.page)
+
+            await interaction.followup.send(embed=embed, view=view)
+
+        except Exception as e:
+            self.logger.error(f"Queue command error: {e}")
+            embed = EmbedBuilder.create_error_embed("キュー表示エラー", "キューの取得に失敗しました")
+            await interaction.followup.send(embed=embed)
+
     async def _display_music_player(self, message: discord.WebhookMessage, guild_id: int):
         """統合音楽プレイヤー表示"""
         try:
             # 現在の状態取得
-            track_data = await self.music_service.get_current_track(guild_id)
-            session_data = await self.music_service.get_session_info(guild_id)
-            queue_data = await self.music_service.get_queue(guild_id)
+            snapshot = await self.music_service.get_player_snapshot(guild_id)
+            if not snapshot or not snapshot.has_track:
+                # 表示前に再生が終了・失敗した場合もローディングメッセージは置き換える
+                embed = EmbedBuilder.create_warning_embed("再生できませんでした", "再生中の音楽がありません")
+                await message.edit(embed=embed, view=None)
+                return
 
             # 統合プレイヤーEmbed作成
-            embed = EmbedBuilder.create_music_player_embed(track_data, session_data, queue_data)
+            embed = MusicPlayerView.build_player_embed(snapshot)
             view = MusicPlayerView(self.bot, guild_id)
 
             # ローディングメッセージを置き換え
@@ -620,26 +731,28 @@ class MusicCog(commands.Cog):
             # EventBus通知
             await self.event_bus.emit_event("music_player_displayed", {
                 "guild_id": guild_id,
-                "track_title": track_data.get('title', 'Unknown'),
+                "track_title": snapshot.title,
                 "message_id": message.id
             })
 
         except Exception as e:
             self.logger.error(f"Music player display error: {e}")
+            try:
+                embed = EmbedBuilder.create_error_embed("プレイヤー表示エラー", "音楽プレイヤーの表示に失敗しました")
+                await message.edit(embed=embed, view=None)
+            except discord.HTTPException:
+                pass
 
     async def _display_music_player_refresh(self, channel, guild_id: int):
         """音楽プレイヤーをチャンネルの下に新しく表示（UI更新用）"""
         try:
             # 現在の状態取得
-            track_data = await self.music_service.get_current_track(guild_id)
-            session_data = await self.music_service.get_session_info(guild_id)
-            queue_data = await self.music_service.get_queue(guild_id)
-
-            if not track_data:
+            snapshot = await self.music_service.get_player_snapshot(guild_id)
+            if not snapshot or not snapshot.has_track:
                 return
 
             # 統合プレイヤーEmbed作成
-            embed = EmbedBuilder.create_music_player_embed(track_data, session_data, queue_data)
+            embed = MusicPlayerView.build_player_embed(snapshot)
             view = MusicPlayerView(self.bot, guild_id)
 
             # チャンネルに新しいメッセージとして送信
@@ -651,7 +764,7 @@ class MusicCog(commands.Cog):
             # EventBus通知
             await self.event_bus.emit_event("music_player_refreshed", {
                 "guild_id": guild_id,
-                "track_title": track_data.get('title', 'Unknown'),
+                "track_title": snapshot.title,
                 "message_id": new_message.id
             })
 
@@ -717,6 +830,10 @@ class MusicCog(commands.Cog):
             # MusicPlayerViewの全タスク停止
             MusicPlayerView.cleanup_all_tasks()
 
+            # 音声キャッシュのダウンロード停止・インデックス保存
+            if self.music_service.audio_cache:
+                await self.music_service.audio_cache.shutdown()
+
             self.logger.info("MusicCog cleanup completed")
 
         except Exception as e:
@@ -965,7 +1082,7 @@ class MusicCog(commands.Cog):
             voice_channel=interaction.user.voice.channel
         )
 
-        if existing_player and existing_player.is_playing():
+        if existing_player and existing_player.is_active():
             # キューに追加 + UI更新
             embed = EmbedBuilder.create_success_embed(
                 "キューに追加",
@@ -1003,7 +1120,7 @@ class MusicCog(commands.Cog):
         )
 
         # プレイヤーが停止中なら開始
-        if not existing_player or not existing_player.is_playing():
+        if not existing_player or not existing_player.is_active():
             await self.music_service.start_player(interaction.guild.id)
 
         return added_track_info
@@ -1011,7 +1128,7 @@ class MusicCog(commands.Cog):
     async def _update_player_ui_if_needed(self, interaction: discord.Interaction):
         """必要に応じてプレイヤーUIを更新"""
         existing_player = self.music_service.get_player(interaction.guild.id)
-        if existing_player and existing_player.is_playing():
+        if existing_player and existing_player.is_active():
             # 古いプレイヤーUIを削除して新しいUIを下に表示
             await MusicPlayerView.cleanup_old_player_ui(interaction.guild.id)
             await self._display_music_player_refresh(interaction.channel, interaction.guild.id)
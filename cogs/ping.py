@@ -96,14 +96,63 @@ class PingCog(commands.Cog):
         # EventBus メモリ統計
         try:
             event_stats = self.bot.event_bus.get_memory_stats()
+            value = f"**処理済み:** {event_stats['total_events_processed']:,}\n**履歴:** {event_stats['current_history_size']:,}/{event_stats['max_history_size']:,} ({UserFormatter.format_file_size(event_stats['history_bytes'] + event_stats['index_bytes'])})\n**破棄済み:** {event_stats['events_discarded']:,}"
+            dispatch_stats = self.bot.event_bus.get_dispatch_stats()
+            if dispatch_stats:
+                queued = sum(stats["queued"] for stats in dispatch_stats.values())
+                dropped = sum(stats["dropped"] + stats["sampled_out"] for stats in dispatch_stats.values())
+                max_lag = max(stats["lag_max_ms"] for stats in dispatch_stats.values())
+                value += f"\n**キュー:** {queued:,} (取りこぼし: {dropped:,})\n**最大遅延:** {max_lag:.1f}ms"
             embed.add_field(
                 name="📊 イベントバス統計",
-                value=f"**処理済み:** {event_stats['total_events_processed']:,}\n**メモリ使用:** {event_stats['memory_efficiency']}\n**破棄済み:** {event_stats['events_discarded']:,}",
+                value=value,
                 inline=True
             )
         except Exception:
             pass
 
+        # イベントループの健全性
+        try:
+            loop_monitor = getattr(self.bot, 'loop_monitor', None)
+            if loop_monitor:
+                loop_stats = loop_monitor.get_stats(top_tasks=3)
+                top_tasks = "\n".join(f"`{name}` ×{count}" for name, count in loop_stats['top_tasks'])
+                embed.add_field(
+                    name="🔄 イベントループ",
+                    value=f"**遅延:** {loop_stats['lag_ms']:.1f}ms (p99: {loop_stats['lag_p99_ms']:.0f}ms / 最大: {loop_stats['lag_max_ms']:.0f}ms)\n**ブロック検出:** {loop_stats['stalls']:,}回\n**タスク数:** {loop_stats['tasks']:,}\n{top_tasks}",
+                    inline=True
+                )
+        except Exception:
+            pass
+
+        # 音声キャッシュ統計（有効な場合のみ）
+        try:
+            music_service = getattr(self.bot, 'music_service', None)
+            audio_cache = getattr(music_service, 'audio_cache', None)
+            if audio_cache:
+                cache_stats = audio_cache.get_stats()
+                embed.add_field(
+                    name="💿 音声キャッシュ",
+                    value=f"**ヒット率:** {cache_stats['hit_rate']:.1f}% ({cache_stats['hits']:,}/{cache_stats['hits'] + cache_stats['misses']:,})\n**保存数:** {cache_stats['entries']:,}曲\n**使用量:** {UserFormatter.format_file_size(cache_stats['total_bytes'])}",
+                    inline=True
+                )
+        except Exception:
+            pass
+
+        # ログ送信バッファ統計
+        try:
+            logging_cog = self.bot.get_cog("LoggingCog")
+            if logging_cog:
+                outbox_stats = logging_cog.outbox.get_stats()
+                store_stats = logging_cog.messages.get_stats()
+                embed.add_field(
+                    name="📨 ログ送信",
+                    value=f"**送信メッセージ:** {outbox_stats['messages_sent']:,}\n**削減メッセージ:** {outbox_stats['messages_saved']:,}\n**要約件数:** {outbox_stats['embeds_summarized']:,}\n**内容ストア:** {store_stats['messages']:,}件 ({UserFormatter.format_file_size(store_stats['approx_bytes'])})",
+                    inline=True
+                )
+        except Exception:
+            pass
+
         # 翻訳サービス状態チェック（設定で有効な場合のみ）
         try:
             if getattr(self.bot.settings, 'features_translation', False):
@@ -146,6 +195,53 @@ class PingCog(commands.Cog):
         # パフォーマンスログ
         self.logger.info(f"Ping command executed - API: {api_latency}ms, Message: {message_latency}ms, DB: {db_latency}ms")
 
+    @app_commands.command(name="perf", description="コマンド・リスナーの実行時間の統計を表示します")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.describe(sort="並び順", reset="表示後に集計をリセットする")
+    @app_commands.choices(sort=[
+        app_commands.Choice(name="合計時間", value="total_ms"),
+        app_commands.Choice(name="平均時間", value="avg_ms"),
+        app_commands.Choice(name="p95", value="p95_ms"),
+        app_commands.Choice(name="CPU時間", value="avg_cpu_ms"),
+        app_commands.Choice(name="エラー数", value="errors")
+    ])
+    async def perf(self, interaction: discord.Interaction, sort: str = "total_ms", reset: bool = False):
+        profiler = getattr(self.bot, "profiler", None)
+        if profiler is None:
+            embed = EmbedBuilder.create_warning_embed("計測無効", "設定の metrics.handler_timing が無効です")
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        stats = profiler.get_stats(sort_by=sort, limit=15)
+        if not stats:
+            embed = EmbedBuilder.create_info_embed("ハンドラー統計", "まだ計測データがありません")
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        # 名前・回数・平均・p95・平均CPU・平均待機・エラー（時間はms）
+        lines = [f"{'handler':<24}{'calls':>6}{'avg':>8}{'p95':>8}{'cpu':>7}{'wait':>8}{'err':>5}"]
+        for item in stats:
+            name = item["name"] if len(item["name"]) <= 23 else item["name"][:22] + "…"
+            lines.append(
+                f"{name:<24}{item['calls']:>6}{item['avg_ms']:>8.1f}{item['p95_ms']:>8.0f}"
+                f"{item['avg_cpu_ms']:>7.1f}{item['avg_awaited_ms']:>8.1f}{item['errors']:>5}"
+            )
+
+        embed = EmbedBuilder.create_base_embed(
+            title="⏱️ ハンドラー実行時間",
+            description="```\n" + "\n".join(lines) + "\n```"
+        )
+        embed.add_field(
+            name="見方",
+            value="**cpu:** イベントループ上でのCPU時間 / **wait:** await中の時間\ncpu が大きいハンドラーはループをブロックしています",
+            inline=False
+        )
+        EmbedBuilder.set_footer_with_user(embed, interaction.user, "Performance Monitor")
+
+        if reset:
+            profiler.reset()
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
 
 async def setup(bot):
     await bot.add_cog(PingCog(bot))
\ No newline at end of file
@@ -215,8 +215,16 @@ class EmbedBuilder:
         return embed
 
     @staticmethod
-    def create_music_player_embed(track: Dict, session: Dict, queue: List[Dict]) -> discord.Embed:
-        """統合音楽プレイヤーEmbed (セッション情報なし版)"""
+    def create_music_player_embed(
+        track: Dict,
+        session: Dict,
+        queue: List[Dict],
+        queue_total: Optional[int] = None
+    ) -> discord.Embed:
+        """統合音楽プレイヤーEmbed (セッション情報なし版)
+
+        queue_total: queueが先頭のみの場合のキュー総数（省略時はlen(queue)）
+        """
         from .user_formatter import UserFormatter
 
         # ステータス判定
@@ -254,6 +262,7 @@ class EmbedBuilder:
 """
 
         # 📋 キュー情報 (次の3曲のみ)
+        queue_length = queue_total if queue_total is not None else len(queue)
         if queue:
             next_tracks = queue[:3]
             queue_text = ""
@@ -263,11 +272,11 @@ class EmbedBuilder:
                     title = title[:30] + "..."
                 queue_text += f"`{i}.` {title}\n"
 
-            if len(queue) > 3:
-                queue_text += f"... 他 {len(queue) - 3} 曲"
+            if queue_length > 3:
+                queue_text += f"... 他 {queue_length - 3} 曲"
 
             embed.add_field(
-                name=f"📋 次の曲 ({len(queue)}曲キュー待ち)",
+                name=f"📋 次の曲 ({queue_length}曲キュー待ち)",
                 value=queue_text,
                 inline=False
             )
@@ -319,31 +328,43 @@ class EmbedBuilder:
         return embed
 
     @staticmethod
-    def create_queue_embed(queue_items: List[Dict], page: int = 1) -> discord.Embed:
-        """キュー表示用Embed"""
-        if not queue_items:
+    def create_queue_embed(
+        queue_items: List[Dict],
+        page: int = 1,
+        total_count: Optional[int] = None,
+        items_per_page: int = 10
+    ) -> discord.Embed:
+        """キュー表示用Embed
+
+        total_count指定時はqueue_itemsを表示ページ分のみとして扱う（サーバー側ページング）
+        """
+        total = total_count if total_count is not None else len(queue_items)
+        if total == 0:
             return EmbedBuilder.create_info_embed(
                 "キュー",
                 "現在キューは空です"
             )
 
-        items_per_page = 10
-        total_pages = (len(queue_items) + items_per_page - 1) // items_per_page
+        total_pages = (total + items_per_page - 1) // items_per_page
         start_idx = (page - 1) * items_per_page
-        end_idx = start_idx + items_per_page
+
+        if total_count is None:
+            page_items = queue_items[start_idx:start_idx + items_per_page]
+        else:
+            page_items = queue_items
 
         embed = EmbedBuilder.create_base_embed(
             title=f"{UIEmojis.QUEUE} 音楽キュー",
             color=UIColors.MUSIC_QUEUE
         )
 
+        from .user_formatter import UserFormatter
         queue_text = ""
-        for i, track in enumerate(queue_items[start_idx:end_idx], start=start_idx + 1):
-            from .user_formatter import UserFormatter
+        for i, track in enumerate(page_items, start=start_idx + 1):
             duration = UserFormatter.format_duration(track['duration'])
             queue_text += f"`{i}.` **{track['title']}** - {track['artist']} `[{duration}]`\n"
 
         embed.description = queue_text
-        embed.set_footer(text=f"ページ {page}/{total_pages} | 総曲数: {len(queue_items)}")
+        embed.set_footer(text=f"ページ {page}/{total_pages} | 総曲数: {total}")
 
-        return embed
\ No newline at end of file
+        return embed
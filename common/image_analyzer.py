@@ -7,11 +7,14 @@ asyncio.to_thread を使用してイベントループをブロックしない
 
 import aiohttp
 import asyncio
-from PIL import Image
 from io import BytesIO
-from typing import Dict, Any, Optional, List, Tuple
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 import logging
 
+if TYPE_CHECKING:
+    # PIL は解析時（スレッドプール上）に読み込む（起動時間短縮）
+    from PIL import Image
+
 
 class ImageAnalyzer:
     """画像解析のための汎用クラス"""
@@ -51,6 +54,8 @@ class ImageAnalyzer:
 
     def _analyze_image_data_sync(self, image_data: bytes) -> Dict[str, Any]:
         """画像データから詳細情報を抽出（同期版 - スレッドプールで実行）"""
+        from PIL import Image
+
         image = Image.open(BytesIO(image_data))
 
         info = {
@@ -75,8 +80,10 @@ class ImageAnalyzer:
             self.logger.error(f"Image data analysis failed: {e}")
             return {}
 
-    def _extract_dominant_color_sync(self, image: Image.Image) -> str:
+    def _extract_dominant_color_sync(self, image: "Image.Image") -> str:
         """画像から主要色を抽出（同期版 - スレッドプールで実行）"""
+        from PIL import Image
+
         try:
             # パフォーマンス最適化: アスペクト比を保持しつつ最適サイズにリサイズ
             # 高品質リサンプリングアルゴリズムを使用
@@ -122,7 +129,7 @@ class ImageAnalyzer:
             self.logger.error(f"Color extraction failed: {e}")
             return "#808080"
 
-    async def _extract_dominant_color(self, image: Image.Image) -> str:
+    async def _extract_dominant_color(self, image: "Image.Image") -> str:
         """画像から主要色を抽出（非同期版 - イベントループをブロックしない）"""
         try:
             # 同期処理をスレッドプールで実行してイベントループをブロックしない
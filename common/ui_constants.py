@@ -31,6 +31,7 @@ class UIColors:
         # メッセージ関連
         LogType.MESSAGE_DELETE: discord.Color.red(),
         LogType.MESSAGE_EDIT: discord.Color.orange(),
+        LogType.MESSAGE_BULK_DELETE: discord.Color.dark_red(),
 
         # メンバー関連
         LogType.MEMBER_JOIN: discord.Color.green(),
@@ -136,6 +137,7 @@ class UIEmojis:
         # メッセージ関連
         LogType.MESSAGE_DELETE: "🗑️",
         LogType.MESSAGE_EDIT: "✏️",
+        LogType.MESSAGE_BULK_DELETE: "🧹",
 
         # メンバー関連
         LogType.MEMBER_JOIN: "📥",
@@ -3,7 +3,10 @@ from .settings import Settings
 from .container import Container, container
 from .command import Command, CommandInvoker
 from .factory import LunaCogFactory, ComponentFactory
-from .observer import EventBus, Observer, LoggingObserver, MetricsObserver
+from .observer import EventBus, EventRecord, Observer, LoggingObserver, MetricsObserver, OverflowPolicy, Subscription
+from .journal import EventJournal
+from .instrumentation import HandlerProfiler
+from .loop_monitor import LoopMonitor
 
 # DI aliases
 from dependency_injector.wiring import Provide, inject
@@ -24,7 +27,8 @@ __all__ = [
     'Container', 'container',
     'Command', 'CommandInvoker',
     'LunaCogFactory', 'ComponentFactory',
-    'EventBus', 'Observer', 'LoggingObserver', 'MetricsObserver',
+    'EventBus', 'EventRecord', 'Observer', 'LoggingObserver', 'MetricsObserver', 'OverflowPolicy', 'Subscription',
+    'EventJournal', 'HandlerProfiler', 'LoopMonitor',
     'ConfigDep', 'DatabaseDep', 'EventBusDep', 'CogFactoryDep',
     'inject_dependencies'
 ]
\ No newline at end of file
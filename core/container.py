@@ -4,22 +4,63 @@ from dependency_injector.wiring import Provide, inject
 from .settings import Settings
 from database.manager import DatabaseManager
 from .observer import EventBus, LoggingObserver, MetricsObserver
+from .journal import EventJournal
+from .instrumentation import HandlerProfiler
+from .loop_monitor import LoopMonitor
 from .factory import LunaCogFactory, ComponentFactory
-from music.youtube_extractor import YouTubeExtractor
-from music.spotify_extractor import SpotifyExtractor
-from music.music_service import MusicService
-from translation.deepl_extractor import DeepLExtractor
-from translation.translation_service import TranslationService
+
+
+# 音楽・翻訳システムは重い依存（yt_dlp, spotipy, deepl）を持つため、
+# モジュールの読み込みをプロバイダーの初回呼び出しまで遅延する（無効な機能では読み込まれない）
+
+def _create_youtube_extractor(**kwargs):
+    from music.youtube_extractor import YouTubeExtractor
+    return YouTubeExtractor(**kwargs)
+
+
+def _create_spotify_extractor(**kwargs):
+    from music.spotify_extractor import SpotifyExtractor
+    return SpotifyExtractor(**kwargs)
+
+
+def _create_audio_cache(**kwargs):
+    from music.audio_cache import AudioCache
+    return AudioCache(**kwargs)
+
+
+def _create_music_service(**kwargs):
+    from music.music_service import MusicService
+    return MusicService(**kwargs)
+
+
+def _create_deepl_extractor(**kwargs):
+    from translation.deepl_extractor import DeepLExtractor
+    return DeepLExtractor(**kwargs)
+
+
+def _create_translation_service(**kwargs):
+    from translation.translation_service import TranslationService
+    return TranslationService(**kwargs)
 
 
 def _setup_event_bus(event_bus: EventBus, logging_observer: LoggingObserver,
-                     metrics_observer: MetricsObserver) -> EventBus:
-    """イベントバスにオブザーバーを自動アタッチ"""
+                     metrics_observer: MetricsObserver, event_journal, journal_enabled: bool) -> EventBus:
+    """イベントバスにオブザーバーを自動アタッチ（ジャーナルは有効な場合のみ作成）"""
     event_bus.attach(logging_observer)
     event_bus.attach(metrics_observer)
+    if journal_enabled:
+        event_bus.attach(event_journal())
     return event_bus
 
 
+async def _replay_event_journal(event_journal, metrics_observer: MetricsObserver,
+                                journal_enabled: bool, replay: bool) -> int:
+    """前回までのジャーナルからイベント集計を復元"""
+    if not (journal_enabled and replay):
+        return 0
+    return await event_journal().replay([metrics_observer])
+
+
 async def _initialize_database(database_manager: DatabaseManager) -> DatabaseManager:
     """データベースの非同期初期化"""
     await database_manager.initialize()
@@ -32,10 +73,29 @@ class Container(containers.DeclarativeContainer):
     # 設定プロバイダー
     config = providers.Singleton(Settings)
 
+    # メトリクス（イベント集計 + 各モジュールのレイテンシ）
+    metrics_observer = providers.Singleton(MetricsObserver)
+
+    # コマンド・リスナーの実行時間計測
+    handler_profiler = providers.Singleton(HandlerProfiler, metrics=metrics_observer)
+
+    # イベントループの健全性監視
+    loop_monitor = providers.Singleton(
+        LoopMonitor,
+        metrics=metrics_observer,
+        interval=config.provided.metrics_loop_lag_interval,
+        slow_callback_threshold=config.provided.metrics_slow_callback_threshold,
+        census_interval=config.provided.metrics_task_census_interval,
+        task_warn_threshold=config.provided.metrics_task_warn_threshold,
+        asyncio_debug=config.provided.metrics_asyncio_debug
+    )
+
     # データベースプロバイダー（非同期初期化付き）
     database_manager_raw = providers.Singleton(
         DatabaseManager,
-        database_path=config.provided.database_path
+        database_path=config.provided.database_path,
+        archive_directory=config.provided.logger_archive_directory,
+        metrics=metrics_observer
     )
 
     database_manager = providers.Resource(
@@ -46,12 +106,26 @@ class Container(containers.DeclarativeContainer):
     # イベントバスプロバイダー
     event_bus = providers.Singleton(
         EventBus,
-        max_history_size=config.provided.eventbus_max_history_size
+        max_history_size=config.provided.eventbus_max_history_size,
+        async_dispatch=config.provided.eventbus_async_dispatch,
+        queue_size=config.provided.eventbus_queue_size,
+        overflow_policy=config.provided.eventbus_overflow_policy
     )
 
     # オブザーバープロバイダー
-    logging_observer = providers.Singleton(LoggingObserver)
-    metrics_observer = providers.Singleton(MetricsObserver)
+    logging_observer = providers.Singleton(
+        LoggingObserver,
+        level=config.provided.eventbus_log_level,
+        sample_threshold=config.provided.eventbus_log_sample_threshold,
+        sample_every=config.provided.eventbus_log_sample_every
+    )
+    event_journal = providers.Singleton(
+        EventJournal,
+        directory=config.provided.eventbus_journal_directory,
+        max_segment_bytes=config.provided.eventbus_journal_segment_size,
+        max_segments=config.provided.eventbus_journal_max_segments,
+        fsync_interval=config.provided.eventbus_journal_fsync_interval
+    )
 
     # ファクトリープロバイダー
     cog_factory = providers.Singleton(LunaCogFactory)
@@ -62,35 +136,56 @@ class Container(containers.DeclarativeContainer):
         _setup_event_bus,
         event_bus=event_bus,
         logging_observer=logging_observer,
-        metrics_observer=metrics_observer
+        metrics_observer=metrics_observer,
+        event_journal=event_journal.provider,
+        journal_enabled=config.provided.eventbus_journal_enabled
+    )
+
+    event_journal_replay = providers.Resource(
+        _replay_event_journal,
+        event_journal=event_journal.provider,
+        metrics_observer=metrics_observer,
+        journal_enabled=config.provided.eventbus_journal_enabled,
+        replay=config.provided.eventbus_journal_replay
     )
 
     # 音楽システムプロバイダー
-    youtube_extractor = providers.Singleton(YouTubeExtractor)
+    youtube_extractor = providers.Singleton(_create_youtube_extractor, metrics=metrics_observer)
 
     spotify_extractor = providers.Singleton(
-        SpotifyExtractor,
+        _create_spotify_extractor,
         client_id=config.provided.spotify_client_id,
-        client_secret=config.provided.spotify_client_secret
+        client_secret=config.provided.spotify_client_secret,
+        youtube_extractor=youtube_extractor
+    )
+
+    audio_cache = providers.Singleton(
+        _create_audio_cache,
+        cache_dir=config.provided.music_cache_directory,
+        max_size_bytes=config.provided.music_cache_max_size,
+        min_plays=config.provided.music_cache_min_plays,
+        youtube_extractor=youtube_extractor
     )
 
     music_service = providers.Singleton(
-        MusicService,
+        _create_music_service,
         database_manager=database_manager_raw,
         event_bus=event_bus,
         youtube_extractor=youtube_extractor,
-        spotify_extractor=spotify_extractor
+        spotify_extractor=spotify_extractor,
+        metrics=metrics_observer
     )
 
     # 翻訳システムプロバイダー
     deepl_extractor = providers.Singleton(
-        DeepLExtractor,
+        _create_deepl_extractor,
         api_key=config.provided.deepl_api_key,
-        is_pro=config.provided.deepl_is_pro
+        is_pro=config.provided.deepl_is_pro,
+        metrics=metrics_observer
     )
 
     translation_service = providers.Singleton(
-        TranslationService,
+        _create_translation_service,
         deepl_extractor=deepl_extractor,
         event_bus=event_bus
     )
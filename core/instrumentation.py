@@ -0,0 +1,189 @@
+import functools
+import logging
+import time
+import types
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+from discord import app_commands
+from discord.ext import commands
+
+from .metrics import DEFAULT_BUCKETS, HistogramValue
+
+
+@types.coroutine
+def _run_timed(coro: Coroutine, timing: List[float]):
+    """
+    コルーチンを1ステップずつ進め、イベントループ上での実行時間とCPU時間を timing に加算
+
+    timing[0]: ループ上で実行していた時間（壁時計）、timing[1]: そのうちのCPU時間
+    待機（await）中の時間は含まない
+    """
+    value, error = None, None
+    while True:
+        step_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            future = coro.send(value) if error is None else coro.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        finally:
+            timing[0] += time.perf_counter() - step_start
+            timing[1] += time.thread_time() - cpu_start
+
+        try:
+            value, error = (yield future), None
+        except GeneratorExit:
+            coro.close()
+            raise
+        except BaseException as e:
+            # キャンセルなどは元のコルーチンへそのまま伝える
+            value, error = None, e
+
+
+class HandlerStats:
+    """ハンドラー1つ分の計測値"""
+
+    __slots__ = ("kind", "name", "calls", "errors", "wall_total", "wall_max",
+                 "awaited_total", "cpu_total", "histogram", "_metrics")
+
+    def __init__(self, kind: str, name: str, metrics: Optional[tuple] = None):
+        self.kind = kind
+        self.name = name
+        self._metrics = metrics
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.wall_total = 0.0
+        self.wall_max = 0.0
+        self.awaited_total = 0.0
+        self.cpu_total = 0.0
+        self.histogram = HistogramValue(DEFAULT_BUCKETS)
+
+    def record(self, wall: float, on_loop: float, cpu: float, failed: bool) -> None:
+        awaited = max(0.0, wall - on_loop)
+        self.calls += 1
+        self.wall_total += wall
+        self.wall_max = max(self.wall_max, wall)
+        self.awaited_total += awaited
+        self.cpu_total += cpu
+        self.histogram.observe(wall)
+        if failed:
+            self.errors += 1
+
+        if self._metrics:
+            seconds, cpu_seconds, awaited_seconds, errors = self._metrics
+            seconds.observe(wall)
+            cpu_seconds.inc(cpu)
+            awaited_seconds.inc(awaited)
+            if failed:
+                errors.inc()
+
+    def as_dict(self) -> Dict[str, Any]:
+        calls = self.calls or 1
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": self.wall_total * 1000,
+            "avg_ms": self.wall_total / calls * 1000,
+            "p95_ms": self.histogram.quantile(0.95) * 1000,
+            "max_ms": self.wall_max * 1000,
+            "avg_cpu_ms": self.cpu_total / calls * 1000,
+            "avg_awaited_ms": self.awaited_total / calls * 1000
+        }
+
+
+class HandlerProfiler:
+    """
+    Cogのアプリコマンド・ハイブリッドコマンド・リスナーの実行時間を自動計測
+
+    - instrument_cog() でCogのハンドラーを計測用のラッパーに差し替える（add_cog前に呼ぶ）
+    - ハンドラーごとに壁時計時間・待機時間・CPU時間・エラー数を集計
+    - metrics を渡すと luna_handler_* としてメトリクスにも出力
+    """
+
+    def __init__(self, metrics=None):
+        self.metrics = metrics
+        self.logger = logging.getLogger(__name__)
+        self._stats: Dict[str, HandlerStats] = {}
+
+    def _get_stats(self, kind: str, name: str) -> HandlerStats:
+        key = f"{kind}:{name}"
+        stats = self._stats.get(key)
+        if stats is None:
+            metric_children = None
+            if self.metrics is not None:
+                labels = (kind, name)
+                metric_children = (
+                    self.metrics.histogram("handler_seconds", "Handler wall time", ("kind", "handler")).labels(*labels),
+                    self.metrics.counter("handler_cpu_seconds_total", "Handler CPU time on the event loop",
+                                         ("kind", "handler")).labels(*labels),
+                    self.metrics.counter("handler_awaited_seconds_total", "Handler time spent awaiting",
+                                         ("kind", "handler")).labels(*labels),
+                    self.metrics.counter("handler_errors_total", "Handler invocations that raised",
+                                         ("kind", "handler")).labels(*labels)
+                )
+            stats = self._stats[key] = HandlerStats(kind, name, metric_children)
+        return stats
+
+    def wrap(self, kind: str, name: str, func: Callable[..., Coroutine]) -> Callable[..., Coroutine]:
+        """コルーチン関数を計測用のラッパーで包む（二重には包まない）"""
+        if getattr(func, "__luna_timed__", False):
+            return func
+        stats = self._get_stats(kind, name)
+
+        @functools.wraps(func)
+        async def timed(*args, **kwargs):
+            timing = [0.0, 0.0]
+            failed = False
+            start = time.perf_counter()
+            try:
+                return await _run_timed(func(*args, **kwargs), timing)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                stats.record(time.perf_counter() - start, timing[0], timing[1], failed)
+
+        timed.__luna_timed__ = True
+        return timed
+
+    def instrument_cog(self, cog: commands.Cog) -> int:
+        """Cogのコマンド・リスナーを計測対象にする（差し替えた数を返す）"""
+        wrapped = 0
+
+        # テキスト/ハイブリッドコマンド（ハイブリッドはスラッシュ側の呼び出しも別に包む）
+        for command in cog.walk_commands():
+            command._callback = self.wrap("command", command.qualified_name, command._callback)
+            wrapped += 1
+            app_command = getattr(command, "app_command", None)
+            if isinstance(app_command, app_commands.Command):
+                app_command._callback = self.wrap("command", command.qualified_name, app_command._callback)
+
+        # スラッシュコマンド（グループは配下のコマンドのみ）
+        for command in cog.walk_app_commands():
+            if isinstance(command, app_commands.Command):
+                command._callback = self.wrap("app_command", command.qualified_name, command._callback)
+                wrapped += 1
+
+        # リスナー: インスタンス属性で上書きすると add_cog 時にラッパーが登録される
+        for event_name, method_name in cog.__cog_listeners__:
+            method = getattr(cog, method_name)
+            setattr(cog, method_name, self.wrap("listener", f"{cog.qualified_name}.{method_name}", method))
+            wrapped += 1
+
+        self.logger.debug(f"Instrumented {wrapped} handlers in {cog.qualified_name}")
+        return wrapped
+
+    def get_stats(self, sort_by: str = "total_ms", limit: int = 0) -> List[Dict[str, Any]]:
+        """呼び出し済みのハンドラーの統計を指定項目の降順で取得"""
+        stats = [stats.as_dict() for stats in self._stats.values() if stats.calls]
+        stats.sort(key=lambda item: item.get(sort_by, 0), reverse=True)
+        return stats[:limit] if limit > 0 else stats
+
+    def reset(self) -> None:
+        """集計をリセット（メトリクスの累積値はそのまま）"""
+        for stats in self._stats.values():
+            stats.reset()
@@ -0,0 +1,220 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, TextIO, Tuple
+
+from .observer import EventRecord, Observer
+
+
+class EventJournal(Observer):
+    """
+    EventBus のイベントをディスクに残す追記専用ジャーナル
+
+    設計:
+    - オブザーバーとして全イベントを受け取り、バッファしてまとめて書き込む
+    - 1行1イベントのJSONL（[id, 壁時計時刻, イベント名, データ] の配列）
+    - セグメントファイル（events-000001.jsonl）がサイズ上限を超えたら次へ切り替え、
+      古いセグメントは max_segments を超えた分から削除
+    - fsync は fsync_interval 秒に1回まで（クラッシュ時に失うのは最大でその間の分）
+    - 起動ごとに新しいセグメントから書き始めるため、replay() は前回までの分だけを読む
+    - メインのSQLiteデータベースは使用しない
+    """
+
+    SEGMENT_PATTERN = re.compile(r"^events-(\d{6})\.jsonl$")
+
+    def __init__(self, directory: str, max_segment_bytes: int = 4 * 1024 * 1024, max_segments: int = 16,
+                 flush_interval: float = 1.0, batch_size: int = 256, fsync_interval: float = 5.0):
+        self.directory = Path(directory)
+        self.max_segment_bytes = max(1024, max_segment_bytes)
+        self.max_segments = max(1, max_segments)
+        self.flush_interval = max(0.0, flush_interval)
+        self.batch_size = max(1, batch_size)
+        self.fsync_interval = max(0.0, fsync_interval)
+        self.logger = logging.getLogger(__name__)
+
+        self._buffer: List[str] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        self._file: Optional[TextIO] = None
+        self._last_fsync = 0.0
+        self._closed = False
+
+        # 前回までのセグメントの次の番号から書き始める
+        existing = self._list_segments()
+        self._boot_sequence = (existing[-1][0] + 1) if existing else 1
+        self._sequence = self._boot_sequence
+
+        self._stats = {
+            "events_written": 0,
+            "bytes_written": 0,
+            "fsyncs": 0,
+            "rotations": 0,
+            "write_failures": 0
+        }
+
+    # ===== セグメント =====
+
+    def _list_segments(self) -> List[Tuple[int, Path]]:
+        """(番号, パス) を古い順に列挙"""
+        if not self.directory.exists():
+            return []
+        segments = []
+        for path in self.directory.iterdir():
+            match = self.SEGMENT_PATTERN.match(path.name)
+            if match:
+                segments.append((int(match.group(1)), path))
+        return sorted(segments)
+
+    def _segment_path(self, sequence: int) -> Path:
+        return self.directory / f"events-{sequence:06d}.jsonl"
+
+    # ===== 書き込み =====
+
+    async def update(self, event_type: str, data: Dict[str, Any]) -> None:
+        if self._closed:
+            return
+
+        if isinstance(data, EventRecord):
+            line = [data.id, round(data.wall_timestamp, 3), event_type, data.data]
+        else:
+            line = [None, round(time.time(), 3), event_type, data]
+        self._buffer.append(json.dumps(line, ensure_ascii=False, separators=(",", ":"), default=str))
+
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after())
+
+    async def _flush_after(self) -> None:
+        if self.flush_interval:
+            await asyncio.sleep(self.flush_interval)
+        # close() によるキャンセルで書き込み途中のバッファを失わないよう保護
+        await asyncio.shield(self.flush())
+
+    async def flush(self, sync: bool = False) -> None:
+        """バッファをセグメントへ書き込む（sync=True で即座にfsync）"""
+        async with self._write_lock:
+            lines, self._buffer = self._buffer, []
+            if not lines and not sync:
+                return
+            try:
+                await asyncio.to_thread(self._write, lines, sync)
+            except Exception as e:
+                self._stats["write_failures"] += 1
+                self.logger.error(f"Failed to write {len(lines)} events to journal: {e}")
+
+    def _write(self, lines: List[str], sync: bool) -> None:
+        if self._file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._remove_old_segments()
+            self._file = open(self._segment_path(self._sequence), "a", encoding="utf-8")
+
+        if lines:
+            data = "\n".join(lines) + "\n"
+            self._file.write(data)
+            self._file.flush()
+            self._stats["events_written"] += len(lines)
+            self._stats["bytes_written"] += len(data.encode("utf-8"))
+
+        now = time.monotonic()
+        if sync or now - self._last_fsync >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._last_fsync = now
+            self._stats["fsyncs"] += 1
+
+        if self._file.tell() >= self.max_segment_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        """現在のセグメントを閉じて次へ切り替え（ファイルは次の書き込み時に作成）"""
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        self._sequence += 1
+        self._stats["rotations"] += 1
+
+    def _remove_old_segments(self) -> None:
+        """これから作成するセグメントを含めて max_segments 個になるよう古いものを削除"""
+        segments = [(sequence, path) for sequence, path in self._list_segments() if sequence < self._sequence]
+        for _, path in segments[:max(0, len(segments) - self.max_segments + 1)]:
+            try:
+                path.unlink()
+            except OSError as e:
+                self.logger.warning(f"Failed to remove old journal segment {path.name}: {e}")
+
+    async def close(self) -> None:
+        """残りを書き込み、fsyncしてファイルを閉じる"""
+        if self._closed:
+            return
+        if self._flush_task and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush(sync=True)
+        self._closed = True
+        async with self._write_lock:
+            if self._file is not None:
+                await asyncio.to_thread(self._file.close)
+                self._file = None
+
+    # ===== 再生 =====
+
+    @staticmethod
+    def _read_segment(path: Path) -> List[EventRecord]:
+        records = []
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    event_id, wall_time, event_type, data = json.loads(line)
+                except (ValueError, TypeError):
+                    # クラッシュ時の書きかけの行は読み飛ばす
+                    continue
+                records.append(EventRecord.from_wall_time(event_id, event_type, data, wall_time))
+        return records
+
+    async def replay(self, observers: Iterable[Observer], since: Optional[float] = None,
+                     predicate: Optional[Callable[[str], bool]] = None) -> int:
+        """
+        前回までに記録したイベントを古い順にオブザーバーへ再送
+
+        since: この壁時計時刻（UNIX秒）以降のイベントのみ
+        predicate: イベント名で絞り込み
+        """
+        observers = list(observers)
+        replayed = 0
+        for sequence, path in self._list_segments():
+            if sequence >= self._boot_sequence:
+                break
+
+            try:
+                records = await asyncio.to_thread(self._read_segment, path)
+            except OSError as e:
+                self.logger.warning(f"Failed to read journal segment {path.name}: {e}")
+                continue
+
+            for record in records:
+                if since is not None and record.wall_timestamp < since:
+                    continue
+                if predicate and not predicate(record.type):
+                    continue
+                for observer in observers:
+                    try:
+                        await observer.update(record.type, record)
+                    except Exception as e:
+                        self.logger.error(f"Observer {observer.__class__.__name__} failed to replay event {record.type}: {e}")
+                replayed += 1
+
+        self.logger.info(f"Replayed {replayed} journaled events to {len(observers)} observers")
+        return replayed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ジャーナル統計を取得"""
+        segments = self._list_segments()
+        return {
+            **self._stats,
+            "segments": len(segments),
+            "disk_bytes": sum(path.stat().st_size for _, path in segments if path.exists()),
+            "pending": len(self._buffer)
+        }
@@ -0,0 +1,96 @@
+import atexit
+import gzip
+import logging
+import os
+import queue
+import shutil
+import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Dict, Optional
+
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """
+    サイズ上限でローテーションするファイルハンドラー
+
+    compress=True の場合、ローテーションしたファイルを gzip 圧縮する（luna.log.1.gz, ...）
+    """
+
+    def __init__(self, filename: str, max_bytes: int = 0, backup_count: int = 5, compress: bool = False,
+                 encoding: str = "utf-8"):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding, delay=True)
+        if compress:
+            self.namer = self._gzip_name
+            self.rotator = self._gzip_rotate
+
+    @staticmethod
+    def _gzip_name(name: str) -> str:
+        return f"{name}.gz"
+
+    @staticmethod
+    def _gzip_rotate(source: str, dest: str) -> None:
+        with open(source, "rb") as src, gzip.open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(source)
+
+
+def stop_queue_logging(listener: QueueListener) -> None:
+    """
+    リスナーを停止して残りのログを書き出す（停止済みなら何もしない）
+
+    停止後のログが失われないよう、ルートロガーはリスナーのハンドラーへ直接出力するように戻す
+    """
+    if getattr(listener, "_thread", None) is None:
+        return
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
+    listener.stop()
+    for handler in listener.handlers:
+        root.addHandler(handler)
+
+
+def setup_queue_logging(log_file: str, level: str = "INFO", max_bytes: int = 0, backup_count: int = 5,
+                        compress: bool = False, module_levels: Optional[Dict[str, str]] = None) -> QueueListener:
+    """
+    ルートロガーの出力をキュー経由にする
+
+    - ロガー呼び出し側（イベントループ）はキューに積むだけで、整形とファイル/標準出力への書き込みは
+      QueueListener のスレッドで行う
+    - ファイルは max_bytes でローテーション（0で無効）、backup_count 世代まで保持
+    - module_levels でモジュールごとのログレベルを上書き（例: {"discord": "WARNING"}）
+    - 終了時は stop_queue_logging() で残りを書き出す（呼ばれずに終了した場合に備えて atexit にも登録）
+    """
+    log_path = Path(log_file)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = CompressingRotatingFileHandler(
+        str(log_path), max_bytes=max_bytes, backup_count=backup_count, compress=compress
+    )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+
+    for name, module_level in (module_levels or {}).items():
+        logging.getLogger(name).setLevel(getattr(logging, str(module_level).upper(), logging.NOTSET))
+
+    listener.start()
+    atexit.register(stop_queue_logging, listener)
+    return listener
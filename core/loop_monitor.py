@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
+
+from .metrics import HistogramValue
+
+
+# ループ遅延用のバケット（秒）: 1ms〜10s
+LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _task_name(task: asyncio.Task) -> str:
+    """タスクをコルーチンの修飾名で分類（取得できない場合はタスク名）"""
+    coro = task.get_coro()
+    name = getattr(coro, "__qualname__", None)
+    return name or task.get_name()
+
+
+class LoopMonitor:
+    """
+    イベントループの健全性モニター
+
+    - ティッカー: interval 秒ごとに起床し、予定時刻からの遅れをループ遅延として記録
+    - ウォッチドッグ: 別スレッドからティッカーを監視し、slow_callback_threshold 秒以上
+      起床しない間にループスレッドのスタックを取得（どの処理がブロックしているかを特定）
+    - タスク集計: census_interval 秒ごとに生存タスクをコルーチン名ごとに数える
+      （task_warn_threshold を超えた種類は停止し忘れの可能性として警告）
+    - asyncio_debug=True で asyncio 標準の遅いコールバック報告も有効化（オーバーヘッド大）
+    """
+
+    def __init__(self, metrics=None, interval: float = 0.25, slow_callback_threshold: float = 0.1,
+                 census_interval: float = 60.0, task_warn_threshold: int = 100,
+                 asyncio_debug: bool = False, max_stalls: int = 10):
+        self.interval = max(0.01, interval)
+        self.slow_callback_threshold = max(0.01, slow_callback_threshold)
+        self.census_interval = max(1.0, census_interval)
+        self.task_warn_threshold = task_warn_threshold
+        self.asyncio_debug = asyncio_debug
+        self.logger = logging.getLogger(__name__)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._ticker_task: Optional[asyncio.Task] = None
+        self._census_task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+        # ティッカーが次に起床する予定時刻（ウォッチドッグと共有、floatの代入のみ）
+        self._deadline = 0.0
+        # ウォッチドッグが取得した停止中のスタック（ティッカーが起床時に回収）
+        self._pending_stack: Optional[List[str]] = None
+
+        self._lag = HistogramValue(LAG_BUCKETS)
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        self._stalls: Deque[Dict[str, Any]] = deque(maxlen=max_stalls)
+        self._stall_count = 0
+        self._task_counts: Dict[str, int] = {}
+        self._task_total = 0
+
+        self._metrics = None
+        if metrics is not None:
+            self._metrics = {
+                "lag": metrics.histogram("loop_lag_seconds", "Event loop scheduling delay", buckets=LAG_BUCKETS),
+                "stalls": metrics.counter("loop_stalls_total", "Event loop blocked longer than the slow callback threshold"),
+                "tasks": metrics.gauge("loop_tasks", "Live asyncio tasks by coroutine", ("coroutine",)),
+                "tasks_total": metrics.gauge("loop_tasks_total", "Live asyncio tasks")
+            }
+
+    # ===== 開始・停止 =====
+
+    def start(self) -> None:
+        """実行中のイベントループで監視を開始"""
+        if self._ticker_task is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        if self.asyncio_debug:
+            self._loop.set_debug(True)
+            self._loop.slow_callback_duration = self.slow_callback_threshold
+
+        self._deadline = time.perf_counter() + self.interval
+        self._stop_event.clear()
+        self._ticker_task = asyncio.create_task(self._tick_loop(), name="loop-monitor-ticker")
+        self._census_task = asyncio.create_task(self._census_loop(), name="loop-monitor-census")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor-watchdog", daemon=True)
+        self._watchdog.start()
+        self.logger.info(f"Event loop monitor started (interval: {self.interval}s, "
+                         f"slow callback threshold: {self.slow_callback_threshold}s)")
+
+    async def stop(self) -> None:
+        """監視を停止"""
+        self._stop_event.set()
+        for task in (self._ticker_task, self._census_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._ticker_task = self._census_task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join, 1.0)
+            self._watchdog = None
+
+    # ===== ループ遅延 =====
+
+    async def _tick_loop(self) -> None:
+        while True:
+            self._deadline = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self._record_lag(max(0.0, time.perf_counter() - self._deadline))
+
+    def _record_lag(self, lag: float) -> None:
+        self._last_lag = lag
+        self._max_lag = max(self._max_lag, lag)
+        self._lag.observe(lag)
+        if self._metrics:
+            self._metrics["lag"].observe(lag)
+
+        stack, self._pending_stack = self._pending_stack, None
+        if lag < self.slow_callback_threshold:
+            return
+
+        self._stall_count += 1
+        if self._metrics:
+            self._metrics["stalls"].inc()
+        self._stalls.append({
+            "timestamp": time.time(),
+            "duration_ms": lag * 1000,
+            "stack": stack or []
+        })
+        location = stack[-1].strip().splitlines()[0] if stack else "unknown"
+        self.logger.warning(f"Event loop was blocked for {lag * 1000:.0f}ms at {location}")
+        if stack:
+            self.logger.debug("Blocking stack:\n%s", "".join(stack))
+
+    def _watch(self) -> None:
+        """ウォッチドッグスレッド: ティッカーの起床が遅れている間にループスレッドのスタックを取得"""
+        check_interval = self.slow_callback_threshold / 2
+        captured_deadline = None
+        while not self._stop_event.wait(check_interval):
+            deadline = self._deadline
+            if deadline == captured_deadline:
+                continue
+            if time.perf_counter() - deadline < self.slow_callback_threshold:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._pending_stack = traceback.format_stack(frame)
+            # 同じ停止では1回だけ取得（最初の時点でブロックしている処理を残す）
+            captured_deadline = deadline
+
+    # ===== タスク集計 =====
+
+    async def _census_loop(self) -> None:
+        while True:
+            self.take_census()
+            await asyncio.sleep(self.census_interval)
+
+    def take_census(self) -> Dict[str, int]:
+        """生存タスクをコルーチン名ごとに数える"""
+        counts = Counter(_task_name(task) for task in asyncio.all_tasks(self._loop))
+        previous, self._task_counts = self._task_counts, dict(counts.most_common())
+        self._task_total = sum(counts.values())
+
+        if self._metrics:
+            # 終了したタスクの系列が残らないよう毎回作り直す
+            self._metrics["tasks"].clear()
+            for name, count in counts.items():
+                self._metrics["tasks"].labels(name).set(count)
+            self._metrics["tasks_total"].set(self._task_total)
+
+        # 上限を超えてなお増え続けている種類のみ警告
+        for name, count in counts.items():
+            if count >= self.task_warn_threshold and count > previous.get(name, 0):
+                self.logger.warning(f"{count} live tasks running {name} (possible task leak)")
+        return self._task_counts
+
+    # ===== 統計 =====
+
+    def get_stats(self, top_tasks: int = 5) -> Dict[str, Any]:
+        """ループ遅延・停止・タスク数の統計を取得"""
+        return {
+            "lag_ms": self._last_lag * 1000,
+            "lag_avg_ms": (self._lag.sum / self._lag.count * 1000) if self._lag.count else 0.0,
+            "lag_p99_ms": self._lag.quantile(0.99) * 1000,
+            "lag_max_ms": self._max_lag * 1000,
+            "stalls": self._stall_count,
+            "recent_stalls": list(self._stalls),
+            "tasks": self._task_total,
+            "top_tasks": list(self._task_counts.items())[:top_tasks]
+        }
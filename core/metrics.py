@@ -0,0 +1,262 @@
+import bisect
+import logging
+import math
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from aiohttp import web
+
+
+# レイテンシ計測用の既定バケット（秒）: 1ms〜60s
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class CounterValue:
+    """単調増加するカウンター"""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class GaugeValue:
+    """任意に増減する現在値"""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _HistogramTimer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: "HistogramValue"):
+        self.histogram = histogram
+        self.start = 0.0
+
+    def __enter__(self) -> "_HistogramTimer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.observe(time.perf_counter() - self.start)
+
+
+class HistogramValue:
+    """
+    固定バケットのヒストグラム
+
+    記録時はバケット位置の二分探索と加算のみ行い、累積値は出力時に計算する
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 末尾は +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self) -> _HistogramTimer:
+        """with ブロックの所要時間（秒）を記録"""
+        return _HistogramTimer(self)
+
+    def quantile(self, q: float) -> float:
+        """バケットの上限値による分位点の概算（計測なしは0）"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return math.inf
+
+
+MetricValue = Union[CounterValue, GaugeValue, HistogramValue]
+
+
+class MetricFamily:
+    """
+    同名メトリクスのラベル別の値の集合
+
+    ラベルなしのメトリクスは inc / set / observe / time を直接呼べる
+    ホットパスでは labels() の戻り値を保持しておくと辞書検索も省ける
+    """
+
+    _VALUE_TYPES = {"counter": CounterValue, "gauge": GaugeValue}
+
+    def __init__(self, name: str, metric_type: str, documentation: str,
+                 labelnames: Tuple[str, ...] = (), buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.type = metric_type
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        self._children: Dict[Tuple[str, ...], MetricValue] = {}
+
+    def labels(self, *values: object) -> MetricValue:
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            if self.type == "histogram":
+                child = HistogramValue(self.buckets)
+            else:
+                child = self._VALUE_TYPES[self.type]()
+            self._children[key] = child
+        return child
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self) -> _HistogramTimer:
+        return self.labels().time()
+
+    def samples(self) -> Iterable[Tuple[Tuple[str, ...], MetricValue]]:
+        return self._children.items()
+
+    def clear(self) -> None:
+        self._children.clear()
+
+    def render(self) -> List[str]:
+        """Prometheus テキスト形式の行を生成"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        for values, child in sorted(self._children.items()):
+            pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(self.labelnames, values)]
+            if self.type != "histogram":
+                label_text = "{" + ",".join(pairs) + "}" if pairs else ""
+                lines.append(f"{self.name}{label_text} {_format_value(child.value)}")
+                continue
+
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                bucket_labels = ",".join(pairs + [f'le="{_format_value(bound)}"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {cumulative}")
+            label_text = "{" + ",".join(pairs) + "}" if pairs else ""
+            lines.append(f"{self.name}_sum{label_text} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{label_text} {child.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    カウンター・ゲージ・ヒストグラムの登録簿
+
+    同じ名前で再登録すると既存のメトリクスを返すため、各モジュールは必要な時に取得してよい
+    """
+
+    def __init__(self, namespace: str = "luna"):
+        self.namespace = namespace
+        self._families: Dict[str, MetricFamily] = {}
+
+    def _get_or_create(self, name: str, metric_type: str, documentation: str,
+                       labelnames: Iterable[str], buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> MetricFamily:
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        family = self._families.get(full_name)
+        if family is None:
+            family = MetricFamily(full_name, metric_type, documentation, tuple(labelnames), buckets)
+            self._families[full_name] = family
+        elif family.type != metric_type:
+            raise ValueError(f"Metric {full_name} is already registered as {family.type}")
+        return family
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> MetricFamily:
+        return self._get_or_create(name, "counter", documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> MetricFamily:
+        return self._get_or_create(name, "gauge", documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> MetricFamily:
+        return self._get_or_create(name, "histogram", documentation, labelnames, buckets)
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        return self._families.get(f"{self.namespace}_{name}" if self.namespace else name)
+
+    def render(self) -> str:
+        """全メトリクスを Prometheus テキスト形式（0.0.4）で出力"""
+        lines: List[str] = []
+        for name in sorted(self._families):
+            lines.extend(self._families[name].render())
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """
+    メトリクスを Prometheus 形式で公開するHTTPサーバー
+
+    外部公開を避けるため 127.0.0.1 のみで待ち受ける（GET /metrics）
+    """
+
+    HOST = "127.0.0.1"
+
+    def __init__(self, registry: MetricsRegistry, port: int = 9464):
+        self.registry = registry
+        self.port = port
+        self.logger = logging.getLogger(__name__)
+        self._runner: Optional[web.AppRunner] = None
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            text=self.registry.render(),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"}
+        )
+
+    async def start(self) -> None:
+        if self._runner is not None:
+            return
+
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.HOST, self.port).start()
+        self.logger.info(f"Metrics endpoint listening on http://{self.HOST}:{self.port}/metrics")
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -1,9 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Optional, Deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
 from collections import deque
+from collections.abc import Mapping
+from itertools import islice
+from enum import Enum
+import asyncio
 import logging
+import sys
+import time
 from datetime import datetime
 
+from .metrics import MetricsRegistry
+
 
 class Observer(ABC):
     @abstractmethod
@@ -11,6 +19,57 @@ class Observer(ABC):
         pass
 
 
+class EventRecord(Mapping):
+    """
+    イベント履歴・配信用のレコード
+
+    - __slots__ で属性辞書を持たず、時刻は time.monotonic() の float で保持
+    - 従来の dict 形式（"type", "data", "timestamp", "id"）としても読めるよう Mapping を実装
+      （"timestamp" キーは datetime に変換して返す）
+    """
+
+    __slots__ = ("id", "type", "data", "timestamp")
+
+    _KEYS = ("type", "data", "timestamp", "id")
+    # monotonic → 壁時計時刻の変換用オフセット（プロセス起動時に固定）
+    _WALL_CLOCK_OFFSET = time.time() - time.monotonic()
+
+    def __init__(self, event_id: int, event_type: str, data: Dict[str, Any], timestamp: float):
+        self.id = event_id
+        self.type = event_type
+        self.data = data
+        self.timestamp = timestamp
+
+    @classmethod
+    def from_wall_time(cls, event_id: int, event_type: str, data: Dict[str, Any], wall_time: float) -> "EventRecord":
+        """壁時計時刻（UNIX秒）からレコードを復元（ジャーナルの再生用）"""
+        return cls(event_id, event_type, data, wall_time - cls._WALL_CLOCK_OFFSET)
+
+    @property
+    def wall_timestamp(self) -> float:
+        return self.timestamp + self._WALL_CLOCK_OFFSET
+
+    @property
+    def wall_time(self) -> datetime:
+        return datetime.fromtimestamp(self.wall_timestamp)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "timestamp":
+            return self.wall_time
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return f"EventRecord(id={self.id}, type={self.type!r}, data={self.data!r})"
+
+
 class Subject(ABC):
     def __init__(self):
         self._observers: List[Observer] = []
@@ -34,77 +93,487 @@ class Subject(ABC):
                 self.logger.error(f"Observer {observer.__class__.__name__} failed to process event {event_type}: {e}")
 
 
+class OverflowPolicy(str, Enum):
+    """オブザーバーキューが満杯の時の動作"""
+    DROP_OLDEST = "drop_oldest"  # 最も古いイベントを破棄して追加
+    BLOCK = "block"              # 空きが出るまで発行側を待たせる
+    SAMPLE = "sample"            # 混雑時はN件に1件だけ受け付ける
+
+
+class ObserverWorker:
+    """
+    オブザーバー専用のキューと処理タスク
+
+    - 発行側はキューに積むだけで戻り、オブザーバーの処理はワーカータスクで行う
+    - オブザーバーごとに独立しているため、遅いオブザーバーが他を遅延させない
+    """
+
+    # SAMPLE: キューがこの割合を超えたら間引きを開始
+    SAMPLE_HIGH_WATER = 0.75
+
+    def __init__(self, observer: Observer, queue_size: int = 1000,
+                 policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST, sample_every: int = 10,
+                 name: Optional[str] = None):
+        self.observer = observer
+        self.name = name or observer.__class__.__name__
+        self.policy = policy
+        self.sample_every = max(1, sample_every)
+        self.logger = logging.getLogger(__name__)
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+        self._task: Optional[asyncio.Task] = None
+        self._sample_counter = 0
+
+        self._stats = {
+            "enqueued": 0,
+            "processed": 0,
+            "failed": 0,
+            "dropped": 0,
+            "sampled_out": 0,
+            "lag_total": 0.0,
+            "lag_max": 0.0
+        }
+
+    def _ensure_started(self) -> None:
+        # イベントループ上で初めて使われた時にワーカーを起動
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"eventbus-{self.name}")
+
+    async def offer(self, event_type: str, data: Dict[str, Any]) -> None:
+        """イベントをキューに追加（ポリシーに従って破棄・待機）"""
+        self._ensure_started()
+        item = (time.monotonic(), event_type, data)
+        queue = self._queue
+
+        if self.policy == OverflowPolicy.SAMPLE and queue.qsize() >= queue.maxsize * self.SAMPLE_HIGH_WATER:
+            self._sample_counter += 1
+            if self._sample_counter % self.sample_every:
+                self._stats["sampled_out"] += 1
+                return
+
+        if queue.full():
+            if self.policy == OverflowPolicy.BLOCK:
+                await queue.put(item)
+                self._stats["enqueued"] += 1
+                return
+            # DROP_OLDEST / SAMPLE: 最も古いイベントを破棄
+            queue.get_nowait()
+            queue.task_done()
+            self._stats["dropped"] += 1
+
+        queue.put_nowait(item)
+        self._stats["enqueued"] += 1
+
+    async def _run(self) -> None:
+        while True:
+            enqueued_at, event_type, data = await self._queue.get()
+            lag = time.monotonic() - enqueued_at
+            self._stats["lag_total"] += lag
+            self._stats["lag_max"] = max(self._stats["lag_max"], lag)
+            try:
+                await self.observer.update(event_type, data)
+                self._stats["processed"] += 1
+            except Exception as e:
+                self._stats["failed"] += 1
+                self.logger.error(f"Observer {self.name} failed to process event {event_type}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def flush(self) -> None:
+        """キューに積まれたイベントの処理完了を待つ"""
+        if self._task is not None and not self._task.done():
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """残りを処理してからワーカーを停止"""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def cancel(self) -> None:
+        """残りを処理せずにワーカーを停止（イベントループ外から呼ぶ場合）"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キュー統計（lagはキュー投入から処理開始までの時間）"""
+        handled = self._stats["processed"] + self._stats["failed"]
+        return {
+            "policy": self.policy.value,
+            "queued": self._queue.qsize(),
+            "queue_size": self._queue.maxsize,
+            "enqueued": self._stats["enqueued"],
+            "processed": self._stats["processed"],
+            "failed": self._stats["failed"],
+            "dropped": self._stats["dropped"],
+            "sampled_out": self._stats["sampled_out"],
+            "lag_avg_ms": (self._stats["lag_total"] / handled * 1000) if handled else 0.0,
+            "lag_max_ms": self._stats["lag_max"] * 1000
+        }
+
+
+# subscribe() に渡せるトピック指定: イベント名・"track_*" のような前方一致・"*"（全イベント）・その組み合わせ・判定関数
+Topics = Union[str, Iterable[str], Callable[[str], bool]]
+EventHandler = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class _CallableObserver(Observer):
+    """コルーチン関数をオブザーバーとして扱うアダプター"""
+
+    def __init__(self, handler: EventHandler):
+        self.handler = handler
+        self.name = getattr(handler, "__qualname__", handler.__class__.__name__)
+
+    async def update(self, event_type: str, data: Dict[str, Any]) -> None:
+        await self.handler(event_type, data)
+
+
+class Subscription:
+    """EventBus.subscribe の登録情報（unsubscribe に渡して解除）"""
+
+    __slots__ = ("observer", "event_types", "prefixes", "predicate", "match_all", "name")
+
+    def __init__(self, observer: Observer, topics: Topics, name: str):
+        self.observer = observer
+        self.name = name
+        self.event_types: Set[str] = set()
+        self.prefixes: Tuple[str, ...] = ()
+        self.predicate: Optional[Callable[[str], bool]] = None
+        self.match_all = False
+
+        if callable(topics):
+            self.predicate = topics
+            return
+
+        prefixes = []
+        for topic in ([topics] if isinstance(topics, str) else topics):
+            if topic == "*":
+                self.match_all = True
+            elif topic.endswith("*"):
+                prefixes.append(topic[:-1])
+            else:
+                self.event_types.add(topic)
+        self.prefixes = tuple(prefixes)
+
+    @property
+    def is_pattern(self) -> bool:
+        """イベント名の完全一致以外で判定が必要か"""
+        return self.match_all or bool(self.prefixes) or self.predicate is not None
+
+    def matches(self, event_type: str) -> bool:
+        if self.match_all or event_type in self.event_types:
+            return True
+        if self.prefixes and event_type.startswith(self.prefixes):
+            return True
+        return self.predicate is not None and bool(self.predicate(event_type))
+
+
 class EventBus(Subject):
-    def __init__(self, max_history_size: int = 1000):
+    """
+    イベントバス
+
+    - attach() したオブザーバーは全イベントを受信（subscribe("*", observer) と同じ）
+    - subscribe() はイベント名・前方一致・判定関数で受信するイベントを絞り込む
+    - 配信先はイベント名ごとに解決してキャッシュするため、
+      emit のコストは登録数ではなくそのイベントの購読者数に比例する
+    """
+
+    def __init__(self, max_history_size: int = 1000, async_dispatch: bool = False,
+                 queue_size: int = 1000, overflow_policy: str = OverflowPolicy.DROP_OLDEST.value):
         super().__init__()
         self._max_history_size = max_history_size
-        self._event_history: Deque[Dict[str, Any]] = deque(maxlen=max_history_size)
+        self._event_history: Deque[EventRecord] = deque(maxlen=max_history_size)
+        # イベントタイプ別の履歴（_event_history と同じレコードを共有し、溢れた分は同時に削除）
+        self._history_by_type: Dict[str, Deque[EventRecord]] = {}
         self._total_events_count = 0
 
+        # 非同期配信: emit_eventはキュー投入のみ行い、各購読者は専用ワーカーで処理
+        self.async_dispatch = async_dispatch
+        self._queue_size = queue_size
+        self._overflow_policy = OverflowPolicy(overflow_policy)
+        self._workers: Dict[int, ObserverWorker] = {}
+        self._stopping: Set[asyncio.Task] = set()
+
+        # 登録順の購読一覧と、イベント名 → 配信先の索引
+        self._subscriptions: List[Subscription] = []
+        self._exact_index: Dict[str, List[Subscription]] = {}
+        self._pattern_subscriptions: List[Subscription] = []
+        self._routes: Dict[str, Tuple[Subscription, ...]] = {}
+
+    # ===== 購読 =====
+
+    def subscribe(self, topics: Topics, handler: Union[Observer, EventHandler],
+                  policy: Optional[OverflowPolicy] = None, queue_size: Optional[int] = None) -> Subscription:
+        """
+        指定したイベントだけを受信するハンドラーを登録
+
+        handler は Observer か async def handler(event_type, data) のコルーチン関数
+        """
+        if isinstance(handler, Observer):
+            observer, name = handler, handler.__class__.__name__
+        else:
+            observer = _CallableObserver(handler)
+            name = observer.name
+
+        subscription = Subscription(observer, topics, name)
+        self._subscriptions.append(subscription)
+        if subscription.is_pattern:
+            self._pattern_subscriptions.append(subscription)
+        for event_type in subscription.event_types:
+            self._exact_index.setdefault(event_type, []).append(subscription)
+        self._routes.clear()
+
+        if self.async_dispatch:
+            self._workers[id(subscription)] = ObserverWorker(
+                observer,
+                queue_size=queue_size or self._queue_size,
+                policy=policy or self._overflow_policy,
+                name=name
+            )
+        self.logger.debug(f"Subscription {name} registered")
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """subscribe() の登録を解除"""
+        if subscription not in self._subscriptions:
+            return
+
+        self._subscriptions.remove(subscription)
+        if subscription in self._pattern_subscriptions:
+            self._pattern_subscriptions.remove(subscription)
+        for event_type in subscription.event_types:
+            handlers = self._exact_index.get(event_type, [])
+            if subscription in handlers:
+                handlers.remove(subscription)
+            if not handlers:
+                self._exact_index.pop(event_type, None)
+        self._routes.clear()
+
+        worker = self._workers.pop(id(subscription), None)
+        if worker:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # ループ外ではキューを処理できないため、そのまま停止する
+                worker.cancel()
+            else:
+                task = loop.create_task(worker.stop(), name=f"eventbus-stop-{worker.name}")
+                self._stopping.add(task)
+                task.add_done_callback(self._stopping.discard)
+        self.logger.debug(f"Subscription {subscription.name} removed")
+
+    def attach(self, observer: Observer, policy: Optional[OverflowPolicy] = None,
+               queue_size: Optional[int] = None) -> None:
+        """全イベントを受信するオブザーバーを登録（非同期配信時はキューの設定を変更可能）"""
+        if observer in self._observers:
+            return
+        super().attach(observer)
+        self.subscribe("*", observer, policy=policy, queue_size=queue_size)
+
+    def detach(self, observer: Observer) -> None:
+        super().detach(observer)
+        for subscription in [sub for sub in self._subscriptions if sub.observer is observer]:
+            self.unsubscribe(subscription)
+
+    def _resolve(self, event_type: str) -> Tuple[Subscription, ...]:
+        """イベント名の配信先を登録順で解決してキャッシュ"""
+        matched = set(self._exact_index.get(event_type, ()))
+        for subscription in self._pattern_subscriptions:
+            if subscription not in matched and subscription.matches(event_type):
+                matched.add(subscription)
+
+        route = tuple(sub for sub in self._subscriptions if sub in matched)
+        self._routes[event_type] = route
+        return route
+
+    # ===== 配信 =====
+
+    async def notify(self, event_type: str, data: Dict[str, Any]) -> None:
+        route = self._routes.get(event_type)
+        if route is None:
+            route = self._resolve(event_type)
+
+        if self.async_dispatch:
+            for subscription in route:
+                await self._workers[id(subscription)].offer(event_type, data)
+            return
+
+        for subscription in route:
+            try:
+                await subscription.observer.update(event_type, data)
+            except Exception as e:
+                self.logger.error(f"Observer {subscription.name} failed to process event {event_type}: {e}")
+
+    async def flush(self) -> None:
+        """全購読者のキューが空になるまで待機（テスト・シャットダウン用）"""
+        await asyncio.gather(*(worker.flush() for worker in self._workers.values()))
+
+    async def shutdown(self) -> None:
+        """残りのイベントを処理してワーカーを停止し、close() を持つ購読者（ジャーナルなど）を閉じる"""
+        await asyncio.gather(*(worker.stop() for worker in self._workers.values()))
+        for subscription in self._subscriptions:
+            close = getattr(subscription.observer, "close", None)
+            if close is not None:
+                try:
+                    await close()
+                except Exception as e:
+                    self.logger.error(f"Failed to close observer {subscription.name}: {e}")
+
+    def get_dispatch_stats(self) -> Dict[str, Dict[str, Any]]:
+        """購読者ごとのキュー統計を取得（同名の購読者には連番を付与）"""
+        stats: Dict[str, Dict[str, Any]] = {}
+        for subscription in self._subscriptions:
+            worker = self._workers.get(id(subscription))
+            if not worker:
+                continue
+            key, suffix = subscription.name, 2
+            while key in stats:
+                key, suffix = f"{subscription.name}#{suffix}", suffix + 1
+            stats[key] = worker.get_stats()
+        return stats
+
     async def emit_event(self, event_type: str, data: Dict[str, Any]) -> None:
         self._total_events_count += 1
-        event_data = {
-            "type": event_type,
-            "data": data,
-            "timestamp": datetime.now(),
-            "id": self._total_events_count
-        }
-
-        # deque with maxlen automatically removes oldest items when full
-        self._event_history.append(event_data)
-        await self.notify(event_type, event_data)
+        record = EventRecord(self._total_events_count, event_type, data, time.monotonic())
+        self._record_history(record)
+        await self.notify(event_type, record)
 
-        # Log with memory usage info periodically
+        # 毎回呼ばれるため、出力されない場合はペイロードを文字列化しない（%形式で遅延フォーマット）
         if self._total_events_count % 100 == 0:
-            self.logger.info(f"Event {event_type} emitted. Total events: {self._total_events_count}, "
-                           f"History size: {len(self._event_history)}/{self._max_history_size}")
-        else:
-            self.logger.debug(f"Event {event_type} emitted with data: {data}")
+            self.logger.info("Event %s emitted. Total events: %d, History size: %d/%d",
+                             event_type, self._total_events_count, len(self._event_history), self._max_history_size)
+        elif self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Event %s emitted with data: %s", event_type, data)
 
-    def get_event_history(self, event_type: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
-        events = list(self._event_history)
-        if event_type:
-            events = [e for e in events if e["type"] == event_type]
+    def _record_history(self, record: EventRecord) -> None:
+        history = self._event_history
+        if history.maxlen == 0:
+            return
 
-        return events[-limit:] if limit > 0 else events
+        # 溢れるレコードはそのタイプの履歴でも最も古いため、左端から取り除く
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            typed = self._history_by_type[evicted.type]
+            typed.popleft()
+            if not typed:
+                del self._history_by_type[evicted.type]
+
+        history.append(record)
+        self._history_by_type.setdefault(record.type, deque()).append(record)
+
+    def get_event_history(self, event_type: Optional[str] = None, limit: int = 100) -> List[EventRecord]:
+        """イベント履歴を古い順に取得（新しい方から最大limit件、タイプ指定時は索引から取得）"""
+        events = self._history_by_type.get(event_type, ()) if event_type else self._event_history
+        if limit <= 0:
+            return list(events)
+        return list(islice(reversed(events), limit))[::-1]
 
     def clear_event_history(self) -> None:
         self._event_history.clear()
+        self._history_by_type.clear()
         self.logger.info(f"Event history cleared. Total events processed: {self._total_events_count}")
 
     def get_memory_stats(self) -> Dict[str, Any]:
-        """メモリ使用状況の統計を取得"""
+        """メモリ使用状況の統計を取得（バイト数はレコード・ペイロード辞書とその直下の値の合計）"""
+        history_bytes = sys.getsizeof(self._event_history)
+        for record in self._event_history:
+            history_bytes += sys.getsizeof(record) + sys.getsizeof(record.data)
+            history_bytes += sum(sys.getsizeof(value) for value in record.data.values())
+        index_bytes = sys.getsizeof(self._history_by_type) + sum(
+            sys.getsizeof(typed) for typed in self._history_by_type.values()
+        )
+
         return {
             "total_events_processed": self._total_events_count,
             "current_history_size": len(self._event_history),
             "max_history_size": self._max_history_size,
-            "memory_efficiency": f"{len(self._event_history)}/{self._max_history_size}",
+            "event_types": len(self._history_by_type),
+            "history_bytes": history_bytes,
+            "index_bytes": index_bytes,
             "events_discarded": max(0, self._total_events_count - len(self._event_history))
         }
 
 
 class LoggingObserver(Observer):
-    def __init__(self):
+    """
+    イベントをログに出力するオブザーバー
+
+    - 出力レベルが無効な場合はフォーマット前に戻る（"OFF" で出力しない）
+    - イベントタイプごとに1秒あたりの件数を数え、sample_threshold を超えた分は
+      sample_every 件に1件だけ出力（間引いた件数は次の出力に付記）
+    """
+
+    SAMPLE_WINDOW_SECONDS = 1.0
+
+    def __init__(self, level: str = "INFO", sample_threshold: int = 20, sample_every: int = 10):
         self.logger = logging.getLogger("EventLogger")
+        level_value = logging.getLevelName(str(level).upper())
+        self.level: Optional[int] = level_value if isinstance(level_value, int) else None
+        self.sample_threshold = sample_threshold
+        self.sample_every = max(1, sample_every)
+
+        # イベントタイプ → [計測開始時刻, 期間内の件数, 未報告の間引き件数]
+        self._rates: Dict[str, List[Any]] = {}
+        self.sampled_out = 0
 
     async def update(self, event_type: str, data: Dict[str, Any]) -> None:
+        if self.level is None or not self.logger.isEnabledFor(self.level):
+            return
+
+        suppressed = 0
+        if self.sample_threshold > 0:
+            now = time.monotonic()
+            rate = self._rates.get(event_type)
+            if rate is None or now - rate[0] >= self.SAMPLE_WINDOW_SECONDS:
+                rate = self._rates[event_type] = [now, 0, rate[2] if rate else 0]
+            rate[1] += 1
+
+            over = rate[1] - self.sample_threshold
+            if over > 0 and over % self.sample_every:
+                rate[2] += 1
+                self.sampled_out += 1
+                return
+            suppressed, rate[2] = rate[2], 0
+
         timestamp = data.get("timestamp", datetime.now())
         event_data = data.get("data", {})
-        self.logger.info(f"[{timestamp}] Event: {event_type} | Data: {event_data}")
+        if suppressed:
+            self.logger.log(self.level, "[%s] Event: %s | Data: %s (+%d sampled out)",
+                            timestamp, event_type, event_data, suppressed)
+        else:
+            self.logger.log(self.level, "[%s] Event: %s | Data: %s", timestamp, event_type, event_data)
 
 
-class MetricsObserver(Observer):
-    def __init__(self):
+class MetricsObserver(MetricsRegistry, Observer):
+    """
+    イベント件数の集計とメトリクスの登録簿
+
+    EventBus のイベント件数に加え、DB・yt-dlp・DeepL などのレイテンシを
+    各モジュールが counter / gauge / histogram で記録する（Prometheus 形式で出力可能）
+    """
+
+    def __init__(self, namespace: str = "luna"):
+        super().__init__(namespace)
         self.event_counts: Dict[str, int] = {}
         self.logger = logging.getLogger("MetricsObserver")
+        self._events_total = self.counter("events_total", "EventBus events by type", ("event_type",))
 
     async def update(self, event_type: str, data: Dict[str, Any]) -> None:
         self.event_counts[event_type] = self.event_counts.get(event_type, 0) + 1
-        self.logger.debug(f"Event {event_type} count: {self.event_counts[event_type]}")
+        self._events_total.labels(event_type).inc()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Event %s count: %d", event_type, self.event_counts[event_type])
 
     def get_metrics(self) -> Dict[str, int]:
         return self.event_counts.copy()
 
     def reset_metrics(self) -> None:
         self.event_counts.clear()
+        self._events_total.clear()
         self.logger.info("Metrics reset")
\ No newline at end of file
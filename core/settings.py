@@ -65,6 +65,18 @@ class Settings:
     def logging_max_size(self) -> int:
         return self.config.get("logging", {}).get("max_size", 10485760)
 
+    @property
+    def logging_backup_count(self) -> int:
+        return self.config.get("logging", {}).get("backup_count", 5)
+
+    @property
+    def logging_compress(self) -> bool:
+        return self.config.get("logging", {}).get("compress", False)
+
+    @property
+    def logging_module_levels(self) -> Dict[str, str]:
+        return self.config.get("logging", {}).get("levels", {})
+
     @property
     def features_tickets(self) -> bool:
         return self.config.get("features", {}).get("tickets", True)
@@ -103,10 +115,142 @@ class Settings:
     def logger_log_deletes(self) -> bool:
         return self.config.get("logger", {}).get("log_deletes", True)
 
+    @property
+    def logger_fanout_concurrency(self) -> int:
+        return self.config.get("logger", {}).get("fanout_concurrency", 5)
+
+    @property
+    def logger_batch_window(self) -> float:
+        return self.config.get("logger", {}).get("batch_window", 2.0)
+
+    @property
+    def logger_batch_max_pending(self) -> int:
+        return self.config.get("logger", {}).get("batch_max_pending", 50)
+
+    @property
+    def logger_delivery(self) -> str:
+        return self.config.get("logger", {}).get("delivery", "channel").lower()
+
+    @property
+    def logger_bulk_transcript(self) -> bool:
+        return self.config.get("logger", {}).get("bulk_transcript", True)
+
+    @property
+    def logger_message_store_size(self) -> int:
+        return self.config.get("logger", {}).get("message_store_size", 1000)
+
+    @property
+    def logger_message_store_spill(self) -> bool:
+        return self.config.get("logger", {}).get("message_store_spill", False)
+
+    @property
+    def logger_message_store_retention_days(self) -> int:
+        return self.config.get("logger", {}).get("message_store_retention_days", 7)
+
+    @property
+    def logger_archive_after_days(self) -> int:
+        return self.config.get("logger", {}).get("archive_after_days", 0)
+
+    @property
+    def logger_archive_directory(self) -> str:
+        return self.config.get("logger", {}).get("archive_directory", "data/log_archive")
+
+    @property
+    def logger_archive_interval(self) -> int:
+        return self.config.get("logger", {}).get("archive_interval", 86400)
+
+    @property
+    def logger_archive_chunk_size(self) -> int:
+        return self.config.get("logger", {}).get("archive_chunk_size", 1000)
+
     @property
     def eventbus_max_history_size(self) -> int:
         return self.config.get("eventbus", {}).get("max_history_size", 1000)
 
+    @property
+    def eventbus_async_dispatch(self) -> bool:
+        return self.config.get("eventbus", {}).get("async_dispatch", False)
+
+    @property
+    def eventbus_queue_size(self) -> int:
+        return self.config.get("eventbus", {}).get("queue_size", 1000)
+
+    @property
+    def eventbus_overflow_policy(self) -> str:
+        return self.config.get("eventbus", {}).get("overflow_policy", "drop_oldest")
+
+    @property
+    def eventbus_log_level(self) -> str:
+        return self.config.get("eventbus", {}).get("log_level", "INFO")
+
+    @property
+    def eventbus_log_sample_threshold(self) -> int:
+        return self.config.get("eventbus", {}).get("log_sample_threshold", 20)
+
+    @property
+    def eventbus_log_sample_every(self) -> int:
+        return self.config.get("eventbus", {}).get("log_sample_every", 10)
+
+    @property
+    def eventbus_journal_enabled(self) -> bool:
+        return self.config.get("eventbus", {}).get("journal_enabled", False)
+
+    @property
+    def eventbus_journal_directory(self) -> str:
+        return self.config.get("eventbus", {}).get("journal_directory", "data/events")
+
+    @property
+    def eventbus_journal_segment_size(self) -> int:
+        return self.config.get("eventbus", {}).get("journal_segment_size", 4194304)
+
+    @property
+    def eventbus_journal_max_segments(self) -> int:
+        return self.config.get("eventbus", {}).get("journal_max_segments", 16)
+
+    @property
+    def eventbus_journal_fsync_interval(self) -> float:
+        return self.config.get("eventbus", {}).get("journal_fsync_interval", 5.0)
+
+    @property
+    def eventbus_journal_replay(self) -> bool:
+        return self.config.get("eventbus", {}).get("journal_replay", True)
+
+    @property
+    def metrics_enabled(self) -> bool:
+        return self.config.get("metrics", {}).get("enabled", False)
+
+    @property
+    def metrics_port(self) -> int:
+        return self.config.get("metrics", {}).get("port", 9464)
+
+    @property
+    def metrics_handler_timing(self) -> bool:
+        return self.config.get("metrics", {}).get("handler_timing", True)
+
+    @property
+    def metrics_loop_monitor(self) -> bool:
+        return self.config.get("metrics", {}).get("loop_monitor", True)
+
+    @property
+    def metrics_loop_lag_interval(self) -> float:
+        return self.config.get("metrics", {}).get("loop_lag_interval", 0.25)
+
+    @property
+    def metrics_slow_callback_threshold(self) -> float:
+        return self.config.get("metrics", {}).get("slow_callback_threshold", 0.1)
+
+    @property
+    def metrics_task_census_interval(self) -> float:
+        return self.config.get("metrics", {}).get("task_census_interval", 60.0)
+
+    @property
+    def metrics_task_warn_threshold(self) -> int:
+        return self.config.get("metrics", {}).get("task_warn_threshold", 100)
+
+    @property
+    def metrics_asyncio_debug(self) -> bool:
+        return self.config.get("metrics", {}).get("asyncio_debug", False)
+
     @property
     def logger_log_joins(self) -> bool:
         return self.config.get("logger", {}).get("log_joins", True)
@@ -138,6 +282,22 @@ class Settings:
                 self.spotify_client_secret is not None and
                 self.spotify_client_id != "your_spotify_client_id")
 
+    @property
+    def music_cache_enabled(self) -> bool:
+        return self.config.get("music_cache", {}).get("enabled", False)
+
+    @property
+    def music_cache_directory(self) -> str:
+        return self.config.get("music_cache", {}).get("directory", "cache/audio")
+
+    @property
+    def music_cache_max_size(self) -> int:
+        return self.config.get("music_cache", {}).get("max_size", 1073741824)
+
+    @property
+    def music_cache_min_plays(self) -> int:
+        return self.config.get("music_cache", {}).get("min_plays", 3)
+
     @property
     def deepl_api_key(self) -> Optional[str]:
         return self.config.get("deepl", {}).get("api_key")
@@ -160,6 +320,10 @@ class Settings:
         return (self.deepl_api_key is not None and
                 self.deepl_api_key != "your_deepl_api_key")
 
+    @property
+    def features_music(self) -> bool:
+        return self.config.get("features", {}).get("music", True)
+
     @property
     def features_translation(self) -> bool:
         return self.config.get("features", {}).get("translation", True)
@@ -0,0 +1,177 @@
+import gzip
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .models import Log, LogType
+
+
+class LogArchive:
+    """
+    古いログの月別アーカイブ（コールドストレージ）
+
+    設計:
+    - 月ごとに追記専用の gzip 圧縮 JSONL セグメント（YYYY-MM.jsonl.gz）に保存
+    - 追記はgzipメンバーの連結で行い、既存データは書き換えない
+    - index.json にセグメントごとのID範囲・期間・ギルド別件数を保持し、
+      該当ギルドを含まないセグメントは読み込まない
+    - 同期I/Oのため、呼び出し側でスレッドに逃がして使用する
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.logger = logging.getLogger(__name__)
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+
+    # ===== シリアライズ =====
+
+    @staticmethod
+    def serialize(log: Log) -> Dict[str, Any]:
+        return {
+            "id": log.id,
+            "guild_id": log.guild_id,
+            "log_type": log.log_type.value,
+            "user_id": log.user_id,
+            "moderator_id": log.moderator_id,
+            "channel_id": log.channel_id,
+            "action": log.action,
+            "details": log.details,
+            "payload": log.payload,
+            "timestamp": log.timestamp.isoformat()
+        }
+
+    @staticmethod
+    def deserialize(row: Dict[str, Any]) -> Log:
+        return Log(**{
+            **row,
+            "log_type": LogType(row["log_type"]),
+            "timestamp": datetime.fromisoformat(row["timestamp"])
+        })
+
+    # ===== インデックス =====
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if self._index is None:
+            path = self.directory / self.INDEX_FILE
+            try:
+                self._index = json.loads(path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._index = {}
+            except ValueError as e:
+                # 壊れたインデックスは全セグメント走査で代替（セグメント自体は残す）
+                self.logger.error(f"Log archive index is corrupted, ignoring it: {e}")
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        path = self.directory / self.INDEX_FILE
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(self._index, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp_path, path)
+
+    def _segment_path(self, segment: str) -> Path:
+        return self.directory / f"{segment}.jsonl.gz"
+
+    def _segments_newest_first(self) -> List[str]:
+        """インデックスに載っていないセグメントも含めて新しい順に列挙"""
+        segments = set(self._load_index())
+        if self.directory.exists():
+            segments.update(path.name[:-len(".jsonl.gz")] for path in self.directory.glob("*.jsonl.gz"))
+        return sorted(segments, reverse=True)
+
+    # ===== 書き込み =====
+
+    def append(self, logs: List[Log]) -> int:
+        """ログを月別セグメントに追記（書き込み済みIDは重複して書かない）"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        index = self._load_index()
+
+        by_segment: Dict[str, List[Dict[str, Any]]] = {}
+        for log in logs:
+            by_segment.setdefault(log.timestamp.strftime("%Y-%m"), []).append(self.serialize(log))
+
+        written = 0
+        for segment, rows in sorted(by_segment.items()):
+            entry = index.setdefault(segment, {
+                "rows": 0, "min_id": None, "max_id": 0, "first": None, "last": None, "guilds": {}
+            })
+            # 前回の書き込み後・DB削除前に中断した場合の再実行に備え、書き込み済みIDを除外
+            rows = [row for row in rows if row["id"] > entry["max_id"]]
+            if not rows:
+                continue
+
+            data = "".join(json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n" for row in rows)
+            with open(self._segment_path(segment), "ab") as file:
+                file.write(gzip.compress(data.encode("utf-8")))
+                file.flush()
+                os.fsync(file.fileno())
+
+            entry["rows"] += len(rows)
+            entry["min_id"] = min(filter(None, [entry["min_id"], rows[0]["id"]]))
+            entry["max_id"] = max(entry["max_id"], rows[-1]["id"])
+            entry["first"] = min(filter(None, [entry["first"], rows[0]["timestamp"]]))
+            entry["last"] = max(filter(None, [entry["last"], rows[-1]["timestamp"]]))
+            for row in rows:
+                guild_key = str(row["guild_id"])
+                entry["guilds"][guild_key] = entry["guilds"].get(guild_key, 0) + 1
+            written += len(rows)
+
+        self._save_index()
+        return written
+
+    # ===== 読み込み =====
+
+    def read(self, guild_id: int, limit: int, before_id: Optional[int] = None,
+             predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Log]:
+        """ギルドのアーカイブ済みログを新しい順に取得"""
+        index = self._load_index()
+        guild_key = str(guild_id)
+        results: List[Log] = []
+
+        for segment in self._segments_newest_first():
+            entry = index.get(segment)
+            if entry:
+                if guild_key not in entry["guilds"]:
+                    continue
+                if before_id is not None and entry["min_id"] is not None and entry["min_id"] >= before_id:
+                    continue
+
+            path = self._segment_path(segment)
+            if not path.exists():
+                continue
+
+            # 中断後の再実行で同じ行が重複して追記されている場合に備えIDで重複排除
+            matches: Dict[int, Dict[str, Any]] = {}
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    row = json.loads(line)
+                    if row["guild_id"] != guild_id:
+                        continue
+                    if before_id is not None and row["id"] >= before_id:
+                        continue
+                    if predicate and not predicate(row):
+                        continue
+                    matches[row["id"]] = row
+
+            for log_id in sorted(matches, reverse=True):
+                results.append(self.deserialize(matches[log_id]))
+                if len(results) >= limit:
+                    return results
+
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """アーカイブ統計を取得"""
+        index = self._load_index()
+        size = sum(self._segment_path(segment).stat().st_size
+                   for segment in index if self._segment_path(segment).exists())
+        return {
+            "segments": len(index),
+            "rows": sum(entry["rows"] for entry in index.values()),
+            "bytes": size
+        }
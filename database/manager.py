@@ -1,19 +1,26 @@
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Tuple, Dict
 from pathlib import Path
+import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 from sqlmodel import SQLModel, select
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy import desc
+from sqlalchemy import column, delete, desc, event, func, insert, inspect, or_, table, text
+from sqlalchemy.exc import OperationalError
 from datetime import datetime, timedelta
 
-from .models import (Ticket, Log, GuildSettings, TicketMessage, TicketStatus, LogType,
+from .models import (Ticket, Log, GuildSettings, TicketMessage, TicketStatus, LogType, MessageSnapshot,
                       AvatarHistory, UserAvatarStats, AvatarHistoryType,
                       Track, Queue, MusicSession, MusicSource, LoopMode)
+from .archive import LogArchive
+
+# 全文検索の対象列（log_fts）
+LOG_FTS_COLUMNS = ("action", "details", "payload")
 
 
 class DatabaseManager:
-    def __init__(self, database_path: str):
+    def __init__(self, database_path: str, archive_directory: Optional[str] = None, metrics=None):
         self.database_path = Path(database_path)
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -22,12 +29,128 @@ class DatabaseManager:
         self.async_session = async_sessionmaker(self.engine, expire_on_commit=False)
         self.logger = logging.getLogger(__name__)
 
+        # FTS5が利用できない環境ではLIKE検索にフォールバック
+        self.log_search_enabled = False
+
+        # 古いログの月別アーカイブ（get_logs / search_logs から透過的に参照）
+        self.archive = LogArchive(archive_directory) if archive_directory else None
+
+        # SQL文ごとの実行時間をメトリクスに記録
+        if metrics is not None:
+            self._query_seconds = metrics.histogram(
+                "db_query_seconds", "SQLite statement execution time", ("operation",)
+            )
+            self._query_errors = metrics.counter("db_query_errors_total", "Failed SQLite statements")
+            event.listen(self.engine.sync_engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(self.engine.sync_engine, "after_cursor_execute", self._after_cursor_execute)
+            event.listen(self.engine.sync_engine, "handle_error", self._on_query_error)
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        # 先頭のキーワード（SELECT / INSERT / UPDATE / DELETE など）で分類
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement else "UNKNOWN"
+        self._query_seconds.labels(operation).observe(elapsed)
+
+    def _on_query_error(self, context) -> None:
+        starts = context.connection.info.get("query_start") if context.connection is not None else None
+        if starts:
+            starts.pop()
+        self._query_errors.inc()
+
     async def _create_tables(self) -> None:
         """非同期でテーブル作成"""
         async with self.engine.begin() as conn:
             await conn.run_sync(SQLModel.metadata.create_all)
+            await conn.run_sync(self._add_missing_columns)
+            await conn.run_sync(self._create_log_indexes)
+            await conn.run_sync(self._create_queue_indexes)
+            await conn.run_sync(self._create_log_search_index)
         self.logger.info("Database tables created successfully")
 
+    def _add_missing_columns(self, conn) -> None:
+        """既存テーブルに後から追加された列を補完（NULL許容列のみ）"""
+        inspector = inspect(conn)
+        for model_table in SQLModel.metadata.sorted_tables:
+            if not inspector.has_table(model_table.name):
+                continue
+
+            existing = {info["name"] for info in inspector.get_columns(model_table.name)}
+            for model_column in model_table.columns:
+                if model_column.name in existing:
+                    continue
+                if not model_column.nullable:
+                    self.logger.warning(f"Cannot add non-nullable column {model_table.name}.{model_column.name} to existing table")
+                    continue
+
+                column_type = model_column.type.compile(dialect=conn.dialect)
+                conn.execute(text(f'ALTER TABLE "{model_table.name}" ADD COLUMN "{model_column.name}" {column_type}'))
+                self.logger.info(f"Added column {model_table.name}.{model_column.name}")
+
+    def _create_log_indexes(self, conn) -> None:
+        """ログ検索用のインデックスを作成（既存テーブルにも追加）"""
+        # キーセットページング用（guild_id絞り込み + id降順）
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_log_guild_id_id ON log (guild_id, id)"))
+        # 「モデレーターX による操作」「ユーザーX に関する操作」の絞り込み用
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_log_guild_moderator ON log (guild_id, moderator_id, log_type)"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_log_guild_user ON log (guild_id, user_id, log_type)"))
+
+    def _create_queue_indexes(self, conn) -> None:
+        """キュー表示用のインデックスを作成（create_allは既存テーブルに索引を追加しないため）"""
+        # get_guild_queue_window の guild_id 絞り込み + position 順の範囲取得用
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_queue_guild_position ON queue (guild_id, position)"))
+
+    def _create_log_search_index(self, conn) -> None:
+        """ログ全文検索用のFTS5テーブルと同期トリガーを作成"""
+        columns = ", ".join(LOG_FTS_COLUMNS)
+        new_values = ", ".join(f"new.{column}" for column in LOG_FTS_COLUMNS)
+        old_values = ", ".join(f"old.{column}" for column in LOG_FTS_COLUMNS)
+
+        existing = conn.execute(text(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'log_fts'"
+        )).scalar()
+        if existing and not all(column in existing for column in LOG_FTS_COLUMNS):
+            # 索引対象の列が変わった場合は作り直す
+            for trigger in ("log_fts_ai", "log_fts_ad", "log_fts_au"):
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+            conn.execute(text("DROP TABLE log_fts"))
+            existing = None
+
+        try:
+            # 外部コンテンツ型: 本文はlogテーブルのみに保持し、FTS側は索引のみ
+            # trigramトークナイザは分かち書きのない日本語も部分一致で検索可能
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS log_fts USING fts5("
+                f"{columns}, content='log', content_rowid='id', tokenize='trigram')"
+            ))
+        except OperationalError as e:
+            self.logger.warning(f"FTS5 is not available, log search falls back to LIKE: {e}")
+            return
+
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS log_fts_ai AFTER INSERT ON log BEGIN "
+            f"INSERT INTO log_fts(rowid, {columns}) VALUES (new.id, {new_values}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS log_fts_ad AFTER DELETE ON log BEGIN "
+            f"INSERT INTO log_fts(log_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS log_fts_au AFTER UPDATE OF {columns} ON log BEGIN "
+            f"INSERT INTO log_fts(log_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+            f"INSERT INTO log_fts(rowid, {columns}) VALUES (new.id, {new_values}); END"
+        ))
+
+        if not existing:
+            # 既存ログを索引に取り込む（作成時のみ）
+            conn.execute(text("INSERT INTO log_fts(log_fts) VALUES ('rebuild')"))
+            self.logger.info("Log search index built")
+
+        self.log_search_enabled = True
+
     async def initialize(self) -> None:
         """データベース初期化（非同期）"""
         await self._create_tables()
@@ -136,7 +259,8 @@ class DatabaseManager:
     # Log methods
     async def create_log(self, guild_id: int, log_type: LogType, action: str,
                         user_id: Optional[int] = None, moderator_id: Optional[int] = None,
-                        channel_id: Optional[int] = None, details: Optional[str] = None) -> Log:
+                        channel_id: Optional[int] = None, details: Optional[str] = None,
+                        payload: Optional[str] = None) -> Log:
         async with self.async_session() as session:
             log = Log(
                 guild_id=guild_id,
@@ -145,7 +269,8 @@ class DatabaseManager:
                 moderator_id=moderator_id,
                 channel_id=channel_id,
                 action=action,
-                details=details
+                details=details,
+                payload=payload
             )
             session.add(log)
             await session.commit()
@@ -153,17 +278,188 @@ class DatabaseManager:
             self.logger.debug(f"Created log entry: {action} in guild {guild_id}")
             return log
 
+    async def create_logs_bulk(self, entries: List[dict]) -> int:
+        """複数ギルド分のログを1回のINSERTで一括作成"""
+        if not entries:
+            return 0
+
+        now = datetime.now()
+        rows = [
+            {
+                "user_id": None,
+                "moderator_id": None,
+                "channel_id": None,
+                "details": None,
+                "payload": None,
+                "timestamp": now,
+                **entry
+            }
+            for entry in entries
+        ]
+
+        async with self.transaction() as session:
+            await session.execute(insert(Log), rows)
+
+        self.logger.debug(f"Created {len(rows)} log entries in bulk")
+        return len(rows)
+
     async def get_logs(self, guild_id: int, log_type: Optional[LogType] = None,
-                      limit: int = 100) -> List[Log]:
+                      limit: int = 100, user_id: Optional[int] = None,
+                      moderator_id: Optional[int] = None) -> List[Log]:
         async with self.async_session() as session:
             statement = select(Log).where(Log.guild_id == guild_id)
 
             if log_type:
                 statement = statement.where(Log.log_type == log_type)
+            if user_id:
+                statement = statement.where(Log.user_id == user_id)
+            if moderator_id:
+                statement = statement.where(Log.moderator_id == moderator_id)
 
             statement = statement.order_by(Log.timestamp.desc()).limit(limit)
             result = await session.execute(statement)
-            return list(result.scalars().all())
+            logs = list(result.scalars().all())
+
+        # 稼働テーブルだけで件数が足りない場合のみアーカイブを参照
+        if self.archive and len(logs) < limit:
+            def matches(row: dict) -> bool:
+                return ((not log_type or row["log_type"] == log_type.value) and
+                        (not user_id or row["user_id"] == user_id) and
+                        (not moderator_id or row["moderator_id"] == moderator_id))
+
+            logs += await asyncio.to_thread(
+                self.archive.read, guild_id, limit - len(logs),
+                min((log.id for log in logs), default=None), matches
+            )
+        return logs
+
+    async def search_logs(self, guild_id: int, query: Optional[str] = None,
+                          log_type: Optional[LogType] = None, user_id: Optional[int] = None,
+                          moderator_id: Optional[int] = None, channel_id: Optional[int] = None,
+                          cursor: Optional[int] = None,
+                          limit: int = 25) -> Tuple[List[Log], Optional[int]]:
+        """
+        ログをキーワード・条件で検索（新しい順）
+
+        - 空白区切りのキーワードはAND条件（キーワードなしは条件のみで絞り込み）
+        - 3文字以上はFTS5索引、2文字以下（trigramで索引できない）はLIKEで照合
+        - cursor: 前ページの末尾ID。戻り値の次カーソルがNoneなら最終ページ
+        """
+        terms = (query or "").split()
+        if not terms and not (log_type or user_id or moderator_id or channel_id):
+            return [], None
+
+        indexed_terms = [term for term in terms if len(term) >= 3] if self.log_search_enabled else []
+        scan_terms = [term for term in terms if term not in indexed_terms]
+
+        if indexed_terms:
+            # FTS側のrowid降順で走査し、LIMIT件数に達した時点で打ち切る
+            log_fts = table("log_fts", column("rowid"))
+            order_key = log_fts.c.rowid
+            # 各語をフレーズとして引用し、FTS5のクエリ構文として解釈されないようにする
+            match = " ".join('"' + term.replace('"', '""') + '"' for term in indexed_terms)
+            statement = (
+                select(Log)
+                .select_from(log_fts)
+                .join(Log, Log.id == log_fts.c.rowid)
+                .where(text("log_fts MATCH :match").bindparams(match=match))
+            )
+        else:
+            order_key = Log.id
+            statement = select(Log)
+
+        statement = statement.where(Log.guild_id == guild_id)
+
+        for term in scan_terms:
+            pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            statement = statement.where(or_(
+                Log.action.like(pattern, escape="\\"),
+                Log.details.like(pattern, escape="\\"),
+                Log.payload.like(pattern, escape="\\")
+            ))
+
+        if log_type:
+            statement = statement.where(Log.log_type == log_type)
+        if user_id:
+            statement = statement.where(Log.user_id == user_id)
+        if moderator_id:
+            statement = statement.where(Log.moderator_id == moderator_id)
+        if channel_id:
+            statement = statement.where(Log.channel_id == channel_id)
+        if cursor:
+            statement = statement.where(order_key < cursor)
+
+        # 1件多く取得して次ページの有無を判定
+        statement = statement.order_by(order_key.desc()).limit(limit + 1)
+
+        async with self.async_session() as session:
+            result = await session.execute(statement)
+            logs = list(result.scalars().all())
+
+        # 稼働テーブルの結果を読み切った場合のみアーカイブを検索
+        if self.archive and len(logs) <= limit:
+            folded_terms = [term.casefold() for term in terms]
+
+            def matches(row: dict) -> bool:
+                if log_type and row["log_type"] != log_type.value:
+                    return False
+                if (user_id and row["user_id"] != user_id) or (moderator_id and row["moderator_id"] != moderator_id):
+                    return False
+                if channel_id and row["channel_id"] != channel_id:
+                    return False
+                text_value = " ".join(filter(None, [row["action"], row["details"], row["payload"]])).casefold()
+                return all(term in text_value for term in folded_terms)
+
+            before_id = logs[-1].id if logs else cursor
+            logs += await asyncio.to_thread(
+                self.archive.read, guild_id, limit + 1 - len(logs), before_id, matches
+            )
+
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = logs[-1].id
+        return logs, next_cursor
+
+    # Message snapshot methods
+    async def save_message_snapshots(self, rows: List[dict]) -> int:
+        """メッセージ内容を一括保存（同じメッセージは上書き）"""
+        if not rows:
+            return 0
+
+        now = datetime.now()
+        async with self.transaction() as session:
+            await session.execute(
+                insert(MessageSnapshot).prefix_with("OR REPLACE"),
+                [{"stored_at": now, **row} for row in rows]
+            )
+        return len(rows)
+
+    async def get_message_snapshots(self, guild_id: int, message_ids: List[int],
+                                    remove: bool = False) -> List[MessageSnapshot]:
+        """保存済みメッセージ内容を取得（remove=Trueで取得後に削除）"""
+        async with self.transaction() as session:
+            statement = select(MessageSnapshot).where(
+                MessageSnapshot.guild_id == guild_id,
+                MessageSnapshot.message_id.in_(message_ids)
+            )
+            result = await session.execute(statement)
+            snapshots = list(result.scalars().all())
+
+            if remove and snapshots:
+                await session.execute(delete(MessageSnapshot).where(
+                    MessageSnapshot.message_id.in_([snapshot.message_id for snapshot in snapshots])
+                ))
+            return snapshots
+
+    async def prune_message_snapshots(self, days: int) -> int:
+        """保持期間を過ぎたメッセージ内容を削除"""
+        cutoff_date = datetime.now() - timedelta(days=days)
+        async with self.transaction() as session:
+            result = await session.execute(delete(MessageSnapshot).where(MessageSnapshot.stored_at < cutoff_date))
+        if result.rowcount:
+            self.logger.info(f"Pruned {result.rowcount} message snapshots older than {days} days")
+        return result.rowcount
 
     # Guild Settings methods
     async def get_guild_settings(self, guild_id: int) -> Optional[GuildSettings]:
@@ -172,6 +468,15 @@ class DatabaseManager:
             result = await session.execute(statement)
             return result.scalars().first()
 
+    async def get_log_channel_map(self) -> Dict[int, int]:
+        """ログチャンネルが設定されている全ギルドの {guild_id: channel_id} を取得"""
+        async with self.async_session() as session:
+            statement = select(GuildSettings.guild_id, GuildSettings.log_channel_id).where(
+                GuildSettings.log_channel_id.is_not(None)
+            )
+            result = await session.execute(statement)
+            return {guild_id: channel_id for guild_id, channel_id in result.all()}
+
     async def create_or_update_guild_settings(self, guild_id: int, **kwargs) -> GuildSettings:
         async with self.async_session() as session:
             statement = select(GuildSettings).where(GuildSettings.guild_id == guild_id)
@@ -286,6 +591,46 @@ class DatabaseManager:
         await self._update_user_avatar_stats_sync(user_id, history_type, session)
 
     # Utility methods
+    async def archive_old_logs(self, days: int, chunk_size: int = 1000) -> int:
+        """
+        指定日数より古いログをアーカイブへ移動
+
+        - ID順にchunk_size件ずつ、アーカイブへの書き込み完了後に稼働テーブルから削除
+        - チャンクごとにトランザクションを分け、長時間のロックを避ける
+        """
+        if not self.archive:
+            return 0
+
+        cutoff_date = datetime.now() - timedelta(days=days)
+        total = 0
+        while True:
+            async with self.async_session() as session:
+                statement = (
+                    select(Log)
+                    .where(Log.timestamp < cutoff_date)
+                    .order_by(Log.id)
+                    .limit(chunk_size)
+                )
+                result = await session.execute(statement)
+                chunk = list(result.scalars().all())
+
+            if not chunk:
+                break
+
+            await asyncio.to_thread(self.archive.append, chunk)
+
+            ids = [log.id for log in chunk]
+            async with self.transaction() as session:
+                await session.execute(delete(Log).where(Log.id.in_(ids)))
+
+            total += len(chunk)
+            # チャンク間で他の処理（イベント記録など）に制御を戻す
+            await asyncio.sleep(0)
+
+        if total:
+            self.logger.info(f"Archived {total} log entries older than {days} days")
+        return total
+
     async def cleanup_old_logs(self, days: int = 30) -> int:
         cutoff_date = datetime.now() - timedelta(days=days)
         async with self.async_session() as session:
@@ -400,6 +745,44 @@ class DatabaseManager:
 
             return queue_items
 
+    async def get_guild_queue_window(self, guild_id: int, offset: int = 0,
+                                     limit: int = 10) -> Tuple[List[dict], int]:
+        """
+        ギルドのキューを範囲指定で取得 (楽曲情報付き)
+
+        パフォーマンス最適化:
+        - OFFSET/LIMITで表示範囲のみ取得（大規模プレイリストでも一定コスト）
+        - 総数はCOUNTクエリで取得し、行データは読み込まない
+
+        Returns:
+            (表示範囲のキュー項目, キュー総数)
+        """
+        async with self.async_session() as session:
+            count_statement = select(func.count()).select_from(Queue).where(Queue.guild_id == guild_id)
+            total = (await session.execute(count_statement)).scalar_one()
+
+            if total == 0 or offset >= total:
+                return [], total
+
+            statement = select(Queue, Track).join(Track, Queue.track_id == Track.id).where(
+                Queue.guild_id == guild_id
+            ).order_by(Queue.position).offset(offset).limit(limit)
+            result = await session.execute(statement)
+
+            queue_items = [
+                {
+                    'queue_id': queue_item.id,
+                    'position': queue_item.position,
+                    'title': track.title,
+                    'artist': track.artist,
+                    'duration': track.duration,
+                    'url': track.url,
+                    'thumbnail_url': track.thumbnail_url
+                }
+                for queue_item, track in result.all()
+            ]
+            return queue_items, total
+
     async def clear_queue(self, guild_id: int) -> int:
         """キューをクリア"""
         async with self.transaction() as session:
@@ -29,6 +29,7 @@ class LogType(str, Enum):
     # メッセージ関連
     MESSAGE_DELETE = "message_delete"
     MESSAGE_EDIT = "message_edit"
+    MESSAGE_BULK_DELETE = "message_bulk_delete"
 
     # メンバー関連
     MEMBER_JOIN = "member_join"
@@ -92,13 +93,30 @@ class Log(SQLModel, table=True):
     channel_id: Optional[int] = None
     action: str
     details: Optional[str] = None
+    payload: Optional[str] = None  # ログタイプ別の構造化データ（JSON）
     timestamp: datetime = Field(default_factory=datetime.now)
 
 
+class MessageSnapshot(SQLModel, table=True):
+    """メモリから退避したメッセージ内容（削除・編集ログ用）"""
+    message_id: int = Field(primary_key=True)
+    guild_id: int = Field(index=True)
+    channel_id: int
+    author_id: int
+    author_tag: str
+    author_bot: bool = False
+    content: Optional[str] = None
+    attachments: Optional[str] = None  # 改行区切りのファイル名
+    created_at: int = 0  # メッセージ作成時刻（UNIX秒）
+    stored_at: datetime = Field(default_factory=datetime.now, index=True)
+
+
 class GuildSettings(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     guild_id: int = Field(unique=True)
     log_channel_id: Optional[int] = None
+    log_webhook_id: Optional[int] = None
+    log_webhook_token: Optional[str] = None
     ticket_category_id: Optional[int] = None
     ticket_archive_category_id: Optional[int] = None
     auto_role_id: Optional[int] = None
@@ -184,7 +202,7 @@ class Track(SQLModel, table=True):
 
 class Queue(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    guild_id: int
+    guild_id: int = Field(index=True)
     track_id: int
     position: int
     added_by: int
@@ -0,0 +1,29 @@
+# Logger delivery module for Luna bot
+
+from .records import LogRecord, LOG_TITLES
+from .payloads import (LOG_PAYLOAD_SCHEMAS, CHANGE_LABELS, encode_payload, decode_payload, describe_log,
+                       change_entry, permission_changes, format_change)
+from .renderer import LogEmbedRenderer
+from .outbox import LogOutbox
+from .routing import LogRouter
+from .webhook_delivery import WebhookDelivery
+from .message_store import MessageContentStore, StoredMessage
+
+__all__ = [
+    'LogRecord',
+    'LOG_TITLES',
+    'LOG_PAYLOAD_SCHEMAS',
+    'CHANGE_LABELS',
+    'encode_payload',
+    'decode_payload',
+    'describe_log',
+    'change_entry',
+    'permission_changes',
+    'format_change',
+    'LogEmbedRenderer',
+    'LogOutbox',
+    'LogRouter',
+    'WebhookDelivery',
+    'MessageContentStore',
+    'StoredMessage'
+]
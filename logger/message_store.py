@@ -0,0 +1,263 @@
+import asyncio
+import logging
+import sys
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+
+import discord
+
+
+class StoredMessage:
+    """削除・編集ログ用に保持するメッセージの最小限の情報"""
+
+    __slots__ = ("message_id", "guild_id", "channel_id", "author_id", "author_tag",
+                 "author_bot", "content", "attachments", "created_at")
+
+    def __init__(self, message_id: int, guild_id: int, channel_id: int, author_id: int,
+                 author_tag: str, author_bot: bool, content: str,
+                 attachments: Tuple[str, ...] = (), created_at: int = 0):
+        self.message_id = message_id
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.author_id = author_id
+        self.author_tag = author_tag
+        self.author_bot = author_bot
+        self.content = content
+        self.attachments = attachments
+        self.created_at = created_at
+
+    @classmethod
+    def from_message(cls, message: discord.Message) -> "StoredMessage":
+        return cls(
+            message_id=message.id,
+            guild_id=message.guild.id,
+            channel_id=message.channel.id,
+            author_id=message.author.id,
+            author_tag=str(message.author),
+            author_bot=message.author.bot,
+            content=message.content,
+            attachments=tuple(att.filename for att in message.attachments[:10]),
+            created_at=int(message.created_at.timestamp())
+        )
+
+    def to_row(self) -> Dict[str, Any]:
+        """MessageSnapshot 用の行"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class MessageContentStore:
+    """
+    削除・編集ログ用のメッセージ内容ストア
+
+    設計:
+    - discord.Message 全体ではなく __slots__ の軽量レコードのみ保持
+    - ギルドごとに上限付きのリング（古いものから破棄）
+    - spillを有効にすると、破棄されたレコードをまとめてSQLiteへ退避し、
+      メモリにない古いメッセージの削除・編集もログに内容を残せる
+    """
+
+    SPILL_BATCH_SIZE = 100
+    # 書き込み失敗時に退避待ちとして保持する上限（超えた分は古いものから破棄）
+    MAX_SPILL_PENDING = SPILL_BATCH_SIZE * 50
+    # 書き込み失敗後、次の退避を試みるまでの待ち時間
+    SPILL_RETRY_SECONDS = 30.0
+    PRUNE_INTERVAL_SECONDS = 3600
+
+    def __init__(self, max_per_guild: int = 1000, database=None, retention_days: int = 7):
+        self.max_per_guild = max(1, max_per_guild)
+        self.database = database
+        self.retention_days = retention_days
+        self.logger = logging.getLogger(__name__)
+
+        self._rings: Dict[int, "OrderedDict[int, StoredMessage]"] = {}
+        self._spill_pending: List[StoredMessage] = []
+        self._spill_task: Optional[asyncio.Task] = None
+        self._last_prune = 0.0
+        self._spill_retry_at = 0.0
+
+        self._stats = {
+            "stored": 0,
+            "evicted": 0,
+            "spilled": 0,
+            "hits": 0,
+            "spill_hits": 0,
+            "misses": 0,
+            "spill_failures": 0,
+            "spill_dropped": 0
+        }
+
+    # ===== 書き込み =====
+
+    def add(self, message: discord.Message) -> None:
+        """メッセージを記録（編集時は内容を置き換えて最新扱いにする）"""
+        record = StoredMessage.from_message(message)
+        ring = self._rings.setdefault(record.guild_id, OrderedDict())
+        ring[record.message_id] = record
+        ring.move_to_end(record.message_id)
+        self._stats["stored"] += 1
+
+        if len(ring) > self.max_per_guild:
+            _, evicted = ring.popitem(last=False)
+            self._stats["evicted"] += 1
+            if self.database:
+                self._spill_pending.append(evicted)
+                if len(self._spill_pending) > self.MAX_SPILL_PENDING:
+                    self._trim_spill_pending()
+                if len(self._spill_pending) >= self.SPILL_BATCH_SIZE:
+                    self._schedule_spill()
+
+    def discard(self, guild_id: int, message_id: int) -> None:
+        """メモリ上の記録のみ破棄（内容が別途分かる削除時用、退避先は参照しない）"""
+        ring = self._rings.get(guild_id)
+        if ring is not None:
+            ring.pop(message_id, None)
+
+    def forget_guild(self, guild_id: int) -> None:
+        """ギルドの記録を破棄（ギルド脱退時）"""
+        self._rings.pop(guild_id, None)
+
+    # ===== 読み込み =====
+
+    async def get(self, guild_id: int, message_id: int) -> Optional[StoredMessage]:
+        """記録済みメッセージを取得（メモリ → 退避先の順）"""
+        record = self._rings.get(guild_id, {}).get(message_id)
+        if record:
+            self._stats["hits"] += 1
+            return record
+
+        found = await self._load_spilled(guild_id, [message_id], remove=False)
+        return found.get(message_id)
+
+    async def pop_many(self, guild_id: int, message_ids: Iterable[int]) -> Dict[int, StoredMessage]:
+        """削除されたメッセージの記録を取り出す（見つかった分のみ）"""
+        ring = self._rings.get(guild_id, {})
+        found: Dict[int, StoredMessage] = {}
+        missing: List[int] = []
+
+        for message_id in message_ids:
+            record = ring.pop(message_id, None)
+            if record:
+                found[message_id] = record
+            else:
+                missing.append(message_id)
+        self._stats["hits"] += len(found)
+
+        if missing:
+            found.update(await self._load_spilled(guild_id, missing, remove=True))
+        return found
+
+    async def pop(self, guild_id: int, message_id: int) -> Optional[StoredMessage]:
+        """削除されたメッセージの記録を1件取り出す"""
+        return (await self.pop_many(guild_id, [message_id])).get(message_id)
+
+    async def _load_spilled(self, guild_id: int, message_ids: List[int], remove: bool) -> Dict[int, StoredMessage]:
+        if not self.database:
+            self._stats["misses"] += len(message_ids)
+            return {}
+
+        # 退避待ちのレコードを先に確認
+        wanted = set(message_ids)
+        found = {record.message_id: record for record in self._spill_pending
+                 if record.guild_id == guild_id and record.message_id in wanted}
+        if remove and found:
+            self._spill_pending = [record for record in self._spill_pending if record.message_id not in found]
+
+        remaining = [message_id for message_id in message_ids if message_id not in found]
+        if remaining:
+            try:
+                snapshots = await self.database.get_message_snapshots(guild_id, remaining, remove=remove)
+            except Exception as e:
+                self.logger.error(f"Failed to load spilled messages for guild {guild_id}: {e}")
+                snapshots = []
+
+            for snapshot in snapshots:
+                found[snapshot.message_id] = StoredMessage(
+                    message_id=snapshot.message_id,
+                    guild_id=snapshot.guild_id,
+                    channel_id=snapshot.channel_id,
+                    author_id=snapshot.author_id,
+                    author_tag=snapshot.author_tag,
+                    author_bot=snapshot.author_bot,
+                    content=snapshot.content or "",
+                    attachments=tuple(filter(None, (snapshot.attachments or "").split("\n"))),
+                    created_at=snapshot.created_at
+                )
+
+        self._stats["spill_hits"] += len(found)
+        self._stats["misses"] += len(message_ids) - len(found)
+        return found
+
+    # ===== 退避 =====
+
+    def _schedule_spill(self) -> None:
+        # 書き込み失敗直後は再試行を待つ（失敗中にイベントごとに書き込みを試みない）
+        if time.monotonic() < self._spill_retry_at:
+            return
+        if self._spill_task is None or self._spill_task.done():
+            self._spill_task = asyncio.create_task(self.flush())
+
+    async def flush(self) -> None:
+        """退避待ちのレコードをSQLiteへ書き込み、保持期間を過ぎたものを削除"""
+        if not self.database:
+            return
+
+        # 書き込み完了までは退避待ちに残し、書き込み中の検索でも見つかるようにする
+        # 書き込みに成功した分だけ取り除く（失敗時は次回の退避で再試行）
+        pending = list(self._spill_pending)
+        if pending:
+            rows = []
+            for record in pending:
+                row = record.to_row()
+                row["attachments"] = "\n".join(record.attachments) or None
+                rows.append(row)
+            try:
+                await self.database.save_message_snapshots(rows)
+            except Exception as e:
+                self._stats["spill_failures"] += 1
+                self._spill_retry_at = time.monotonic() + self.SPILL_RETRY_SECONDS
+                self._trim_spill_pending()
+                self.logger.error(f"Failed to spill {len(pending)} messages (will retry): {e}")
+                return
+
+            # 同一オブジェクトで判定（書き込み中に同じIDが再度追加された場合はそちらを残す）
+            done = {id(record) for record in pending}
+            self._spill_pending = [record for record in self._spill_pending if id(record) not in done]
+            self._stats["spilled"] += len(rows)
+            self._spill_retry_at = 0.0
+
+        if time.monotonic() - self._last_prune >= self.PRUNE_INTERVAL_SECONDS:
+            self._last_prune = time.monotonic()
+            try:
+                await self.database.prune_message_snapshots(self.retention_days)
+            except Exception as e:
+                self.logger.error(f"Failed to prune spilled messages: {e}")
+
+    def _trim_spill_pending(self) -> None:
+        """退避待ちが上限を超えた場合は古いものから破棄"""
+        overflow = len(self._spill_pending) - self.MAX_SPILL_PENDING
+        if overflow > 0:
+            del self._spill_pending[:overflow]
+            self._stats["spill_dropped"] += overflow
+            self.logger.warning(f"Dropped {overflow} pending spilled messages (database unavailable)")
+
+    async def shutdown(self) -> None:
+        """実行中の退避を待ち、残りを書き込む"""
+        if self._spill_task and not self._spill_task.done():
+            await self._spill_task
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ストア統計を取得（メモリ使用量はレコードと本文の概算）"""
+        messages = sum(len(ring) for ring in self._rings.values())
+        approx_bytes = sum(
+            sys.getsizeof(record) + sys.getsizeof(record.content) + sys.getsizeof(record.author_tag)
+            for ring in self._rings.values() for record in ring.values()
+        )
+        return {
+            **self._stats,
+            "guilds": len(self._rings),
+            "messages": messages,
+            "approx_bytes": approx_bytes,
+            "pending_spill": len(self._spill_pending)
+        }
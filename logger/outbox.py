@@ -0,0 +1,184 @@
+import asyncio
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Any, Optional, Union
+
+import discord
+
+from common import EmbedBuilder, UIColors
+from .records import LogRecord
+
+
+# Discordの1メッセージあたりの制限
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+@dataclass
+class _ChannelBuffer:
+    """チャンネル単位の送信待ちバッファ"""
+    items: List[Union[discord.Embed, LogRecord]] = field(default_factory=list)
+    overflow: Counter = field(default_factory=Counter)
+
+
+class LogOutbox:
+    """
+    ログチャンネル向けの送信バッファ
+
+    設計:
+    - チャンネルごとに短時間バッファし、最大10件のEmbedを1メッセージにまとめて送信
+    - 1メッセージの合計文字数（6000字）を超えないよう分割
+    - 1回の送信枠で保持できる件数を超えた分は件数のみ集計し「+N件」の要約Embedにまとめる
+    - 送信の同時実行数はセマフォで制限
+    - LogRecordは送信直前にEmbedへ変換（要約に回った分は変換しない）
+    """
+
+    def __init__(
+        self,
+        sender: Callable[[int, List[discord.Embed]], Awaitable[None]],
+        renderer: Optional[Callable[[LogRecord], discord.Embed]] = None,
+        flush_interval: float = 2.0,
+        max_pending: int = 50,
+        max_concurrency: int = 5
+    ):
+        self.sender = sender
+        self.renderer = renderer
+        self.flush_interval = max(0.0, flush_interval)
+        self.max_pending = max(1, max_pending)
+        self.logger = logging.getLogger(__name__)
+
+        self._buffers: Dict[int, _ChannelBuffer] = {}
+        self._flush_tasks: Dict[int, asyncio.Task] = {}
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._closed = False
+
+        self._stats = {
+            "embeds_enqueued": 0,
+            "embeds_sent": 0,
+            "embeds_summarized": 0,
+            "records_rendered": 0,
+            "render_failures": 0,
+            "messages_sent": 0,
+            "send_failures": 0
+        }
+
+    def enqueue(self, channel_id: int, item: Union[discord.Embed, LogRecord]) -> None:
+        """EmbedまたはLogRecordを送信待ちに追加（送信は次のフラッシュで実行）"""
+        self._stats["embeds_enqueued"] += 1
+        buffer = self._buffers.setdefault(channel_id, _ChannelBuffer())
+
+        if len(buffer.items) < self.max_pending:
+            buffer.items.append(item)
+        else:
+            # バースト時は件数のみ保持（メモリとメッセージ数を抑制）
+            buffer.overflow[item.title or "ログ"] += 1
+            self._stats["embeds_summarized"] += 1
+
+        self._schedule_flush(channel_id)
+
+    def _schedule_flush(self, channel_id: int) -> None:
+        if self._closed or channel_id in self._flush_tasks:
+            return
+        self._flush_tasks[channel_id] = asyncio.create_task(self._flush_after(channel_id))
+
+    async def _flush_after(self, channel_id: int) -> None:
+        try:
+            if self.flush_interval:
+                await asyncio.sleep(self.flush_interval)
+            await self._flush(channel_id)
+        finally:
+            self._flush_tasks.pop(channel_id, None)
+            # 送信中に追加された分は次の送信枠で処理
+            if channel_id in self._buffers:
+                self._schedule_flush(channel_id)
+
+    async def _flush(self, channel_id: int) -> None:
+        """バッファを取り出してまとめて送信"""
+        buffer = self._buffers.pop(channel_id, None)
+        if not buffer:
+            return
+
+        embeds = self._render(buffer.items)
+        if buffer.overflow:
+            embeds.append(self._build_overflow_embed(buffer.overflow))
+
+        for batch in self._pack(embeds):
+            async with self._semaphore:
+                try:
+                    await self.sender(channel_id, batch)
+                except Exception as e:
+                    # チャンネル消失・権限不足などは残りも失敗するため打ち切り
+                    self._stats["send_failures"] += 1
+                    self.logger.warning(f"Failed to deliver {len(batch)} log embeds to channel {channel_id}: {e}")
+                    return
+
+            self._stats["messages_sent"] += 1
+            self._stats["embeds_sent"] += len(batch)
+
+    def _render(self, items: List[Union[discord.Embed, LogRecord]]) -> List[discord.Embed]:
+        """LogRecordをEmbedに変換（描画に失敗したレコードは除外）"""
+        embeds = []
+        for item in items:
+            if isinstance(item, discord.Embed):
+                embeds.append(item)
+                continue
+
+            try:
+                embeds.append(self.renderer(item))
+                self._stats["records_rendered"] += 1
+            except Exception as e:
+                self._stats["render_failures"] += 1
+                self.logger.error(f"Failed to render {item.log_type.value} log for guild {item.guild_id}: {e}")
+        return embeds
+
+    @staticmethod
+    def _pack(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+        """件数・合計文字数の制限内でEmbedをメッセージ単位にまとめる"""
+        batches: List[List[discord.Embed]] = []
+        current: List[discord.Embed] = []
+        current_chars = 0
+
+        for embed in embeds:
+            size = len(embed)
+            if current and (len(current) >= MAX_EMBEDS_PER_MESSAGE or
+                            current_chars + size > MAX_EMBED_CHARS_PER_MESSAGE):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(embed)
+            current_chars += size
+
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def _build_overflow_embed(overflow: Counter) -> discord.Embed:
+        """バッファ上限を超えたイベントの要約Embed"""
+        lines = [f"• {title}: **+{count:,}件**" for title, count in overflow.most_common(10)]
+        if len(overflow) > 10:
+            lines.append(f"... 他{len(overflow) - 10}種類")
+
+        return EmbedBuilder.create_base_embed(
+            title=f"📦 ログ要約 (+{sum(overflow.values()):,}件)",
+            description="短時間に大量のイベントが発生したため、以下は件数のみ表示しています\n" + "\n".join(lines),
+            color=UIColors.WARNING
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """送信統計を取得"""
+        return {
+            **self._stats,
+            "messages_saved": self._stats["embeds_sent"] - self._stats["messages_sent"],
+            "pending_channels": len(self._buffers)
+        }
+
+    async def shutdown(self) -> None:
+        """待機中のタイマーを止め、残りのバッファを即時送信"""
+        self._closed = True
+        for task in list(self._flush_tasks.values()):
+            task.cancel()
+        self._flush_tasks.clear()
+
+        for channel_id in list(self._buffers):
+            await self._flush(channel_id)
@@ -0,0 +1,214 @@
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from database.models import LogType
+
+
+# ログタイプごとにDBへ保存する項目（表示専用のURLや件数などは保存しない）
+# ペイロードはこの順序の配列として保存するため、項目の追加は末尾のみ・削除や並べ替えは不可
+LOG_PAYLOAD_SCHEMAS: Dict[LogType, Tuple[str, ...]] = {
+    LogType.MESSAGE_DELETE: ("author_tag", "message_id", "content", "attachments"),
+    LogType.MESSAGE_EDIT: ("author_tag", "message_id", "before", "after"),
+    LogType.MESSAGE_BULK_DELETE: ("count", "known", "first_at", "last_at", "authors"),
+    LogType.MEMBER_JOIN: ("user_tag", "created_at"),
+    LogType.MEMBER_LEAVE: ("user_tag", "joined_at", "role_ids"),
+    LogType.MEMBER_BAN: ("user_tag", "reason"),
+    LogType.MEMBER_UNBAN: ("user_tag",),
+    LogType.CHANNEL_CREATE: ("name", "channel_type", "category", "position"),
+    LogType.CHANNEL_DELETE: ("name", "channel_type", "category", "position"),
+    LogType.CHANNEL_UPDATE: ("name", "channel_type", "changes"),
+    LogType.ROLE_CREATE: ("role_id", "name", "color", "position", "administrator"),
+    LogType.ROLE_DELETE: ("role_id", "name", "color", "member_count"),
+    LogType.ROLE_UPDATE: ("role_id", "name", "changes"),
+    LogType.GUILD_UPDATE: ("guild_name", "changes"),
+    LogType.GUILD_EMOJIS_UPDATE: ("added", "added_count", "removed", "removed_count"),
+    LogType.BOT_READY: ("guilds", "users", "latency_ms"),
+    LogType.WEBSOCKET_CONNECT: (),
+    LogType.WEBSOCKET_DISCONNECT: (),
+    LogType.WEBSOCKET_RECONNECT: (),
+}
+
+_EMPTY = (None, "", [], {})
+
+# 本文など長いテキストの保存上限（文字数）
+MAX_TEXT_LENGTH = 500
+
+
+def _compact(value: Any) -> Any:
+    if value in _EMPTY:
+        return None
+    if isinstance(value, str) and len(value) > MAX_TEXT_LENGTH:
+        return value[:MAX_TEXT_LENGTH]
+    return value
+
+
+def encode_payload(log_type: LogType, data: Dict[str, Any]) -> Optional[str]:
+    """
+    スキーマに定義された項目を空白なしのJSONに変換
+
+    - スキーマのあるタイプはキー名を省いた配列（末尾の空の値は省略）
+    - スキーマのないタイプは空の値を除いたオブジェクト
+    """
+    keys = LOG_PAYLOAD_SCHEMAS.get(log_type)
+    if keys is None:
+        payload: Any = {key: value for key, value in ((key, _compact(value)) for key, value in data.items())
+                        if value is not None}
+    else:
+        payload = [_compact(data.get(key)) for key in keys]
+        while payload and payload[-1] is None:
+            payload.pop()
+
+    if not payload:
+        return None
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def decode_payload(log_type: LogType, payload: Optional[str]) -> Dict[str, Any]:
+    """保存済みペイロードを辞書に復元（壊れたデータは空として扱う）"""
+    if not payload:
+        return {}
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return {}
+
+    if isinstance(data, list):
+        keys = LOG_PAYLOAD_SCHEMAS.get(log_type, ())
+        return {key: value for key, value in zip(keys, data) if value is not None}
+    return data if isinstance(data, dict) else {}
+
+
+# ===== 変更内容 =====
+# 更新系ログの changes は [項目, 変更前, 変更後] の配列として保存し、表示名と整形は読み出し時に行う
+# （権限は "permissions.<権限名>" の項目に真偽値の組で保存）
+# 例: [["name","old","new"],["permissions.administrator",false,true]]
+
+PERMISSION_PREFIX = "permissions."
+
+# 項目名 → (表示名, 表示時の最大文字数)
+CHANGE_LABELS: Dict[str, Tuple[str, int]] = {
+    "name": ("名前", 100),
+    "topic": ("トピック", 50),
+    "position": ("ポジション", 0),
+    "category": ("カテゴリ", 100),
+    "nsfw": ("NSFW", 0),
+    "slowmode_delay": ("低速モード", 0),
+    "color": ("色", 0),
+    "mentionable": ("メンション可能", 0),
+    "hoist": ("別表示", 0),
+    "icon": ("アイコン", 0),
+    "banner": ("バナー", 0),
+    "description": ("説明", 30),
+    "verification_level": ("認証レベル", 0),
+    "mfa_level": ("MFA要求", 0),
+}
+
+PERMISSION_LABELS: Dict[str, str] = {
+    "administrator": "管理者",
+    "manage_guild": "サーバー管理",
+    "manage_roles": "ロール管理",
+    "manage_channels": "チャンネル管理",
+}
+
+# 値ではなく変更があったことのみを表示する項目（画像のハッシュなど）
+_CHANGED_ONLY_FIELDS = {"icon", "banner"}
+
+# 変更前後の値の保存上限（文字数）
+MAX_CHANGE_VALUE_LENGTH = 100
+
+
+def _change_value(value: Any) -> Any:
+    if isinstance(value, str) and len(value) > MAX_CHANGE_VALUE_LENGTH:
+        return value[:MAX_CHANGE_VALUE_LENGTH]
+    return value
+
+
+def change_entry(field: str, before: Any, after: Any) -> List[Any]:
+    """変更内容1件を保存形式に変換"""
+    return [field, _change_value(before), _change_value(after)]
+
+
+def permission_changes(before: Iterable[Tuple[str, bool]], after: Any) -> List[List[Any]]:
+    """権限（discord.Permissions）の差分を権限ごとの変更内容に変換"""
+    return [
+        change_entry(f"{PERMISSION_PREFIX}{name}", value, getattr(after, name))
+        for name, value in before
+        if getattr(after, name) != value
+    ]
+
+
+def _format_change_value(field: str, value: Any, limit: int) -> str:
+    if value is None or value == "":
+        return "なし"
+    if field == "slowmode_delay":
+        return f"{value}秒"
+    text = str(value)
+    if limit and len(text) > limit:
+        return text[:limit - 3] + "..."
+    return text
+
+
+def format_change(entry: Any) -> str:
+    """変更内容1件を表示用の文字列に整形（旧形式の整形済み文字列はそのまま返す）"""
+    if isinstance(entry, str):
+        return entry
+    try:
+        field, before, after = entry
+    except (TypeError, ValueError):
+        return str(entry)
+
+    if field.startswith(PERMISSION_PREFIX):
+        name = field[len(PERMISSION_PREFIX):]
+        return f"権限 {PERMISSION_LABELS.get(name, name)}: {before} → {after}"
+
+    label, limit = CHANGE_LABELS.get(field, (field, 0))
+    if field in _CHANGED_ONLY_FIELDS:
+        return f"{label}が変更されました"
+    return (f"{label}: `{_format_change_value(field, before, limit)}` → "
+            f"`{_format_change_value(field, after, limit)}`")
+
+
+def _changes(data: Dict[str, Any]) -> str:
+    return " / ".join(format_change(entry) for entry in data.get("changes", []))
+
+
+def _user(data: Dict[str, Any]) -> str:
+    return data.get("user_tag", "")
+
+
+# 表示時（読み出し時）の1行要約
+_SUMMARIES: Dict[LogType, Callable[[Dict[str, Any]], str]] = {
+    LogType.MESSAGE_DELETE: lambda data: " ".join(filter(None, [
+        data.get("content") or "(本文なし)",
+        f"[添付: {', '.join(data['attachments'])}]" if data.get("attachments") else None
+    ])),
+    LogType.MESSAGE_EDIT: lambda data: f"{data.get('before') or '(本文なし)'} → {data.get('after') or '(本文なし)'}",
+    LogType.MESSAGE_BULK_DELETE: lambda data: f"{data.get('count', 0)}件 (内容取得: {data.get('known', 0)}件) " + ", ".join(
+        f"{tag}: {count}" for tag, count in data.get("authors", [])
+    ),
+    LogType.MEMBER_JOIN: _user,
+    LogType.MEMBER_LEAVE: _user,
+    LogType.MEMBER_BAN: lambda data: f"{_user(data)} 理由: {data['reason']}" if data.get("reason") else _user(data),
+    LogType.MEMBER_UNBAN: _user,
+    LogType.CHANNEL_CREATE: lambda data: f"{data.get('name', '')} ({data.get('channel_type', '')})",
+    LogType.CHANNEL_DELETE: lambda data: f"{data.get('name', '')} ({data.get('channel_type', '')})",
+    LogType.CHANNEL_UPDATE: lambda data: f"{data.get('name', '')}: {_changes(data)}",
+    LogType.ROLE_CREATE: lambda data: data.get("name", ""),
+    LogType.ROLE_DELETE: lambda data: f"{data.get('name', '')} (メンバー: {data.get('member_count', 0)})",
+    LogType.ROLE_UPDATE: lambda data: f"{data.get('name', '')}: {_changes(data)}",
+    LogType.GUILD_UPDATE: _changes,
+    LogType.GUILD_EMOJIS_UPDATE: lambda data: f"追加: {data.get('added_count', 0)}, 削除: {data.get('removed_count', 0)}",
+    LogType.BOT_READY: lambda data: f"サーバー: {data.get('guilds', 0)}, ユーザー: {data.get('users', 0)}, レイテンシ: {data.get('latency_ms', 0)}ms",
+}
+
+
+def describe_log(log_type: LogType, payload: Optional[str], details: Optional[str] = None) -> str:
+    """ログの表示用要約（構造化ペイロードがない旧形式のログはdetailsを使用）"""
+    data = decode_payload(log_type, payload)
+    if not data:
+        return details or ""
+
+    summary = _SUMMARIES.get(log_type)
+    if summary:
+        return summary(data)
+    return ", ".join(f"{key}: {value}" for key, value in data.items())
@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from database.models import LogType
+from common import LogUtils
+from .payloads import encode_payload
+
+
+# ログタイプごとの表示タイトル（要約表示にも使用）
+LOG_TITLES: Dict[LogType, str] = {
+    LogType.MESSAGE_DELETE: "メッセージ削除",
+    LogType.MESSAGE_EDIT: "メッセージ編集",
+    LogType.MESSAGE_BULK_DELETE: "メッセージ一括削除",
+    LogType.MEMBER_JOIN: "メンバー参加",
+    LogType.MEMBER_LEAVE: "メンバー退出",
+    LogType.MEMBER_BAN: "メンバーBAN",
+    LogType.MEMBER_UNBAN: "メンバーBAN解除",
+    LogType.CHANNEL_CREATE: "チャンネル作成",
+    LogType.CHANNEL_DELETE: "チャンネル削除",
+    LogType.CHANNEL_UPDATE: "チャンネル更新",
+    LogType.ROLE_CREATE: "ロール作成",
+    LogType.ROLE_DELETE: "ロール削除",
+    LogType.ROLE_UPDATE: "ロール更新",
+    LogType.GUILD_UPDATE: "サーバー更新",
+    LogType.GUILD_EMOJIS_UPDATE: "絵文字更新",
+}
+
+
+@dataclass(slots=True)
+class LogRecord:
+    """
+    イベント発生時に取得するログの構造化レコード
+
+    - DB保存用の列と、Embed描画用の最小限のプリミティブ値（data）のみ保持
+    - dataのうちスキーマに定義された項目のみをペイロードとしてDBに保存
+    - Embedへの変換は送信直前にLogEmbedRendererで行う（送信先がなければ変換しない）
+    """
+    guild_id: int
+    log_type: LogType
+    action: str
+    user_id: Optional[int] = None
+    moderator_id: Optional[int] = None
+    channel_id: Optional[int] = None
+    details: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    @property
+    def title(self) -> str:
+        """表示用タイトル（絵文字付き）"""
+        return f"{LogUtils.get_log_emoji(self.log_type)} {LOG_TITLES.get(self.log_type, self.action)}"
+
+    def to_log_kwargs(self) -> Dict[str, Any]:
+        """DatabaseManager.create_log 用の引数"""
+        return {
+            "guild_id": self.guild_id,
+            "log_type": self.log_type,
+            "action": self.action,
+            "user_id": self.user_id,
+            "moderator_id": self.moderator_id,
+            "channel_id": self.channel_id,
+            "details": self.details,
+            "payload": encode_payload(self.log_type, self.data)
+        }
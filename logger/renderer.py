@@ -0,0 +1,295 @@
+from typing import Any, Callable, Dict, List
+
+import discord
+
+from database.models import LogType
+from common import EmbedBuilder, LogUtils, UIEmojis, UIColors, UserFormatter
+from .payloads import format_change
+from .records import LogRecord
+
+
+class LogEmbedRenderer:
+    """LogRecord → discord.Embed の変換（送信直前にのみ実行）"""
+
+    @classmethod
+    def render(cls, record: LogRecord) -> discord.Embed:
+        """ログタイプに対応する描画関数でEmbedを作成"""
+        renderer = _RENDERERS.get(record.log_type)
+        embed = EmbedBuilder.create_base_embed(
+            title=record.title,
+            color=LogUtils.get_log_color(record.log_type)
+        )
+        embed.timestamp = record.timestamp.astimezone()
+        if renderer:
+            renderer(embed, record)
+        elif record.details:
+            embed.description = record.details
+        return embed
+
+    # ===== 共通フォーマット =====
+
+    @staticmethod
+    def _time(record: LogRecord, style: str = "F") -> str:
+        return f"<t:{int(record.timestamp.timestamp())}:{style}>"
+
+    @staticmethod
+    def _user(user_id: int, tag: str) -> str:
+        return f"<@{user_id}>\n`{tag}`"
+
+    @staticmethod
+    def _changes(changes: List[Any], limit: int) -> str:
+        lines = [f"• {format_change(change)}" for change in changes[:limit]]
+        if len(changes) > limit:
+            lines.append(f"…他 {len(changes) - limit}件")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _channel_meta(embed: discord.Embed, record: LogRecord, time_label: str) -> None:
+        data = record.data
+        embed.add_field(name="📝 チャンネル名", value=f"#{data['name']}", inline=True)
+        embed.add_field(name="🆔 チャンネルID", value=UserFormatter.format_id(record.channel_id), inline=True)
+        embed.add_field(name="📋 タイプ", value=data["channel_type"], inline=True)
+        embed.add_field(name=time_label, value=LogEmbedRenderer._time(record), inline=True)
+
+        if data.get("category"):
+            embed.add_field(name="📁 カテゴリ", value=data["category"], inline=True)
+        if data.get("position") is not None:
+            embed.add_field(name="📍 ポジション", value=str(data["position"]), inline=True)
+
+    # ===== メッセージ =====
+
+    @staticmethod
+    def _message_delete(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name="🏠 チャンネル", value=f"<#{record.channel_id}>", inline=True)
+        embed.add_field(name=f"{UIEmojis.USER} 送信者", value=LogEmbedRenderer._user(record.user_id, data["author_tag"]), inline=True)
+        embed.add_field(name="🕐 削除時刻", value=LogEmbedRenderer._time(record, "T"), inline=True)
+
+        if data.get("content"):
+            embed.add_field(
+                name="📝 削除された内容",
+                value=UserFormatter.format_code_block(UserFormatter.truncate_text(data["content"], 1000)),
+                inline=False
+            )
+
+        if data.get("attachments"):
+            embed.add_field(
+                name="📎 添付ファイル",
+                value="\n".join([f"• {name}" for name in data["attachments"][:10]]),
+                inline=False
+            )
+
+        embed.set_footer(text=f"メッセージID: {data['message_id']}")
+
+    @staticmethod
+    def _message_edit(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name="🏠 チャンネル", value=f"<#{record.channel_id}>", inline=True)
+        embed.add_field(name=f"{UIEmojis.USER} 編集者", value=LogEmbedRenderer._user(record.user_id, data["author_tag"]), inline=True)
+        embed.add_field(name="🕐 編集時刻", value=LogEmbedRenderer._time(record, "T"), inline=True)
+
+        if data.get("before"):
+            embed.add_field(
+                name="📝 編集前",
+                value=UserFormatter.format_code_block(UserFormatter.truncate_text(data["before"], 500)),
+                inline=False
+            )
+
+        if data.get("after"):
+            embed.add_field(
+                name="📝 編集後",
+                value=UserFormatter.format_code_block(UserFormatter.truncate_text(data["after"], 500)),
+                inline=False
+            )
+
+        embed.add_field(name="🔗 メッセージリンク", value=f"[メッセージに移動]({data['jump_url']})", inline=False)
+        embed.set_footer(text=f"メッセージID: {data['message_id']}")
+
+    @staticmethod
+    def _message_bulk_delete(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name="🏠 チャンネル", value=f"<#{record.channel_id}>", inline=True)
+        embed.add_field(name="🧮 削除件数", value=f"{data['count']:,}件 (内容取得: {data['known']:,}件)", inline=True)
+        embed.add_field(name="🕐 削除時刻", value=LogEmbedRenderer._time(record, "T"), inline=True)
+        embed.add_field(
+            name="📅 投稿期間",
+            value=f"<t:{data['first_at']}:f> 〜 <t:{data['last_at']}:f>",
+            inline=False
+        )
+
+        if data.get("authors"):
+            embed.add_field(
+                name=f"{UIEmojis.USER} 送信者",
+                value="\n".join([f"• `{tag}`: {count:,}件" for tag, count in data["authors"]]),
+                inline=False
+            )
+
+        if data.get("transcript"):
+            embed.set_footer(text="削除されたメッセージの内容は添付ファイルを参照してください")
+
+    # ===== メンバー =====
+
+    @staticmethod
+    def _member_join(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name=f"{UIEmojis.USER} ユーザー", value=LogEmbedRenderer._user(record.user_id, data["user_tag"]), inline=True)
+        embed.add_field(name="🆔 ユーザーID", value=UserFormatter.format_id(record.user_id), inline=True)
+        embed.add_field(name="📅 アカウント作成日", value=f"<t:{int(data['created_at'])}:F>", inline=True)
+        embed.add_field(name="🕐 参加時刻", value=LogEmbedRenderer._time(record), inline=True)
+
+        if data.get("avatar_url"):
+            embed.set_thumbnail(url=data["avatar_url"])
+
+        account_age_days = (record.timestamp.timestamp() - data["created_at"]) / 86400
+        if account_age_days < 7:
+            embed.add_field(name="⚠️ 注意", value="新しいアカウントです", inline=False)
+            embed.color = UIColors.WARNING
+
+        embed.set_footer(text=f"総メンバー数: {data['member_count']}")
+
+    @staticmethod
+    def _member_leave(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        joined_at = data.get("joined_at")
+        embed.add_field(name=f"{UIEmojis.USER} ユーザー", value=LogEmbedRenderer._user(record.user_id, data["user_tag"]), inline=True)
+        embed.add_field(name="🆔 ユーザーID", value=UserFormatter.format_id(record.user_id), inline=True)
+        embed.add_field(name="📅 参加日", value=f"<t:{int(joined_at)}:F>" if joined_at else "不明", inline=True)
+        embed.add_field(name="🕐 退出時刻", value=LogEmbedRenderer._time(record), inline=True)
+
+        role_ids = data.get("role_ids", [])
+        if role_ids:
+            role_list = " ".join(f"<@&{role_id}>" for role_id in role_ids)
+            remaining = data.get("role_count", len(role_ids)) - len(role_ids)
+            if remaining > 0:
+                role_list += f" (+{remaining}個)"
+            embed.add_field(name="🏷️ 所持ロール", value=role_list, inline=False)
+
+        if data.get("avatar_url"):
+            embed.set_thumbnail(url=data["avatar_url"])
+
+        embed.set_footer(text=f"総メンバー数: {data['member_count']}")
+
+    @staticmethod
+    def _member_ban(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name=f"{UIEmojis.USER} 対象", value=LogEmbedRenderer._user(record.user_id, data["user_tag"]), inline=True)
+        embed.add_field(name="🆔 ユーザーID", value=UserFormatter.format_id(record.user_id), inline=True)
+        embed.add_field(name="🕐 BAN時刻", value=LogEmbedRenderer._time(record), inline=True)
+
+        if data.get("reason"):
+            embed.add_field(name="📝 理由", value=data["reason"], inline=False)
+
+        if data.get("avatar_url"):
+            embed.set_thumbnail(url=data["avatar_url"])
+
+    @staticmethod
+    def _member_unban(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name=f"{UIEmojis.USER} 対象", value=LogEmbedRenderer._user(record.user_id, data["user_tag"]), inline=True)
+        embed.add_field(name="🆔 ユーザーID", value=UserFormatter.format_id(record.user_id), inline=True)
+        embed.add_field(name="🕐 BAN解除時刻", value=LogEmbedRenderer._time(record), inline=True)
+
+        if data.get("avatar_url"):
+            embed.set_thumbnail(url=data["avatar_url"])
+
+    # ===== チャンネル =====
+
+    @staticmethod
+    def _channel_create(embed: discord.Embed, record: LogRecord) -> None:
+        LogEmbedRenderer._channel_meta(embed, record, "🕐 作成時刻")
+
+    @staticmethod
+    def _channel_delete(embed: discord.Embed, record: LogRecord) -> None:
+        LogEmbedRenderer._channel_meta(embed, record, "🕐 削除時刻")
+
+    @staticmethod
+    def _channel_update(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name="📝 チャンネル", value=f"<#{record.channel_id}> (`{data['name']}`)", inline=True)
+        embed.add_field(name="🆔 チャンネルID", value=UserFormatter.format_id(record.channel_id), inline=True)
+        embed.add_field(name="📋 タイプ", value=data["channel_type"], inline=True)
+        embed.add_field(name="🕐 更新時刻", value=LogEmbedRenderer._time(record), inline=True)
+        embed.add_field(name="📝 変更内容", value=LogEmbedRenderer._changes(data["changes"], 10), inline=False)
+
+    # ===== ロール =====
+
+    @staticmethod
+    def _role_create(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name="🏷️ ロール名", value=f"<@&{data['role_id']}>", inline=True)
+        embed.add_field(name="🆔 ロールID", value=UserFormatter.format_id(data["role_id"]), inline=True)
+        embed.add_field(name="🎨 色", value=UserFormatter.format_code_inline(data["color"]), inline=True)
+        embed.add_field(name="📍 ポジション", value=str(data["position"]), inline=True)
+        embed.add_field(name="🔒 権限", value="管理者" if data["administrator"] else "一般", inline=True)
+        embed.add_field(name="🕐 作成時刻", value=LogEmbedRenderer._time(record), inline=True)
+
+    @staticmethod
+    def _role_delete(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name="🏷️ ロール名", value=UserFormatter.format_code_inline(data["name"]), inline=True)
+        embed.add_field(name="🆔 ロールID", value=UserFormatter.format_id(data["role_id"]), inline=True)
+        embed.add_field(name="🎨 色", value=UserFormatter.format_code_inline(data["color"]), inline=True)
+        embed.add_field(name="📍 ポジション", value=str(data["position"]), inline=True)
+        embed.add_field(name="👥 メンバー数", value=f"{data['member_count']}人", inline=True)
+        embed.add_field(name="🕐 削除時刻", value=LogEmbedRenderer._time(record), inline=True)
+
+    @staticmethod
+    def _role_update(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name="🏷️ ロール", value=f"<@&{data['role_id']}>", inline=True)
+        embed.add_field(name="🆔 ロールID", value=UserFormatter.format_id(data["role_id"]), inline=True)
+        embed.add_field(name="🕐 更新時刻", value=LogEmbedRenderer._time(record), inline=True)
+        embed.add_field(name="📝 変更内容", value=LogEmbedRenderer._changes(data["changes"], 8), inline=False)
+
+    # ===== サーバー =====
+
+    @staticmethod
+    def _guild_update(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name="🏛️ サーバー", value=UserFormatter.format_code_inline(data["guild_name"]), inline=True)
+        embed.add_field(name="🆔 サーバーID", value=UserFormatter.format_id(record.guild_id), inline=True)
+        embed.add_field(name="🕐 更新時刻", value=LogEmbedRenderer._time(record), inline=True)
+        embed.add_field(name="📝 変更内容", value=LogEmbedRenderer._changes(data["changes"], 8), inline=False)
+
+        if data.get("icon_url"):
+            embed.set_thumbnail(url=data["icon_url"])
+
+    @staticmethod
+    def _guild_emojis_update(embed: discord.Embed, record: LogRecord) -> None:
+        data = record.data
+        embed.add_field(name="🏛️ サーバー", value=UserFormatter.format_code_inline(data["guild_name"]), inline=True)
+        embed.add_field(name="🕐 更新時刻", value=LogEmbedRenderer._time(record), inline=True)
+        embed.add_field(name="📊 絵文字数", value=f"{data['emoji_count']}個", inline=True)
+
+        added = data.get("added", [])
+        if added:
+            emoji_list = [f"{emoji} (`{name}`)" for emoji, name in added[:5]]
+            if data["added_count"] > 5:
+                emoji_list.append(f"... 他{data['added_count'] - 5}個")
+            embed.add_field(name="➕ 追加された絵文字", value="\n".join(emoji_list), inline=False)
+
+        removed = data.get("removed", [])
+        if removed:
+            emoji_list = [UserFormatter.format_code_inline(name) for name in removed[:5]]
+            if data["removed_count"] > 5:
+                emoji_list.append(f"... 他{data['removed_count'] - 5}個")
+            embed.add_field(name="➖ 削除された絵文字", value="\n".join(emoji_list), inline=False)
+
+
+_RENDERERS: Dict[LogType, Callable[[discord.Embed, LogRecord], None]] = {
+    LogType.MESSAGE_DELETE: LogEmbedRenderer._message_delete,
+    LogType.MESSAGE_EDIT: LogEmbedRenderer._message_edit,
+    LogType.MESSAGE_BULK_DELETE: LogEmbedRenderer._message_bulk_delete,
+    LogType.MEMBER_JOIN: LogEmbedRenderer._member_join,
+    LogType.MEMBER_LEAVE: LogEmbedRenderer._member_leave,
+    LogType.MEMBER_BAN: LogEmbedRenderer._member_ban,
+    LogType.MEMBER_UNBAN: LogEmbedRenderer._member_unban,
+    LogType.CHANNEL_CREATE: LogEmbedRenderer._channel_create,
+    LogType.CHANNEL_DELETE: LogEmbedRenderer._channel_delete,
+    LogType.CHANNEL_UPDATE: LogEmbedRenderer._channel_update,
+    LogType.ROLE_CREATE: LogEmbedRenderer._role_create,
+    LogType.ROLE_DELETE: LogEmbedRenderer._role_delete,
+    LogType.ROLE_UPDATE: LogEmbedRenderer._role_update,
+    LogType.GUILD_UPDATE: LogEmbedRenderer._guild_update,
+    LogType.GUILD_EMOJIS_UPDATE: LogEmbedRenderer._guild_emojis_update,
+}
@@ -0,0 +1,92 @@
+import logging
+import time
+from typing import Dict, Iterable, Optional, Any
+
+
+class LogRouter:
+    """
+    ギルド → ログチャンネルのルーティングテーブル
+
+    設計:
+    - 設定あり（channel_id）・設定なし（None）の両方をキャッシュ
+    - 起動時に全ギルド分を1クエリで事前読み込み
+    - /logger 設定時・チャンネル消失時に個別に更新
+    - 未登録ギルド（起動後に参加したギルドなど）のみDBを参照し、結果をキャッシュ
+    - チャンネル消失による「設定なし」は DROPPED_ROUTE_TTL 秒で期限切れとし、DBから再取得
+      （一時的な404やチャンネルの復旧でログが止まったままにならないように）
+    """
+
+    DROPPED_ROUTE_TTL = 600.0
+
+    def __init__(self, database):
+        self.database = database
+        self.logger = logging.getLogger(__name__)
+
+        self._routes: Dict[int, Optional[int]] = {}
+        # guild_id -> 消失扱いにしたルートの期限（monotonic）
+        self._dropped_until: Dict[int, float] = {}
+        self.preloaded = False
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0
+        }
+
+    async def preload(self, guild_ids: Iterable[int]) -> None:
+        """設定済みチャンネルを一括読み込みし、それ以外のギルドは「設定なし」として登録"""
+        channel_map = await self.database.get_log_channel_map()
+        for guild_id in guild_ids:
+            self._routes[guild_id] = channel_map.get(guild_id)
+        self._routes.update(channel_map)
+        self._dropped_until.clear()
+        self.preloaded = True
+
+        self.logger.info(f"Log routes preloaded: {len(channel_map)} configured, {len(self._routes) - len(channel_map)} without channel")
+
+    async def resolve(self, guild_id: int) -> Optional[int]:
+        """ログチャンネルIDを取得（設定なしはNone）"""
+        dropped_until = self._dropped_until.get(guild_id)
+        if dropped_until is not None and time.monotonic() >= dropped_until:
+            self.invalidate(guild_id)
+
+        if guild_id in self._routes:
+            self._stats["hits"] += 1
+            return self._routes[guild_id]
+
+        self._stats["misses"] += 1
+        settings = await self.database.get_guild_settings(guild_id)
+        channel_id = settings.log_channel_id if settings else None
+        self._routes[guild_id] = channel_id
+        return channel_id
+
+    async def has_destination(self, guild_id: int) -> bool:
+        """ログの送信先があるか（ない場合はEmbed作成を省略できる）"""
+        return await self.resolve(guild_id) is not None
+
+    def set_route(self, guild_id: int, channel_id: Optional[int]) -> None:
+        """ルートを更新（/logger 設定時）"""
+        self._routes[guild_id] = channel_id
+        self._dropped_until.pop(guild_id, None)
+
+    def invalidate(self, guild_id: int) -> None:
+        """キャッシュを破棄し、次回DBから再取得"""
+        self._routes.pop(guild_id, None)
+        self._dropped_until.pop(guild_id, None)
+
+    def drop_channel(self, channel_id: int) -> None:
+        """消失したチャンネルを参照しているルートを一定時間「設定なし」に変更"""
+        expires_at = time.monotonic() + self.DROPPED_ROUTE_TTL
+        for guild_id, routed_channel in self._routes.items():
+            if routed_channel == channel_id:
+                self._routes[guild_id] = None
+                self._dropped_until[guild_id] = expires_at
+
+    def get_stats(self) -> Dict[str, Any]:
+        """ルーティング統計を取得"""
+        configured = sum(1 for channel_id in self._routes.values() if channel_id is not None)
+        return {
+            **self._stats,
+            "configured": configured,
+            "unconfigured": len(self._routes) - configured,
+            "dropped": len(self._dropped_until)
+        }
@@ -0,0 +1,135 @@
+import logging
+from typing import Dict, List, Optional
+
+import aiohttp
+import discord
+
+
+class WebhookDelivery:
+    """
+    Webhook経由のログ配信
+
+    設計:
+    - ログチャンネルごとにWebhookを1つ作成し、GuildSettingsに保存して再利用
+      （保存情報がない場合も、チャンネルに既存の自分のWebhookがあれば作成せずに再利用）
+    - ログチャンネル変更時は旧チャンネルのWebhookを削除（チャンネルあたり15個の上限を消費しない）
+    - BOT本体とは別のaiohttpセッション（接続プール）で送信し、
+      コマンド応答とレート制限バケットを共有しない
+    - Webhook側のレート制限（429）はdiscord.Webhookのアダプタが個別に処理
+    """
+
+    WEBHOOK_NAME = "Luna Logger"
+
+    def __init__(self, database, pool_size: int = 5):
+        self.database = database
+        self.pool_size = max(1, pool_size)
+        self.logger = logging.getLogger(__name__)
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        # channel_id -> Webhook（Noneは作成不可として記憶）
+        self._webhooks: Dict[int, Optional[discord.Webhook]] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """専用セッションを遅延生成（イベントループ上で作成する必要があるため）"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size)
+            )
+        return self._session
+
+    def _partial(self, webhook_id: int, token: str) -> discord.Webhook:
+        return discord.Webhook.partial(webhook_id, token, session=self._get_session())
+
+    async def _get_webhook(self, channel: discord.TextChannel) -> Optional[discord.Webhook]:
+        """保存済みWebhookを取得、なければ作成して保存"""
+        if channel.id in self._webhooks:
+            return self._webhooks[channel.id]
+
+        settings = await self.database.get_guild_settings(channel.guild.id)
+        if (settings and settings.log_channel_id == channel.id and
+                settings.log_webhook_id and settings.log_webhook_token):
+            webhook = self._partial(settings.log_webhook_id, settings.log_webhook_token)
+            self._webhooks[channel.id] = webhook
+            return webhook
+
+        try:
+            found = await self._find_own_webhook(channel)
+            if found is None:
+                found = await channel.create_webhook(name=self.WEBHOOK_NAME, reason="ログ配信用Webhook")
+                self.logger.info(f"Provisioned log webhook for channel {channel.id}")
+            else:
+                self.logger.info(f"Reusing existing log webhook for channel {channel.id}")
+        except discord.HTTPException as e:
+            # 権限不足など: 以後はチャンネル送信にフォールバック（/logger の再実行で再試行）
+            self.logger.warning(f"Cannot create log webhook in channel {channel.id}: {e}")
+            self._webhooks[channel.id] = None
+            return None
+
+        await self.database.create_or_update_guild_settings(
+            guild_id=channel.guild.id,
+            log_webhook_id=found.id,
+            log_webhook_token=found.token
+        )
+        webhook = self._partial(found.id, found.token)
+        self._webhooks[channel.id] = webhook
+        return webhook
+
+    async def _find_own_webhook(self, channel: discord.TextChannel) -> Optional[discord.Webhook]:
+        """チャンネル内のBOT自身が作成したログ用Webhookを検索"""
+        me = channel.guild.me
+        for webhook in await channel.webhooks():
+            if (webhook.name == self.WEBHOOK_NAME and webhook.token and
+                    me is not None and webhook.user is not None and webhook.user.id == me.id):
+                return webhook
+        return None
+
+    async def send(self, channel: discord.TextChannel, embeds: List[discord.Embed],
+                   username: Optional[str] = None, avatar_url: Optional[str] = None,
+                   files: Optional[List[discord.File]] = None) -> bool:
+        """Webhookで送信（Webhookが使えない場合はFalseを返し、呼び出し側でフォールバック）"""
+        webhook = await self._get_webhook(channel)
+        if not webhook:
+            return False
+
+        try:
+            await webhook.send(embeds=embeds, username=username, avatar_url=avatar_url, files=files or discord.utils.MISSING)
+            return True
+        except (discord.NotFound, discord.Forbidden) as e:
+            # Webhookが削除・無効化された: 保存情報を消して次回再作成
+            self.logger.warning(f"Log webhook for channel {channel.id} is no longer valid: {e}")
+            await self.invalidate(channel.guild.id, channel.id)
+            return False
+
+    def forget_channel(self, channel_id: Optional[int]) -> None:
+        """チャンネルのキャッシュを破棄（権限変更後の再作成を許可）"""
+        if channel_id is not None:
+            self._webhooks.pop(channel_id, None)
+
+    async def release(self, guild_id: int, channel_id: Optional[int]) -> None:
+        """ログチャンネル変更時: 旧チャンネルの保存済みWebhookを削除して保存情報を破棄"""
+        settings = await self.database.get_guild_settings(guild_id)
+        if settings and settings.log_webhook_id and settings.log_webhook_token:
+            try:
+                await self._partial(settings.log_webhook_id, settings.log_webhook_token).delete(
+                    reason="ログチャンネル変更"
+                )
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                self.logger.warning(f"Failed to delete old log webhook in channel {channel_id}: {e}")
+        await self.invalidate(guild_id, channel_id)
+
+    async def invalidate(self, guild_id: int, channel_id: Optional[int] = None) -> None:
+        """保存済みWebhookを破棄（ログチャンネル変更・Webhook削除時）"""
+        self.forget_channel(channel_id)
+        await self.database.create_or_update_guild_settings(
+            guild_id=guild_id,
+            log_webhook_id=None,
+            log_webhook_token=None
+        )
+
+    async def close(self) -> None:
+        """専用セッションを閉じる"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,310 @@
+import asyncio
+import hashlib
+import json
+import logging
+import mmap
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Any, Set
+
+from .youtube_extractor import YouTubeExtractor
+
+
+class AudioCache:
+    """
+    頻繁に再生される楽曲のローカル音声キャッシュ
+
+    設計:
+    - 再生回数が閾値に達した楽曲のみダウンロード（オプトイン）
+    - ファイル名は音声データのSHA-256（コンテンツアドレス方式・重複排除）
+    - OrderedDictによるLRU管理で合計サイズ上限を維持
+    - サイズ＋ハッシュによる整合性チェック（破損ファイルは自動破棄）
+    """
+
+    INDEX_FILE = "index.json"
+    MAX_TRACKED_PLAYS = 5000  # 再生回数を追跡するURLの最大数
+    DOWNLOAD_PATTERN = "download-*"  # YouTubeExtractor.download_audio の一時ファイル名
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size_bytes: int,
+        min_plays: int,
+        youtube_extractor: YouTubeExtractor
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.min_plays = max(1, min_plays)
+        self.youtube_extractor = youtube_extractor
+        self.logger = logging.getLogger(__name__)
+
+        # url -> {digest, ext, size}（末尾が最近使用）
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # digest -> 参照しているURL数と、重複を除いた合計サイズ（_add_entry/_remove_entryで更新）
+        self._digest_refs: Dict[str, int] = {}
+        self._total_bytes = 0
+        # url -> 再生回数（未キャッシュ楽曲のみ）
+        self._play_counts: "OrderedDict[str, int]" = OrderedDict()
+        # 上限サイズを超えるためキャッシュしないURL（再ダウンロードを繰り返さない）
+        self._oversized: "OrderedDict[str, None]" = OrderedDict()
+        # このプロセスでハッシュ検証済みのダイジェスト
+        self._verified: Set[str] = set()
+        self._pending: Dict[str, asyncio.Task] = {}
+
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "downloads": 0,
+            "download_failures": 0,
+            "evictions": 0,
+            "integrity_failures": 0,
+            "oversized": 0
+        }
+
+        self._load_index()
+        # 前回の終了時に残ったダウンロード途中のファイルを削除
+        self._remove_partial_downloads()
+
+    # ===== インデックス管理 =====
+
+    def _load_index(self) -> None:
+        """ディスク上のインデックスを読み込み"""
+        index_path = self.cache_dir / self.INDEX_FILE
+        if not index_path.exists():
+            return
+
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            for url, entry in data.get("entries", []):
+                if self._file_path(entry).exists():
+                    self._add_entry(url, entry)
+            for url, count in data.get("play_counts", []):
+                self._play_counts[url] = count
+            for url in data.get("oversized", []):
+                self._oversized[url] = None
+
+            self.logger.info(f"Audio cache loaded: {len(self._entries)} entries, {self.total_bytes} bytes")
+        except Exception as e:
+            self.logger.error(f"Failed to load audio cache index: {e}")
+            self._entries.clear()
+            self._digest_refs.clear()
+            self._total_bytes = 0
+            self._play_counts.clear()
+            self._oversized.clear()
+
+    def _snapshot_index(self) -> Dict[str, Any]:
+        """イベントループ上でインデックスのスナップショットを作成"""
+        return {
+            "entries": list(self._entries.items()),
+            "play_counts": list(self._play_counts.items()),
+            "oversized": list(self._oversized)
+        }
+
+    def _write_index(self, data: Dict[str, Any]) -> None:
+        """インデックスをアトミックに書き込み（スレッドから呼び出し可）"""
+        index_path = self.cache_dir / self.INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, index_path)
+        except Exception as e:
+            self.logger.error(f"Failed to save audio cache index: {e}")
+
+    def _file_path(self, entry: Dict[str, Any]) -> Path:
+        return self.cache_dir / f"{entry['digest']}{entry['ext']}"
+
+    @property
+    def total_bytes(self) -> int:
+        # 同一コンテンツを参照する複数URLは1回のみ計上
+        return self._total_bytes
+
+    # ===== 整合性チェック =====
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        """メモリマップ経由でファイルのSHA-256を計算"""
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return hashlib.sha256(b"").hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+
+    async def _verify_entry(self, entry: Dict[str, Any]) -> bool:
+        """サイズ（毎回）とハッシュ（プロセス内で初回のみ）を検証"""
+        path = self._file_path(entry)
+        try:
+            if path.stat().st_size != entry["size"]:
+                return False
+        except FileNotFoundError:
+            return False
+
+        if entry["digest"] in self._verified:
+            return True
+
+        digest = await asyncio.to_thread(self._hash_file, path)
+        if digest != entry["digest"]:
+            return False
+
+        self._verified.add(digest)
+        return True
+
+    # ===== 公開API =====
+
+    async def get_cached_path(self, url: str) -> Optional[str]:
+        """キャッシュ済みなら検証済みのローカルファイルパスを返す"""
+        entry = self._entries.get(url)
+        if not entry:
+            self._stats["misses"] += 1
+            return None
+
+        if not await self._verify_entry(entry):
+            self.logger.warning(f"Audio cache integrity check failed, discarding: {url}")
+            self._stats["integrity_failures"] += 1
+            self._stats["misses"] += 1
+            self._remove_entry(url)
+            await asyncio.to_thread(self._write_index, self._snapshot_index())
+            return None
+
+        self._entries.move_to_end(url)
+        self._stats["hits"] += 1
+        return str(self._file_path(entry))
+
+    def record_play(self, url: str) -> None:
+        """再生を記録し、閾値到達時にバックグラウンドでダウンロード"""
+        if url in self._entries or url in self._pending or url in self._oversized:
+            return
+
+        count = self._play_counts.pop(url, 0) + 1
+        self._play_counts[url] = count
+        while len(self._play_counts) > self.MAX_TRACKED_PLAYS:
+            self._play_counts.popitem(last=False)
+
+        if count >= self.min_plays:
+            task = asyncio.create_task(self._download(url))
+            self._pending[url] = task
+            task.add_done_callback(lambda _: self._pending.pop(url, None))
+
+    async def _download(self, url: str) -> None:
+        """音声をダウンロードしてコンテンツアドレスで格納"""
+        downloaded: Optional[Path] = None
+        try:
+            downloaded = await self.youtube_extractor.download_audio(url, self.cache_dir)
+            if not downloaded:
+                self._stats["download_failures"] += 1
+                return
+
+            size = downloaded.stat().st_size
+            if size > self.max_size_bytes:
+                # 格納しても直後に自身が追い出されるため記録せず、以降の再生でも再取得しない
+                self._play_counts.pop(url, None)
+                self._oversized[url] = None
+                while len(self._oversized) > self.MAX_TRACKED_PLAYS:
+                    self._oversized.popitem(last=False)
+                self._stats["oversized"] += 1
+                await asyncio.to_thread(self._write_index, self._snapshot_index())
+                self.logger.info(f"Audio for {url} exceeds the cache size limit ({size} bytes), not caching")
+                return
+
+            digest = await asyncio.to_thread(self._hash_file, downloaded)
+            entry = {
+                "digest": digest,
+                "ext": downloaded.suffix,
+                "size": size
+            }
+
+            target = self._file_path(entry)
+            if target.exists():
+                # 同一コンテンツが既に存在（重複排除）
+                downloaded.unlink(missing_ok=True)
+            else:
+                os.replace(downloaded, target)
+
+            self._add_entry(url, entry)
+            self._verified.add(digest)
+            self._play_counts.pop(url, None)
+            self._stats["downloads"] += 1
+            self._evict_if_needed()
+            await asyncio.to_thread(self._write_index, self._snapshot_index())
+
+            self.logger.info(f"Cached audio for {url} ({entry['size']} bytes)")
+        except Exception as e:
+            self._stats["download_failures"] += 1
+            self.logger.error(f"Audio cache download failed for {url}: {e}")
+        finally:
+            # 格納前に失敗・キャンセルされた場合は一時ファイルを残さない
+            if downloaded is not None:
+                downloaded.unlink(missing_ok=True)
+
+    def _add_entry(self, url: str, entry: Dict[str, Any]) -> None:
+        """エントリを最近使用として登録し、参照数と合計サイズを更新"""
+        previous = self._entries.get(url)
+        if previous is not None:
+            if previous["digest"] == entry["digest"]:
+                self._entries[url] = entry
+                self._entries.move_to_end(url)
+                return
+            self._remove_entry(url)
+
+        self._entries[url] = entry
+        digest = entry["digest"]
+        refs = self._digest_refs.get(digest, 0)
+        if refs == 0:
+            self._total_bytes += entry["size"]
+        self._digest_refs[digest] = refs + 1
+
+    def _remove_entry(self, url: str) -> None:
+        entry = self._entries.pop(url, None)
+        if not entry:
+            return
+
+        # 他のURLが同じコンテンツを参照していなければファイル削除
+        digest = entry["digest"]
+        refs = self._digest_refs.get(digest, 1) - 1
+        if refs > 0:
+            self._digest_refs[digest] = refs
+            return
+
+        self._digest_refs.pop(digest, None)
+        self._total_bytes -= entry["size"]
+        self._file_path(entry).unlink(missing_ok=True)
+        self._verified.discard(digest)
+
+    def _evict_if_needed(self) -> None:
+        """合計サイズが上限を超えた場合、最も古く使われたエントリから削除"""
+        while self._entries and self._total_bytes > self.max_size_bytes:
+            url = next(iter(self._entries))
+            self._remove_entry(url)
+            self._stats["evictions"] += 1
+            self.logger.debug(f"Evicted cached audio: {url}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """キャッシュ統計を取得"""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": (self._stats["hits"] / lookups * 100) if lookups else 0.0,
+            "entries": len(self._entries),
+            "pending_downloads": len(self._pending),
+            "total_bytes": self.total_bytes,
+            "max_bytes": self.max_size_bytes
+        }
+
+    def _remove_partial_downloads(self) -> None:
+        """ダウンロード途中で残った一時ファイルを削除"""
+        for path in self.cache_dir.glob(self.DOWNLOAD_PATTERN):
+            path.unlink(missing_ok=True)
+
+    async def shutdown(self) -> None:
+        """進行中のダウンロードをキャンセルし、一時ファイルを削除してインデックスを保存"""
+        tasks = list(self._pending.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await asyncio.to_thread(self._remove_partial_downloads)
+        await asyncio.to_thread(self._write_index, self._snapshot_index())
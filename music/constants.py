@@ -12,12 +12,14 @@ class MusicConstants:
 
     # 再生制御
     MAX_RETRY_COUNT = 5
+    LOOP_HISTORY_MAX_SIZE = 500     # キューループ用リングバッファ最大サイズ
     PLAYBACK_SEARCH_LIMIT = 5
     MUSIC_SCORE_THRESHOLD = 5
 
     # タイムアウト設定
     PLAYBACK_TIMEOUT_SECONDS = 300  # 5分
     VIEW_TIMEOUT_SECONDS = 300      # UIタイムアウト
+    STATE_WAIT_TIMEOUT_SECONDS = 3  # スキップ等の状態遷移待機
 
     # 楽曲制限
     MIN_DURATION_SECONDS = 30       # 最小再生時間
@@ -26,6 +28,11 @@ class MusicConstants:
     # UI制限
     QUERY_DISPLAY_MAX_LENGTH = 50   # 検索クエリ表示の最大文字数
     DESCRIPTION_MAX_LENGTH = 500    # 説明文最大長
+    SNAPSHOT_QUEUE_HEAD_SIZE = 3    # プレイヤー表示用のキュー先頭件数
+
+    # ストリームURLキャッシュ
+    STREAM_URL_CACHE_SIZE = 256
+    STREAM_URL_DEFAULT_TTL_SECONDS = 1800  # expireパラメータがない場合
 
     # FFmpeg設定
     FFMPEG_RECONNECT_DELAY_MAX = 5
@@ -57,7 +64,7 @@ class MusicSource(Enum):
 
 
 class PlaybackState(Enum):
-    """再生状態"""
+    """再生状態 (STOPPED → LOADING → PLAYING ⇄ PAUSED)"""
     PLAYING = "playing"
     PAUSED = "paused"
     STOPPED = "stopped"
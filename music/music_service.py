@@ -1,14 +1,90 @@
 import asyncio
+import itertools
 import logging
+import time
 import discord
-from typing import Dict, Optional, List, Any
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, List, Any, Tuple, Iterable
 from datetime import datetime
 from discord import VoiceClient
 
 from database.models import Track, Queue, MusicSession, MusicSource, LoopMode
 from .youtube_extractor import YouTubeExtractor, TrackInfo
 from .spotify_extractor import SpotifyExtractor
+from .audio_cache import AudioCache
 from .url_detector import URLDetector, URLInfo
+from .constants import MusicConstants, PlaybackState
+
+
+@dataclass(frozen=True)
+class QueueEntrySnapshot:
+    """キュー項目のスナップショット"""
+    title: str
+    artist: str
+    duration: int
+
+
+@dataclass(frozen=True)
+class PlayerSnapshot:
+    """
+    プレイヤー状態のイミュータブルなスナップショット
+
+    versionは状態（楽曲・一時停止・ループ・キュー）が変化するたびに単調増加する。
+    UIはversionと再生位置が前回描画時と同じなら再描画を省略できる。
+    """
+    version: int
+    guild_id: int
+    title: Optional[str]
+    artist: Optional[str]
+    url: Optional[str]
+    duration: int
+    thumbnail_url: Optional[str]
+    source: Optional[str]
+    position: int
+    is_paused: bool
+    loop_mode: str
+    queue_head: Tuple[QueueEntrySnapshot, ...]
+    queue_length: int
+
+    @property
+    def has_track(self) -> bool:
+        return self.title is not None
+
+    @property
+    def render_key(self) -> Tuple[int, int]:
+        """描画内容が変化したかの判定キー"""
+        return (self.version, self.position)
+
+    def track_data(self) -> Dict[str, Any]:
+        """EmbedBuilder用の楽曲情報"""
+        if not self.has_track:
+            return {}
+        return {
+            'title': self.title,
+            'artist': self.artist,
+            'url': self.url,
+            'duration': self.duration,
+            'position': self.position,
+            'thumbnail_url': self.thumbnail_url,
+            'source': self.source,
+            'requested_by_name': 'Unknown',
+            'requested_by_avatar': None
+        }
+
+    def session_data(self) -> Dict[str, Any]:
+        """EmbedBuilder用のセッション情報"""
+        return {
+            'is_paused': self.is_paused,
+            'loop_mode': self.loop_mode
+        }
+
+    def queue_data(self) -> List[Dict[str, Any]]:
+        """EmbedBuilder用のキュー先頭"""
+        return [
+            {'title': entry.title, 'artist': entry.artist, 'duration': entry.duration}
+            for entry in self.queue_head
+        ]
 
 
 class MusicPlayer:
@@ -22,9 +98,20 @@ class MusicPlayer:
 
         self.current_track: Optional[Track] = None
         self.start_time: Optional[datetime] = None
+        # 曲間の無音時間の計測用（前の曲の終了時刻）
+        self._finished_at: Optional[float] = None
         self.is_paused_flag = False
         self.loop_mode = LoopMode.NONE
 
+        # 再生状態マシン（遷移待ちはFutureで通知しポーリングしない）
+        self.state = PlaybackState.STOPPED
+        self._state_waiters: List[Tuple[frozenset, asyncio.Future]] = []
+        self._pending_skip: Optional[asyncio.Future] = None
+
+        # キューループ用リングバッファ（再生済み楽曲をメモリ上に保持）
+        self.played_tracks: Deque[Track] = deque(maxlen=MusicConstants.LOOP_HISTORY_MAX_SIZE)
+        self.loop_cursor = 0
+
     def is_playing(self) -> bool:
         """再生中かどうか"""
         return self.voice_client.is_playing()
@@ -33,50 +120,135 @@ class MusicPlayer:
         """一時停止中かどうか"""
         return self.is_paused_flag
 
+    def is_active(self) -> bool:
+        """読み込み中・再生中・一時停止中のいずれか"""
+        return self.state != PlaybackState.STOPPED
+
+    # ===== 状態マシン =====
+
+    def _set_state(self, state: PlaybackState):
+        """状態を遷移させ、該当する待機者を解決"""
+        self.state = state
+
+        remaining = []
+        for states, future in self._state_waiters:
+            if future.done():
+                continue
+            if state in states:
+                future.set_result(state)
+            else:
+                remaining.append((states, future))
+        self._state_waiters = remaining
+
+    def _add_state_waiter(self, states: Iterable[PlaybackState]) -> asyncio.Future:
+        """指定状態への遷移を待つFutureを登録"""
+        future = asyncio.get_running_loop().create_future()
+        self._state_waiters.append((frozenset(states), future))
+        return future
+
+    @staticmethod
+    async def _await_state_waiter(future: asyncio.Future, timeout: float) -> Optional[PlaybackState]:
+        """Futureを待機（タイムアウト時はNone、Future自体は共有のため取り消さない）"""
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def wait_for_state(self, *states: PlaybackState, timeout: float) -> Optional[PlaybackState]:
+        """指定状態のいずれかになるまで待機"""
+        if self.state in states:
+            return self.state
+        return await self._await_state_waiter(self._add_state_waiter(states), timeout)
+
+    def _state_from_voice_client(self) -> PlaybackState:
+        """ボイスクライアントの実際の再生状況に対応する状態"""
+        if self.voice_client and self.voice_client.is_paused():
+            return PlaybackState.PAUSED
+        if self.voice_client and self.voice_client.is_playing():
+            return PlaybackState.PLAYING
+        return PlaybackState.STOPPED
+
     async def play_track(self, track: Track):
         """楽曲再生開始"""
+        self._set_state(PlaybackState.LOADING)
         try:
-            # 音声ソース取得
             extractor = self.music_service.youtube_extractor
-            audio_url = await extractor.get_audio_source(track.url)
+            ffmpeg_opts = extractor.get_ffmpeg_options()
+            audio_cache = self.music_service.audio_cache
 
-            if not audio_url:
-                raise Exception("Audio source not found")
+            # ローカルキャッシュを優先（ストリーム再取得・403を回避）
+            cached_path = await audio_cache.get_cached_path(track.url) if audio_cache else None
 
-            # FFmpegAudioSource作成
-            ffmpeg_opts = extractor.get_ffmpeg_options()
-            source = discord.FFmpegPCMAudio(
-                audio_url,
-                before_options=ffmpeg_opts['before_options'],
-                options=ffmpeg_opts['options']
-            )
+            if cached_path:
+                source = discord.FFmpegPCMAudio(
+                    cached_path,
+                    options=ffmpeg_opts['options']
+                )
+            else:
+                # 音声ソース取得
+                audio_url = await extractor.get_audio_source(track.url)
+
+                if not audio_url:
+                    raise Exception("Audio source not found")
+
+                # FFmpegAudioSource作成
+                source = discord.FFmpegPCMAudio(
+                    audio_url,
+                    before_options=ffmpeg_opts['before_options'],
+                    options=ffmpeg_opts['options']
+                )
 
             # 音量を15%に固定
             source = discord.PCMVolumeTransformer(source, volume=0.15)
 
             # 再生開始
             self.voice_client.play(source, after=self._track_finished)
+            if self._finished_at is not None:
+                self.music_service.record_transition_gap(time.perf_counter() - self._finished_at)
+                self._finished_at = None
             self.current_track = track
             self.start_time = datetime.now()
             self.is_paused_flag = False
+            self._set_state(PlaybackState.PLAYING)
+            self._mark_state_changed()
+
+            # 再生回数を記録（閾値到達でキャッシュ対象）
+            if audio_cache:
+                audio_cache.record_play(track.url)
 
             self.logger.info(f"Playing: {track.title} in guild {self.guild_id}")
 
         except Exception as e:
             self.logger.error(f"Play error: {e}")
+            # LOADINGのまま残すと is_active() が真のままになり以降の /play が再生を開始しない
+            # （スキップ待機中は呼び出し元の再試行・キュー終了処理が最終的な状態を決める）
+            state = self._state_from_voice_client()
+            skipping = self._pending_skip is not None and not self._pending_skip.done()
+            if state != PlaybackState.STOPPED or not skipping:
+                self._set_state(state)
+                self._mark_state_changed()
             raise
 
+    def _mark_state_changed(self):
+        """スナップショットのバージョンを進める"""
+        if self.music_service:
+            self.music_service.mark_state_changed(self.guild_id)
+
     async def pause(self):
         """一時停止"""
         if self.voice_client.is_playing():
             self.voice_client.pause()
             self.is_paused_flag = True
+            self._set_state(PlaybackState.PAUSED)
+            self._mark_state_changed()
 
     async def resume(self):
         """再生再開"""
         if self.voice_client.is_paused():
             self.voice_client.resume()
             self.is_paused_flag = False
+            self._set_state(PlaybackState.PLAYING)
+            self._mark_state_changed()
 
     async def stop(self):
         """停止"""
@@ -93,16 +265,66 @@ class MusicPlayer:
             self.current_track = None
             self.start_time = None
             self.is_paused_flag = False
+            self._set_state(PlaybackState.STOPPED)
+            self._mark_state_changed()
+
+    def mark_idle(self):
+        """再生終了（キュー空）を通知"""
+        # キューが空になった後の待ち時間は曲間として計測しない
+        self._finished_at = None
+        self._set_state(PlaybackState.STOPPED)
 
     async def skip(self):
         """スキップ (次の曲)"""
         if self.voice_client.is_playing() or self.voice_client.is_paused():
             self.voice_client.stop()  # これにより_track_finishedが呼ばれる
 
+    async def skip_and_wait(self, timeout: float) -> bool:
+        """
+        スキップして次の楽曲の再生開始まで待機
+
+        - 進行中のスキップがあれば同じFutureを待つ（連打で複数曲飛ばさない）
+        - 次楽曲の再生開始でTrue、キュー終了・タイムアウトでFalse
+        """
+        if self._pending_skip and not self._pending_skip.done():
+            return await self._await_state_waiter(self._pending_skip, timeout) == PlaybackState.PLAYING
+
+        if not (self.voice_client.is_playing() or self.voice_client.is_paused()):
+            return False
+
+        # stop()より先に待機を登録し、遷移の取りこぼしを防ぐ
+        self._set_state(PlaybackState.LOADING)
+        future = self._add_state_waiter((PlaybackState.PLAYING, PlaybackState.STOPPED))
+        self._pending_skip = future
+        self.voice_client.stop()  # これにより_track_finishedが呼ばれる
+
+        try:
+            result = await self._await_state_waiter(future, timeout)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            result = None
+        if result is None:
+            # 終了コールバックが来ない（切断・次楽曲の処理失敗）場合はLOADINGを残さない
+            self.logger.warning(f"Skip did not complete within {timeout}s in guild {self.guild_id}")
+            self._abandon_skip(future)
+        return result == PlaybackState.PLAYING
+
+    def _abandon_skip(self, future: asyncio.Future):
+        """完了しなかったスキップを破棄し、状態を実際の再生状況に戻す"""
+        if self._pending_skip is future:
+            self._pending_skip = None
+        if self.state == PlaybackState.LOADING:
+            self._set_state(self._state_from_voice_client())
+            self._mark_state_changed()
+        if not future.done():
+            # 同じスキップを待っている他の呼び出しも解放
+            future.set_result(self.state)
 
     async def set_loop_mode(self, mode: LoopMode):
         """ループモード設定"""
         self.loop_mode = mode
+        self._mark_state_changed()
 
     async def cycle_loop_mode(self):
         """ループモード循環切り替え"""
@@ -110,6 +332,34 @@ class MusicPlayer:
         current_index = modes.index(self.loop_mode)
         next_index = (current_index + 1) % len(modes)
         self.loop_mode = modes[next_index]
+        self._mark_state_changed()
+
+    def remember_track(self, track: Track):
+        """キューから再生した楽曲をリングバッファに記録（上限時は最古の楽曲が押し出される）"""
+        if len(self.played_tracks) == self.played_tracks.maxlen:
+            self.loop_cursor = max(0, self.loop_cursor - 1)
+        self.played_tracks.append(track)
+
+    def next_loop_track(self) -> Optional[Track]:
+        """リングバッファから次の楽曲を取得 (O(1)、末尾で先頭に戻る)"""
+        if not self.played_tracks:
+            return None
+
+        if self.loop_cursor >= len(self.played_tracks):
+            self.loop_cursor = 0
+
+        track = self.played_tracks[self.loop_cursor]
+        self.loop_cursor += 1
+        return track
+
+    def forget_track(self, track: Track):
+        """再生できなくなった楽曲をリングバッファから除外"""
+        for index, played in enumerate(self.played_tracks):
+            if played is track:
+                del self.played_tracks[index]
+                if index < self.loop_cursor:
+                    self.loop_cursor -= 1
+                return
 
     def get_position(self) -> int:
         """現在の再生位置 (秒)"""
@@ -119,6 +369,7 @@ class MusicPlayer:
 
     def _track_finished(self, error):
         """楽曲終了コールバック"""
+        self._finished_at = time.perf_counter()
         if error:
             self.logger.error(f"Player error: {error}")
 
@@ -174,17 +425,29 @@ class MusicPlayer:
 class MusicService:
     """音楽システムメインサービス - Lunaパターン準拠"""
 
-    def __init__(self, database_manager, event_bus, youtube_extractor: YouTubeExtractor, spotify_extractor: Optional[SpotifyExtractor] = None):
+    def __init__(self, database_manager, event_bus, youtube_extractor: YouTubeExtractor, spotify_extractor: Optional[SpotifyExtractor] = None,
+                 audio_cache: Optional[AudioCache] = None, metrics=None):
         self.database = database_manager
         self.event_bus = event_bus
         self.youtube_extractor = youtube_extractor
         self.spotify_extractor = spotify_extractor
+        self.audio_cache = audio_cache
+        self.metrics = metrics
         self.url_detector = URLDetector()
         self.logger = logging.getLogger(__name__)
 
+        self._transition_gap_seconds = metrics.histogram(
+            "music_track_transition_seconds", "Silence between the end of a track and the start of the next"
+        ) if metrics is not None else None
+
         # アクティブプレイヤー管理
         self.players: Dict[int, MusicPlayer] = {}
 
+        # スナップショット用: ギルドごとの状態バージョンとキュー要約キャッシュ
+        self._version_counter = itertools.count(1)
+        self._state_versions: Dict[int, int] = {}
+        self._queue_summaries: Dict[int, Tuple[Tuple[QueueEntrySnapshot, ...], int]] = {}
+
         # イベントループの参照を保存
         try:
             self.event_loop = asyncio.get_event_loop()
@@ -255,6 +518,7 @@ class MusicService:
 
         # キューに追加
         await self.database.add_to_queue(guild_id, track.id, requested_by)
+        self.mark_queue_changed(guild_id)
 
         # EventBus通知
         await self.event_bus.emit_event("track_added", {
@@ -287,8 +551,6 @@ class MusicService:
         - 定数クラスでマジックナンバー排除
         - より安全で予測可能な制御フロー
         """
-        from .constants import MusicConstants
-
         player = self.players.get(guild_id)
         if not player:
             self.logger.debug(f"No player found for guild {guild_id}")
@@ -311,6 +573,7 @@ class MusicService:
             if not track:
                 # 楽曲が見つからない場合、キューから削除して次へ
                 await self.database.remove_from_queue(guild_id, queue_item.id)
+                self.mark_queue_changed(guild_id)
                 self.logger.warning(f"Track not found, trying next track (attempt: {retry_count + 1}/{max_retries})")
                 retry_count += 1
                 continue
@@ -321,6 +584,10 @@ class MusicService:
 
                 # 成功時のみキューから削除
                 await self.database.remove_from_queue(guild_id, queue_item.id)
+                self.mark_queue_changed(guild_id)
+
+                # キューループ用に記録
+                player.remember_track(track)
 
                 # セッション更新
                 await self.database.update_session_current_track(guild_id, track.id)
@@ -342,6 +609,7 @@ class MusicService:
 
                 # 失敗した楽曲もキューから削除（無限ループ防止）
                 await self.database.remove_from_queue(guild_id, queue_item.id)
+                self.mark_queue_changed(guild_id)
 
                 # 失敗通知
                 await self._notify_track_failed(guild_id, track, str(e))
@@ -361,26 +629,20 @@ class MusicService:
 
         設計改善:
         - play_next()への再帰呼び出しを除去
-        - キューループ処理を安全に分離
+        - キューループはメモリ上のリングバッファから再生（DB再構築・再検索なし）
         """
-        from .constants import LoopMode
-
         player = self.players.get(guild_id)
         if player and player.loop_mode == LoopMode.QUEUE:
-            # キューループの場合、キューを再構築
-            rebuilt = await self._rebuild_queue_for_loop(guild_id)
-            if rebuilt:
-                # 再構築成功時のみ次の楽曲を再生開始
-                # 再帰ではなく、明示的に新しい再生サイクルを開始
-                self.logger.info(f"Queue rebuilt for loop mode, starting new playback cycle for guild {guild_id}")
-                await self.play_next(guild_id)
-            else:
-                # 再構築失敗時は再生終了
-                self.logger.warning(f"Failed to rebuild queue for loop, ending playback for guild {guild_id}")
-                await self._finalize_playback(guild_id)
-        else:
-            # 通常終了
-            await self._finalize_playback(guild_id)
+            if await self._rebuild_queue_for_loop(guild_id):
+                return
+
+            # リングバッファが空、または全楽曲の再生に失敗
+            self.logger.warning(f"Failed to continue queue loop, ending playback for guild {guild_id}")
+
+        # 通常終了
+        if player:
+            player.mark_idle()
+        await self._finalize_playback(guild_id)
 
     async def _finalize_playback(self, guild_id: int):
         """再生終了処理"""
@@ -389,16 +651,122 @@ class MusicService:
         })
         self.logger.info(f"Playback finalized for guild {guild_id}")
 
-    async def _rebuild_queue_for_loop(self, guild_id: int):
-        """キューループ用にキューを再構築"""
-        # 履歴から楽曲を取得してキューに追加
-        # 実装簡略化のため、基本実装のみ
-        pass
+    async def _rebuild_queue_for_loop(self, guild_id: int) -> bool:
+        """
+        キューループ: 再生済み楽曲のリングバッファから次の楽曲を再生
+
+        - 解決済みTrackを再利用するためDB走査・YouTube再検索は不要
+        - ストリームURLはYouTubeExtractor側で有効期限内なら再利用
+        """
+        player = self.players.get(guild_id)
+        if not player:
+            return False
+
+        attempts = min(len(player.played_tracks), MusicConstants.MAX_RETRY_COUNT)
+        for _ in range(attempts):
+            track = player.next_loop_track()
+            if not track:
+                return False
+
+            try:
+                await player.play_track(track)
+                await self.database.update_session_current_track(guild_id, track.id)
+
+                await self.event_bus.emit_event("track_started", {
+                    "guild_id": guild_id,
+                    "track_id": track.id,
+                    "title": track.title,
+                    "loop": True
+                })
+
+                self.logger.info(f"Queue loop: replaying '{track.title}' for guild {guild_id}")
+                return True
+
+            except Exception as e:
+                self.logger.error(f"Queue loop playback failed for '{track.title}' in guild {guild_id}: {e}")
+                player.forget_track(track)
+                await self._notify_track_failed(guild_id, track, str(e))
+
+        return False
+
+    def record_transition_gap(self, seconds: float) -> None:
+        """曲間の無音時間を記録"""
+        if self._transition_gap_seconds is not None:
+            self._transition_gap_seconds.observe(seconds)
 
     def get_player(self, guild_id: int) -> Optional[MusicPlayer]:
         """プレイヤー取得"""
         return self.players.get(guild_id)
 
+    def mark_state_changed(self, guild_id: int):
+        """プレイヤー状態の変化を記録（バージョンを単調増加）"""
+        self._state_versions[guild_id] = next(self._version_counter)
+
+    def mark_queue_changed(self, guild_id: int):
+        """キューの変化を記録（キュー要約キャッシュを破棄）"""
+        self._queue_summaries.pop(guild_id, None)
+        self.mark_state_changed(guild_id)
+
+    async def _get_queue_summary(self, guild_id: int) -> Tuple[Tuple[QueueEntrySnapshot, ...], int]:
+        """キュー先頭と総数を取得（キュー変化時のみDB参照）"""
+        version = self._state_versions.get(guild_id, 0)
+        cached = self._queue_summaries.get(guild_id)
+        if cached:
+            return cached
+
+        queue_items, queue_length = await self.database.get_guild_queue_window(
+            guild_id, offset=0, limit=MusicConstants.SNAPSHOT_QUEUE_HEAD_SIZE
+        )
+        head = tuple(
+            QueueEntrySnapshot(
+                title=item.get('title', 'Unknown'),
+                artist=item.get('artist', 'Unknown'),
+                duration=item.get('duration', 0)
+            )
+            for item in queue_items
+        )
+
+        # 取得中にキューが変化していなければキャッシュ
+        if self._state_versions.get(guild_id, 0) == version:
+            self._queue_summaries[guild_id] = (head, queue_length)
+        return head, queue_length
+
+    async def get_player_snapshot(self, guild_id: int) -> Optional[PlayerSnapshot]:
+        """
+        プレイヤー状態をスナップショットとして一括取得
+
+        get_current_track / get_session_info / get_queue の3回呼び出しを置き換える。
+        キューはキャッシュ済み要約を使うため、状態が変化していなければDBアクセスなし。
+        """
+        player = self.players.get(guild_id)
+        if not player:
+            return None
+
+        queue_head, queue_length = await self._get_queue_summary(guild_id)
+        track = player.current_track
+
+        return PlayerSnapshot(
+            version=self._state_versions.get(guild_id, 0),
+            guild_id=guild_id,
+            title=track.title if track else None,
+            artist=track.artist if track else None,
+            url=track.url if track else None,
+            duration=track.duration if track else 0,
+            thumbnail_url=track.thumbnail_url if track else None,
+            source=track.source if track else None,
+            position=player.get_position(),
+            is_paused=player.is_paused(),
+            loop_mode=player.loop_mode.value,
+            queue_head=queue_head,
+            queue_length=queue_length
+        )
+
+    async def clear_queue(self, guild_id: int) -> int:
+        """キューをクリア"""
+        cleared = await self.database.clear_queue(guild_id)
+        self.mark_queue_changed(guild_id)
+        return cleared
+
     async def get_current_track(self, guild_id: int) -> Dict[str, Any]:
         """現在の楽曲情報取得"""
         player = self.players.get(guild_id)
@@ -429,6 +797,20 @@ class MusicService:
             'loop_mode': player.loop_mode.value
         }
 
+    async def get_queue_page(self, guild_id: int, page: int = 1,
+                             per_page: int = 10) -> Tuple[List[Dict[str, Any]], int]:
+        """キューの指定ページのみ取得 (表示範囲だけDBから読み込む)"""
+        offset = (max(page, 1) - 1) * per_page
+        queue_items, total = await self.database.get_guild_queue_window(guild_id, offset=offset, limit=per_page)
+        return [
+            {
+                'title': item.get('title', 'Unknown'),
+                'artist': item.get('artist', 'Unknown'),
+                'duration': item.get('duration', 0)
+            }
+            for item in queue_items
+        ], total
+
     async def get_queue(self, guild_id: int) -> List[Dict[str, Any]]:
         """キュー取得"""
         queue_items = await self.database.get_guild_queue(guild_id)
@@ -476,7 +858,8 @@ class MusicService:
                 except Exception as voice_error:
                     self.logger.error(f"Voice disconnect error for guild {guild_id}: {voice_error}")
                 finally:
-                    # プレイヤーは確実に削除
+                    # 状態遷移の待機者を解放し、プレイヤーは確実に削除
+                    player.mark_idle()
                     if guild_id in self.players:
                         del self.players[guild_id]
 
@@ -502,7 +885,7 @@ class MusicService:
         """ギルドのキューと履歴をクリーンアップ"""
         try:
             # キューをクリア
-            cleared_queue = await self.database.clear_queue(guild_id)
+            cleared_queue = await self.clear_queue(guild_id)
 
             # 楽曲履歴をクリア
             cleared_tracks = await self.database.clear_guild_tracks(guild_id)
@@ -555,22 +938,11 @@ class MusicService:
             return False
 
         try:
-            # 現在再生中でない場合は何もしない
-            if not (player.voice_client.is_playing() or player.voice_client.is_paused()):
-                return False
-
-            # スキップ実行
-            await player.skip()
-
-            # 次楽曲の再生開始まで最大3秒待機
-            for _ in range(30):  # 0.1秒 × 30回 = 3秒
-                await asyncio.sleep(0.1)
-                if player.voice_client.is_playing():
-                    return True
-
-            # タイムアウト
-            self.logger.warning(f"Skip timeout for guild {guild_id}")
-            return False
+            # 次楽曲の再生開始（またはキュー終了）の状態遷移を待機
+            started = await player.skip_and_wait(MusicConstants.STATE_WAIT_TIMEOUT_SECONDS)
+            if not started:
+                self.logger.warning(f"Skip did not start a next track for guild {guild_id} (state: {player.state.value})")
+            return started
 
         except Exception as e:
             self.logger.error(f"Skip error: {e}")
@@ -1,20 +1,22 @@
 import asyncio
 import logging
 from typing import Dict, Optional, List, Any
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
-
 from .youtube_extractor import YouTubeExtractor, TrackInfo
 
 
 class SpotifyExtractor:
     """Spotify API統合 - 楽曲情報取得とYouTube変換"""
 
-    def __init__(self, client_id: str, client_secret: str):
+    def __init__(self, client_id: str, client_secret: str, youtube_extractor: Optional[YouTubeExtractor] = None):
         self.logger = logging.getLogger(__name__)
-        self.youtube_extractor = YouTubeExtractor()
+        # YouTube変換はアプリ共通の抽出器を使う（URLキャッシュ・メトリクスを共有）
+        self.youtube_extractor = youtube_extractor or YouTubeExtractor()
 
         try:
+            # spotipy は Spotify 連携が有効な場合のみ読み込む
+            import spotipy
+            from spotipy.oauth2 import SpotifyClientCredentials
+
             # Spotify API認証
             credentials = SpotifyClientCredentials(
                 client_id=client_id,
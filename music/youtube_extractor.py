@@ -1,8 +1,23 @@
 import asyncio
+import importlib
 import logging
-import yt_dlp  # type: ignore
-from typing import Dict, Optional, List, Any
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, List, Any, Tuple
 from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+
+from .constants import MusicConstants
+
+
+def _yt_dlp():
+    """
+    yt_dlp を初回使用時に読み込む（起動時間短縮）
+
+    抽出処理はすべてワーカースレッドで実行されるため、読み込みもイベントループ外で行われる
+    """
+    return importlib.import_module("yt_dlp")
 
 
 @dataclass
@@ -19,8 +34,11 @@ class TrackInfo:
 class YouTubeExtractor:
     """YouTube音楽抽出器 - Lunaパターン準拠"""
 
-    def __init__(self):
+    def __init__(self, metrics=None):
         self.logger = logging.getLogger(__name__)
+        self._extract_seconds = metrics.histogram(
+            "ytdlp_extract_seconds", "yt-dlp extraction time", ("operation",)
+        ) if metrics is not None else None
 
         # yt-dlp設定 - 高品質音声用（修正版）
         self.ytdl_opts = {
@@ -38,22 +56,34 @@ class YouTubeExtractor:
             # postprocessorsを削除（Discord.pyで直接ストリームを使用するため不要）
         }
 
+        # ストリームURLキャッシュ: webpage_url -> (stream_url, expires_at)
+        self._stream_url_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
         # FFmpeg設定 - シンプル版（ノイズ対策）
         self.ffmpeg_opts = {
             'before_options': '-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 -nostdin',
             'options': '-vn -ar 48000 -ac 2 -b:a 128k'
         }
 
+    async def _run_ytdl(self, operation: str, func, *args):
+        """yt-dlpの同期処理をスレッドで実行し、所要時間を記録"""
+        start = time.perf_counter()
+        try:
+            return await asyncio.to_thread(func, *args)
+        finally:
+            if self._extract_seconds is not None:
+                self._extract_seconds.labels(operation).observe(time.perf_counter() - start)
+
     async def search_track(self, query: str) -> Optional[TrackInfo]:
         """楽曲検索 (非同期) - 単一結果"""
         try:
             # URL判定：直接URLの場合は検索ではなく直接抽出
             if self.is_url(query):
                 self.logger.info(f"Direct URL extraction: {query}")
-                track_info = await asyncio.to_thread(self._extract_direct_url, query)
+                track_info = await self._run_ytdl("direct_url", self._extract_direct_url, query)
             else:
                 # 検索処理
-                track_info = await asyncio.to_thread(self._search_sync, query)
+                track_info = await self._run_ytdl("search", self._search_sync, query)
             return track_info
         except Exception as e:
             self.logger.error(f"YouTube search error: {e}")
@@ -62,7 +92,7 @@ class YouTubeExtractor:
     async def search_multiple(self, query: str, limit: int = 5) -> List[TrackInfo]:
         """楽曲複数検索 (検索結果選択用)"""
         try:
-            tracks = await asyncio.to_thread(self._search_multiple_sync, query, limit)
+            tracks = await self._run_ytdl("search_multiple", self._search_multiple_sync, query, limit)
             return tracks
         except Exception as e:
             self.logger.error(f"YouTube multiple search error: {e}")
@@ -70,7 +100,7 @@ class YouTubeExtractor:
 
     def _search_sync(self, query: str) -> Optional[TrackInfo]:
         """改善された同期検索処理 (内部使用)"""
-        ytdl = yt_dlp.YoutubeDL(params=self.ytdl_opts)  # type: ignore
+        ytdl = _yt_dlp().YoutubeDL(params=self.ytdl_opts)  # type: ignore
 
         try:
             # 検索クエリの強化
@@ -145,7 +175,7 @@ class YouTubeExtractor:
 
     def _extract_direct_url(self, url: str) -> Optional[TrackInfo]:
         """直接URL抽出の同期処理"""
-        ytdl = yt_dlp.YoutubeDL(params=self.ytdl_opts)  # type: ignore
+        ytdl = _yt_dlp().YoutubeDL(params=self.ytdl_opts)  # type: ignore
 
         try:
             self.logger.info(f"Extracting direct URL: {url}")
@@ -175,7 +205,7 @@ class YouTubeExtractor:
 
     def _search_multiple_sync(self, query: str, limit: int) -> List[TrackInfo]:
         """複数検索の同期処理"""
-        ytdl = yt_dlp.YoutubeDL(params=self.ytdl_opts)  # type: ignore
+        ytdl = _yt_dlp().YoutubeDL(params=self.ytdl_opts)  # type: ignore
         tracks = []
 
         try:
@@ -295,17 +325,64 @@ class YouTubeExtractor:
         return best_entry
 
     async def get_audio_source(self, url: str) -> Optional[str]:
-        """音声ソースURL取得 (discord.py用)"""
+        """音声ソースURL取得 (discord.py用・有効期限内のURLは再利用)"""
+        cached = self._get_cached_stream_url(url)
+        if cached:
+            self.logger.debug(f"Reusing cached stream URL for: {url}")
+            return cached
+
         try:
-            audio_url = await asyncio.to_thread(self._get_audio_source_sync, url)
+            audio_url = await self._run_ytdl("audio_source", self._get_audio_source_sync, url)
+            if audio_url:
+                self._cache_stream_url(url, audio_url)
             return audio_url
         except Exception as e:
             self.logger.error(f"Audio source extraction error: {e}")
             return None
 
+    def _get_cached_stream_url(self, url: str) -> Optional[str]:
+        """再生完了まで有効なストリームURLのみ返す"""
+        entry = self._stream_url_cache.get(url)
+        if not entry:
+            return None
+
+        audio_url, expires_at = entry
+        # 最大再生時間分の余裕がなければ再取得
+        if expires_at - time.time() < MusicConstants.MAX_DURATION_SECONDS:
+            del self._stream_url_cache[url]
+            return None
+
+        self._stream_url_cache.move_to_end(url)
+        return audio_url
+
+    def _cache_stream_url(self, url: str, audio_url: str) -> None:
+        """ストリームURLを有効期限付きで保存"""
+        expires_at = self._parse_stream_expiry(audio_url)
+        self._stream_url_cache[url] = (audio_url, expires_at)
+        self._stream_url_cache.move_to_end(url)
+        while len(self._stream_url_cache) > MusicConstants.STREAM_URL_CACHE_SIZE:
+            self._stream_url_cache.popitem(last=False)
+
+    def _parse_stream_expiry(self, audio_url: str) -> float:
+        """googlevideo URLのexpireパラメータから有効期限を取得"""
+        try:
+            parsed = urlparse(audio_url)
+            expire = parse_qs(parsed.query).get('expire')
+            if expire:
+                return float(expire[0])
+
+            # マニフェスト形式: /expire/<timestamp>/
+            segments = parsed.path.split('/')
+            if 'expire' in segments:
+                return float(segments[segments.index('expire') + 1])
+        except (ValueError, IndexError):
+            pass
+
+        return time.time() + MusicConstants.STREAM_URL_DEFAULT_TTL_SECONDS
+
     def _get_audio_source_sync(self, url: str) -> Optional[str]:
         """音声ソース取得の同期処理"""
-        ytdl = yt_dlp.YoutubeDL(params=self.ytdl_opts)  # type: ignore
+        ytdl = _yt_dlp().YoutubeDL(params=self.ytdl_opts)  # type: ignore
 
         try:
             info = ytdl.extract_info(url, download=False)
@@ -316,6 +393,37 @@ class YouTubeExtractor:
 
         return None
 
+    async def download_audio(self, url: str, output_dir: Path) -> Optional[Path]:
+        """音声ファイルをダウンロード (ローカルキャッシュ用)"""
+        try:
+            return await self._run_ytdl("download", self._download_audio_sync, url, output_dir)
+        except Exception as e:
+            self.logger.error(f"Audio download error: {e}")
+            return None
+
+    def _download_audio_sync(self, url: str, output_dir: Path) -> Optional[Path]:
+        """音声ダウンロードの同期処理 (Opus/webm優先)"""
+        opts = self.ytdl_opts.copy()
+        opts.update({
+            'format': 'bestaudio[ext=webm]/bestaudio',
+            'outtmpl': str(output_dir / 'download-%(id)s.%(ext)s'),
+            'restrictfilenames': True
+        })
+        ytdl = _yt_dlp().YoutubeDL(params=opts)  # type: ignore
+
+        try:
+            info = ytdl.extract_info(url, download=True)
+            if not info:
+                return None
+
+            downloads = info.get('requested_downloads') or []
+            filepath = downloads[0].get('filepath') if downloads else ytdl.prepare_filename(info)
+            path = Path(filepath)
+            return path if path.exists() else None
+        except Exception as e:
+            self.logger.error(f"Audio download extraction error: {e}")
+            return None
+
     def is_url(self, query: str) -> bool:
         """URLかどうかを判定"""
         return query.startswith(('http://', 'https://'))
@@ -331,10 +439,9 @@ class YouTubeExtractor:
         try:
             playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
 
-            loop = asyncio.get_event_loop()
-            data = await loop.run_in_executor(
-                None,
-                lambda: yt_dlp.YoutubeDL(self.ytdl_opts).extract_info(
+            data = await self._run_ytdl(
+                "playlist",
+                lambda: _yt_dlp().YoutubeDL(self.ytdl_opts).extract_info(
                     playlist_url, download=False
                 )
             )
@@ -396,7 +503,7 @@ class YouTubeExtractor:
     async def check_video_availability(self, url: str) -> Dict[str, Any]:
         """動画の利用可能性をチェック"""
         try:
-            result = await asyncio.to_thread(self._check_availability_sync, url)
+            result = await self._run_ytdl("availability", self._check_availability_sync, url)
             return result
         except Exception as e:
             self.logger.error(f"Availability check error: {e}")
@@ -408,7 +515,7 @@ class YouTubeExtractor:
 
     def _check_availability_sync(self, url: str) -> Dict[str, Any]:
         """動画利用可能性の同期チェック"""
-        ytdl = yt_dlp.YoutubeDL(params=self.ytdl_opts)  # type: ignore
+        ytdl = _yt_dlp().YoutubeDL(params=self.ytdl_opts)  # type: ignore
 
         try:
             # メタデータのみ取得（軽量）
@@ -458,7 +565,7 @@ class YouTubeExtractor:
 
             return availability_info
 
-        except yt_dlp.DownloadError as e:
+        except _yt_dlp().DownloadError as e:
             error_str = str(e).lower()
             restriction_type = self._detect_restriction_type(error_str)
 
@@ -504,7 +611,7 @@ class YouTubeExtractor:
     async def extract_spotify_track(self, spotify_url: str) -> Optional[TrackInfo]:
         """Spotify URLからYouTube音源を取得"""
         try:
-            track_info = await asyncio.to_thread(self._extract_spotify_sync, spotify_url)
+            track_info = await self._run_ytdl("spotify", self._extract_spotify_sync, spotify_url)
             return track_info
         except Exception as e:
             self.logger.error(f"Spotify extraction error: {e}")
@@ -512,7 +619,7 @@ class YouTubeExtractor:
 
     def _extract_spotify_sync(self, spotify_url: str) -> Optional[TrackInfo]:
         """Spotify抽出の同期処理"""
-        ytdl = yt_dlp.YoutubeDL(params=self.ytdl_opts)  # type: ignore
+        ytdl = _yt_dlp().YoutubeDL(params=self.ytdl_opts)  # type: ignore
 
         try:
             self.logger.info(f"Extracting Spotify track: {spotify_url}")
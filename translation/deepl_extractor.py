@@ -3,6 +3,7 @@ from typing import Optional, Dict, Any, List
 import logging
 from datetime import datetime, timedelta
 import asyncio
+import time
 from dataclasses import dataclass
 
 from .constants import LanguageCodes, TranslationConstants
@@ -30,10 +31,13 @@ class TranslationResult:
 class DeepLExtractor:
     """DeepL APIとの統合を管理するクラス"""
 
-    def __init__(self, api_key: Optional[str], is_pro: bool = False):
+    def __init__(self, api_key: Optional[str], is_pro: bool = False, metrics=None):
         self.api_key = api_key
         self.is_pro = is_pro
         self.logger = logging.getLogger(__name__)
+        self._request_seconds = metrics.histogram(
+            "deepl_request_seconds", "DeepL API call latency", ("operation",)
+        ) if metrics is not None else None
         self._translator: Optional[deepl.Translator] = None
         self._rate_limit_reset = datetime.utcnow()
         self._request_count = 0
@@ -53,6 +57,15 @@ class DeepLExtractor:
             self.logger.error(f"Failed to initialize DeepL Translator: {e}")
             self._translator = None
 
+    async def _call_api(self, operation: str, func, *args, **kwargs):
+        """DeepL APIをスレッドで呼び出し、所要時間を記録"""
+        start = time.perf_counter()
+        try:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        finally:
+            if self._request_seconds is not None:
+                self._request_seconds.labels(operation).observe(time.perf_counter() - start)
+
     def is_available(self) -> bool:
         """DeepL APIが利用可能かチェック"""
         return self._translator is not None
@@ -64,7 +77,7 @@ class DeepLExtractor:
 
         try:
             # DeepL APIの使用量取得は同期処理なので、非同期で実行
-            usage = await asyncio.to_thread(self._translator.get_usage)
+            usage = await self._call_api("usage", self._translator.get_usage)
             return {
                 "character_count": usage.character.count,
                 "character_limit": usage.character.limit,
@@ -81,8 +94,8 @@ class DeepLExtractor:
             return None
 
         try:
-            source_langs = await asyncio.to_thread(self._translator.get_source_languages)
-            target_langs = await asyncio.to_thread(self._translator.get_target_languages)
+            source_langs = await self._call_api("languages", self._translator.get_source_languages)
+            target_langs = await self._call_api("languages", self._translator.get_target_languages)
 
             return {
                 "source": [{"code": lang.code, "name": lang.name} for lang in source_langs],
@@ -168,7 +181,7 @@ class DeepLExtractor:
                 translate_params["source_lang"] = source_lang
 
             # 翻訳実行（非同期）
-            result = await asyncio.to_thread(self._translator.translate_text, **translate_params)
+            result = await self._call_api("translate", self._translator.translate_text, **translate_params)
 
             # 結果を返す
             translation_result = TranslationResult(
@@ -204,7 +217,8 @@ class DeepLExtractor:
         try:
             # 翻訳を実行して検出された言語を取得
             # DeepLには専用の言語検出APIがないため、この方法を使用
-            result = await asyncio.to_thread(
+            result = await self._call_api(
+                "detect",
                 self._translator.translate_text,
                 text=text[:100],  # 最初の100文字のみで検出
                 target_lang="en"  # 一時的に英語に翻訳